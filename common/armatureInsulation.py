@@ -1,9 +1,10 @@
 from typing import Union, Tuple
+from common.designContext import DesignSingleton
 from common.wireTypes import *
 from abc import ABC, abstractmethod
 
 
-class CoilInsulation(ABC):
+class CoilInsulation(DesignSingleton, ABC):
     """
     Абстрактный класс, перечисляющий атрибуты изоляции катушечной обмотки. Служит базовым классом для всех типов
     изоляции катушечных обмоток.
@@ -48,7 +49,8 @@ class CoilInsulation(ABC):
 
       Возвращает суммарную толщину изоляции по высоте и по ширине, мм.
 
-    Реализует паттерн «Одиночка», поскольку у статора не может быть две системы изоляции одновременно.
+    Реализует паттерн «Одиночка», поскольку у статора не может быть две системы изоляции одновременно. Внутри контекста
+    ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
 
     __slots__ = ["turn_insulation",
@@ -59,14 +61,6 @@ class CoilInsulation(ABC):
                  "coil_filling",
                  "bottom_filling"]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self) -> None:
         self.turn_insulation: float
         self.column_insulation: float
@@ -0,0 +1,443 @@
+"""
+Модуль, содержащий векторизованное описание статоров машин переменного тока для пакетного расчёта множества вариантов.
+
+Классы:
+
+* ``BatchACMachineStator``
+
+  Класс, описывающий набор статоров машин переменного тока в виде структуры массивов.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from common.stator import ACMachineStator
+
+
+class BatchACMachineStator:
+    """
+    Класс, описывающий набор из `N`:math: статоров машин переменного тока. В отличие от ``ACMachineStator``, каждый
+    атрибут здесь --- одномерный массив NumPy длины `N`:math: (по элементу на вариант), а все методы считают величины
+    для всех вариантов разом, без циклов на Python.
+
+    Необязательные элементы конструкции (вентиляционные каналы, шпильки, шунты, нажимная пластина, медный экран)
+    задаются массивами, в которых отсутствие элемента обозначается ``NaN`` (или ``None`` при передаче списка). Вместо
+    ветвлений по ``None``, как в ``ACMachineStator``, используются маски наличия ``has_*``, а сами размеры отсутствующих
+    элементов заменяются нулями, так что формулы остаются одинаковыми для всех вариантов.
+
+    Атрибуты:
+
+    * ``size: int``
+
+      Число вариантов `N`:math:.
+
+    * ``outer_diameter``, ``inner_diameter``, ``length``, ``slot_count``, ``slot_height``, ``slot_width``,
+      ``slit_height``, ``wedge_height``, ``effective_wires: np.ndarray``
+
+      То же, что и одноимённые атрибуты ``ACMachineStator``.
+
+    * ``vent_channel_count``, ``vent_channel_width``, ``stud_count``, ``stud_diameter``, ``bypass_thickness``,
+      ``pressure_plate_thickness``, ``copper_screen_thickness: np.ndarray``
+
+      Размеры необязательных элементов. Для вариантов, где элемент отсутствует, равны нулю.
+
+    * ``has_vent_channels``, ``has_studs``, ``has_bypass``, ``has_pressure_plate``, ``has_copper_screen: np.ndarray``
+
+      Логические маски наличия соответствующих элементов.
+
+    * ``effective_length``, ``slots_per_pole_phase``, ``pole_pitch``, ``tooth_pitch``,
+      ``current_load: Optional[np.ndarray]``
+
+      Расчётные величины. В момент инициализации равны ``None``.
+
+    Методы:
+
+    * ``from_stators(stators: Sequence[ACMachineStator]) -> BatchACMachineStator``
+
+      Собирает пакет из набора обычных статоров.
+
+    * ``compute_geometry(pole_pairs: int, phase_count: int, fill_factor: float) -> None``
+
+      Вычисляет разом число пазов на полюс и фазу, полюсное и зубцовое деления и эффективную длину.
+
+    * ``compute_slots_per_pole_phase``, ``compute_pole_pitch``, ``compute_tooth_pitch``,
+      ``compute_effective_length``, ``compute_current_load``
+
+      Аналоги одноимённых методов ``ACMachineStator``.
+
+    * ``get_stamp_slot_dimensions``, ``get_heat_load``, ``get_armature_coefficient``, ``get_diameter_third``,
+      ``get_diameter_bottom``, ``get_tooth_pitch_third``, ``get_tooth_pitch_bottom``, ``get_yoke_height``,
+      ``get_yoke_section``, ``get_teeth_section_third``, ``get_yoke_magnetic_line``, ``get_tooth_magnetic_line``,
+      ``get_flow_branching_factor``
+
+      Аналоги одноимённых методов ``ACMachineStator``, возвращающие массивы.
+
+    * ``get_valid_mask() -> np.ndarray``
+
+      Возвращает маску вариантов с физически допустимой геометрией.
+
+    В отличие от ``ACMachineStator``, не возбуждает ``ValueError`` при отрицательной высоте спинки или ширине зубца:
+    такие варианты отмечаются в маске, возвращаемой ``get_valid_mask``, чтобы один неудачный вариант не прерывал расчёт
+    всего пакета.
+    """
+
+    __slots__ = ["size",
+                 "outer_diameter",
+                 "inner_diameter",
+                 "length",
+                 "slot_count",
+                 "slot_height",
+                 "slot_width",
+                 "slit_height",
+                 "wedge_height",
+                 "effective_wires",
+                 "vent_channel_count",
+                 "vent_channel_width",
+                 "stud_count",
+                 "stud_diameter",
+                 "bypass_thickness",
+                 "pressure_plate_thickness",
+                 "copper_screen_thickness",
+                 "has_vent_channels",
+                 "has_studs",
+                 "has_bypass",
+                 "has_pressure_plate",
+                 "has_copper_screen",
+                 "effective_length",
+                 "slots_per_pole_phase",
+                 "pole_pitch",
+                 "tooth_pitch",
+                 "current_load"
+                 ]
+
+    def __init__(self,
+                 outer_diameter: Union[float, np.ndarray],
+                 inner_diameter: Union[float, np.ndarray],
+                 length: Union[float, np.ndarray],
+                 slot_count: Union[int, np.ndarray],
+                 slot_height: Union[float, np.ndarray],
+                 slot_width: Union[float, np.ndarray],
+                 slit_height: Union[float, np.ndarray],
+                 wedge_height: Union[float, np.ndarray],
+                 effective_wires: Union[int, np.ndarray],
+                 vent_channel_count: Optional[Union[int, np.ndarray]] = None,
+                 vent_channel_width: Optional[Union[float, np.ndarray]] = None,
+                 stud_count: Optional[Union[int, np.ndarray]] = None,
+                 stud_diameter: Optional[Union[float, np.ndarray]] = None,
+                 bypass_thickness: Optional[Union[float, np.ndarray]] = None,
+                 pressure_plate_thickness: Optional[Union[float, np.ndarray]] = None,
+                 copper_screen_thickness: Optional[Union[float, np.ndarray]] = None
+                 ) -> None:
+        # Все параметры приводим к одной длине: скаляр, поданный вместо массива, означает одинаковое значение для всех
+        # вариантов. Отсутствующие необязательные элементы превращаются в NaN
+        def optional(value: Optional[Union[float, np.ndarray]]) -> Union[float, np.ndarray]:
+            return np.nan if value is None else np.asarray(value, dtype=float)
+
+        arrays = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in
+                                       (outer_diameter, inner_diameter, length, slot_count, slot_height, slot_width,
+                                        slit_height, wedge_height, effective_wires)),
+                                     *(optional(x) for x in
+                                       (vent_channel_count, vent_channel_width, stud_count, stud_diameter,
+                                        bypass_thickness, pressure_plate_thickness, copper_screen_thickness)))
+        arrays = [np.array(x, dtype=float, ndmin=1) for x in arrays]
+
+        self.size: int = arrays[0].size
+
+        (self.outer_diameter, self.inner_diameter, self.length, self.slot_count, self.slot_height, self.slot_width,
+         self.slit_height, self.wedge_height, self.effective_wires) = arrays[:9]
+
+        vent_count, vent_width, stud_count, stud_diameter, bypass, plate, screen = arrays[9:]
+
+        # Маски наличия элементов. Вентиляционные каналы и шпильки считаем присутствующими, только если заданы оба их
+        # параметра, как того и требуют формулы ACMachineStator
+        self.has_vent_channels = ~np.isnan(vent_count) & ~np.isnan(vent_width)
+        self.has_studs = ~np.isnan(stud_diameter)
+        self.has_bypass = ~np.isnan(bypass)
+        self.has_pressure_plate = ~np.isnan(plate)
+        self.has_copper_screen = ~np.isnan(screen)
+
+        # А сами размеры отсутствующих элементов зануляем - тогда ветвления в формулах не нужны
+        self.vent_channel_count = np.where(self.has_vent_channels, vent_count, 0)
+        self.vent_channel_width = np.where(self.has_vent_channels, vent_width, 0)
+        self.stud_count = np.nan_to_num(stud_count)
+        self.stud_diameter = np.where(self.has_studs, stud_diameter, 0)
+        self.bypass_thickness = np.where(self.has_bypass, bypass, 0)
+        self.pressure_plate_thickness = np.where(self.has_pressure_plate, plate, 0)
+        self.copper_screen_thickness = np.where(self.has_copper_screen, screen, 0)
+
+        self.effective_length: Optional[np.ndarray] = None  # Эффективная длина сердечника
+        self.slots_per_pole_phase: Optional[np.ndarray] = None  # Число пазов на полюс и фазу
+        self.pole_pitch: Optional[np.ndarray] = None  # Полюсное деление
+        self.tooth_pitch: Optional[np.ndarray] = None  # Зубцовое деление
+        self.current_load: Optional[np.ndarray] = None  # Линейная токовая нагрузка
+
+    @classmethod
+    def from_stators(cls,
+                     stators: Sequence[ACMachineStator]
+                     ) -> "BatchACMachineStator":
+        """
+        Метод, собирающий пакет из набора обычных статоров. Расчётные величины (эффективная длина, деления и т. д.)
+        переносятся, если они посчитаны у всех статоров набора.
+
+        :param stators: Набор статоров.
+        :return: Пакет статоров.
+        """
+
+        def column(name: str) -> list:
+            return [getattr(stator, name) for stator in stators]
+
+        batch = cls(*(column(name) for name in ("outer_diameter", "inner_diameter", "length", "slot_count",
+                                                "slot_height", "slot_width", "slit_height", "wedge_height",
+                                                "effective_wires", "vent_channel_count", "vent_channel_width",
+                                                "stud_count", "stud_diameter", "bypass_thickness",
+                                                "pressure_plate_thickness", "copper_screen_thickness")))
+
+        for name in ("effective_length", "slots_per_pole_phase", "pole_pitch", "tooth_pitch", "current_load"):
+            values = column(name)
+            if None not in values:
+                setattr(batch, name, np.array(values, dtype=float))
+
+        return batch
+
+    def compute_geometry(self,
+                         pole_pairs: int,
+                         phase_count: int,
+                         fill_factor: float
+                         ) -> None:
+        """
+        Метод, рассчитывающий за один проход число пазов на полюс и фазу, полюсное и зубцовое деления и эффективную
+        длину сердечника.
+
+        :param pole_pairs: Количество пар полюсов машины.
+        :param phase_count: Число фаз.
+        :param fill_factor: Коэффициент заполнения статора сталью.
+        """
+
+        self.compute_slots_per_pole_phase(pole_pairs, phase_count)
+        self.compute_pole_pitch(pole_pairs)
+        self.compute_tooth_pitch()
+        self.compute_effective_length(fill_factor)
+
+    def compute_slots_per_pole_phase(self,
+                                     pole_pairs: Union[int, np.ndarray],
+                                     phase_count: int
+                                     ) -> None:
+        """
+        Метод, рассчитывающий число пазов статора на полюс и фазу.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param phase_count: Число фаз.
+        """
+
+        self.slots_per_pole_phase = self.slot_count / 2 / pole_pairs / phase_count
+
+    def compute_pole_pitch(self,
+                           pole_pairs: Union[int, np.ndarray]
+                           ) -> None:
+        """
+        Метод, рассчитывающий полюсное деление.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        """
+
+        self.pole_pitch = np.pi * self.inner_diameter / 2 / pole_pairs
+
+    def compute_tooth_pitch(self) -> None:
+        """
+        Метод, рассчитывающий зубцовое деление статора.
+        """
+
+        self.tooth_pitch = np.pi * self.inner_diameter / self.slot_count
+
+    def compute_effective_length(self,
+                                 fill_factor: Union[float, np.ndarray]
+                                 ) -> None:
+        """
+        Метод, рассчитывающий эффективную длину статора с учётом вентиляционных каналов и шунтов.
+
+        :param fill_factor: Коэффициент заполнения статора сталью (число или массив).
+        """
+
+        # Размеры отсутствующих шунтов и каналов равны нулю, так что маски здесь не нужны
+        length = self.length - 2 * self.bypass_thickness - self.vent_channel_width * self.vent_channel_count
+        self.effective_length = length * fill_factor
+
+    def compute_current_load(self,
+                             current: Union[float, np.ndarray],
+                             parallel_branches: Union[int, np.ndarray]
+                             ) -> None:
+        """
+        Метод, рассчитывающий линейную токовую нагрузку статора.
+
+        :param current: Ток в обмотке, А (число или массив).
+        :param parallel_branches: Число параллельных ветвей обмотки (число или массив).
+        """
+
+        self.current_load = 10 * current * self.effective_wires / parallel_branches / self.tooth_pitch
+
+    def get_stamp_slot_dimensions(self,
+                                  assembly_allowance: Union[float, np.ndarray],
+                                  stamp_allowance: Union[float, np.ndarray]
+                                  ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Метод, возвращающий размеры пазов в штампе.
+
+        :param assembly_allowance: Припуск на распушку (по ширине паза), мм.
+        :param stamp_allowance: Припуск на штамп (по высоте паза), мм.
+        :return: Глубины и ширины пазов в штампе, мм.
+        """
+
+        return self.slot_height + stamp_allowance, self.slot_width + assembly_allowance
+
+    def get_heat_load(self,
+                      current_density: Union[float, np.ndarray]
+                      ) -> np.ndarray:
+        """
+        Метод, возвращающий тепловую нагрузку статоров.
+
+        :param current_density: Плотность тока в обмотке, А/мм² (число или массив).
+        :return: Тепловая нагрузка, А²/см∙мм².
+        """
+
+        return self.current_load * current_density
+
+    def get_armature_coefficient(self,
+                                 shortening: Union[float, np.ndarray]
+                                 ) -> np.ndarray:
+        """
+        Метод, возвращающий обмоточные коэффициенты статоров.
+
+        :param shortening: Укорочение обмотки (число или массив).
+        :return: Обмоточные коэффициенты.
+        """
+
+        q = self.slots_per_pole_phase
+        return np.sin(np.pi / 6) * np.sin(shortening * np.pi / 2) / np.sin(np.pi / 6 / q) / q
+
+    def get_diameter_third(self) -> np.ndarray:
+        """
+        Метод, возвращающий диаметры статоров на уровне `1/3`:math: высоты зубца.
+
+        :return: Диаметры, мм.
+        """
+
+        return self.inner_diameter + 2 * self.slot_height / 3
+
+    def get_diameter_bottom(self) -> np.ndarray:
+        """
+        Метод, возвращающий диаметры статоров на уровне дна паза.
+
+        :return: Диаметры, мм.
+        """
+
+        return self.inner_diameter + 2 * self.slot_height
+
+    def get_tooth_pitch_third(self) -> np.ndarray:
+        """
+        Метод, возвращающий зубцовые деления статоров на уровне `1/3`:math: высоты зубца.
+
+        :return: Зубцовые деления, мм.
+        """
+
+        return np.pi * self.get_diameter_third() / self.slot_count
+
+    def get_tooth_pitch_bottom(self) -> np.ndarray:
+        """
+        Метод, возвращающий зубцовые деления статоров на уровне дна паза.
+
+        :return: Зубцовые деления, мм.
+        """
+
+        return np.pi * self.get_diameter_bottom() / self.slot_count
+
+    def get_yoke_height(self) -> np.ndarray:
+        """
+        Метод, возвращающий эффективные высоты ярма статоров с учётом шпилек. Неположительные значения не вызывают
+        исключения, а отмечаются в маске ``get_valid_mask``.
+
+        :return: Эффективные высоты ярма, мм.
+        """
+
+        return (self.outer_diameter - self.get_diameter_bottom()) / 2 - self.stud_diameter / 3
+
+    def get_yoke_section(self,
+                         effective_length: Union[float, np.ndarray]
+                         ) -> np.ndarray:
+        """
+        Метод, возвращающий эффективные сечения ярма статоров.
+
+        :param effective_length: Эффективная длина статора, мм (число или массив).
+        :return: Эффективные сечения ярма, м².
+        """
+
+        return self.get_yoke_height() * effective_length * 1e-6
+
+    def get_teeth_section_third(self,
+                                effective_length: Union[float, np.ndarray]
+                                ) -> np.ndarray:
+        """
+        Метод, возвращающий суммарные сечения зубцов статоров на уровне `1/3`:math: их высоты.
+
+        :param effective_length: Эффективная длина статора, мм (число или массив).
+        :return: Суммарные сечения зубцов, м².
+        """
+
+        return 1.91 * effective_length * (self.get_tooth_pitch_third() - self.slot_width) * \
+            self.slots_per_pole_phase * 1e-6
+
+    def get_yoke_magnetic_line(self,
+                               pole_pairs: Union[int, np.ndarray],
+                               rotor_surface_relation: Union[float, np.ndarray]
+                               ) -> np.ndarray:
+        """
+        Метод, возвращающий расчётные длины магнитной линии в ярме статоров.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param rotor_surface_relation: Отношение обмотанной поверхности ротора к полной (число или массив).
+        :return: Длины магнитной линии, см.
+        """
+
+        return np.pi * rotor_surface_relation * (self.outer_diameter - self.get_yoke_height()) / \
+            4 / pole_pairs * 0.1
+
+    def get_tooth_magnetic_line(self) -> np.ndarray:
+        """
+        Метод, возвращающий расчётные длины магнитной линии в зубце статоров.
+
+        :return: Длины магнитной линии, см.
+        """
+
+        return self.slot_height * 0.1
+
+    def get_flow_branching_factor(self,
+                                  effective_length: Union[float, np.ndarray]
+                                  ) -> np.ndarray:
+        """
+        Метод, возвращающий коэффициенты ответвления потока в пазы статоров.
+
+        :param effective_length: Эффективная длина статора, мм (число или массив).
+        :return: Коэффициенты ответвления.
+        """
+
+        t13 = self.get_tooth_pitch_third()
+
+        return t13 * self.length / (t13 - self.slot_width) / effective_length - 1
+
+    def get_valid_mask(self) -> np.ndarray:
+        """
+        Метод, возвращающий маску вариантов с физически допустимой геометрией: положительной высотой спинки и, если
+        зубцовое деление уже посчитано, положительной шириной зубца. Это те же условия, при нарушении которых
+        ``ACMachineStator`` возбуждает ``ValueError``.
+
+        :return: Логический массив, ``True`` для допустимых вариантов.
+        """
+
+        valid = self.get_yoke_height() > 0
+        if self.tooth_pitch is not None:
+            valid &= self.tooth_pitch - self.slot_width > 0
+
+        return valid
+
+
+__all__ = ["BatchACMachineStator"]
@@ -14,8 +14,41 @@
 * ``STEEL_DENSITY: float``
 
   Плотность электротехнической стали, кг/м³
+
+* ``COPPER_TEMPERATURE_CONSTANT: float``
+
+  Температурная постоянная меди, °C: сопротивление меди пропорционально сумме этой постоянной и температуры
+
+Функции:
+
+* ``copper_temperature_factor``
+
+  Функция, возвращающая отношение сопротивлений медного проводника при двух температурах
 """
 
+from typing import Union
+
+import numpy as np
+
 COPPER_CONDUCTIVITY: float = 57000
 COPPER_DENSITY: float = 8920
 STEEL_DENSITY: float = 7600
+COPPER_TEMPERATURE_CONSTANT: float = 235
+
+
+def copper_temperature_factor(temperature: Union[float, np.ndarray],
+                              base_temperature: float = 15
+                              ) -> Union[float, np.ndarray]:
+    """
+    Функция, возвращающая отношение сопротивления медного проводника при заданной температуре к его сопротивлению при
+    базовой температуре.
+
+    :param temperature: Температура, °C (число или массив).
+    :param base_temperature: Базовая температура, °C.
+    :return: Отношение сопротивлений (число или массив той же формы, что и ``temperature``).
+    """
+
+    factor = (COPPER_TEMPERATURE_CONSTANT + np.asarray(temperature, dtype=float)) / \
+        (COPPER_TEMPERATURE_CONSTANT + base_temperature)
+
+    return float(factor) if np.ndim(factor) == 0 else factor
@@ -0,0 +1,96 @@
+"""
+Модуль, содержащий описание контекста расчёта отдельного варианта машины.
+
+Классы:
+
+* ``DesignContext``
+
+  Контекстный менеджер, отключающий паттерн «Одиночка» у классов, описывающих конкретный вариант машины.
+
+* ``DesignSingleton``
+
+  Класс-примесь, реализующий паттерн «Одиночка» с учётом ``DesignContext``.
+"""
+
+import threading
+
+
+class DesignContext:
+    """
+    Контекстный менеджер, внутри которого классы, описывающие конкретный вариант машины (статор, ротор, их обмотки и
+    изоляция, магнитные цепи, потери, реактивные сопротивления и т. д.), перестают быть «одиночками»: каждый вызов
+    конструктора создаёт новый независимый объект. Это позволяет держать в памяти одного интерпретатора сколько угодно
+    вариантов машины одновременно и считать их независимо друг от друга.
+
+    Таблицы справочных данных (стали, проводники, шины) остаются «одиночками» и внутри контекста, поскольку они только
+    читаются и загружаются один раз на процесс.
+
+    Контекст действует в пределах потока, в котором он открыт, и допускает вложенность. Пример использования::
+
+        with DesignContext():
+            first = ACMachineStator(...)
+            second = ACMachineStator(...)  # Не перезаписывает first
+
+    Методы:
+
+    * ``is_active() -> bool``
+
+      Возвращает ``True``, если в текущем потоке открыт хотя бы один контекст.
+    """
+
+    __slots__ = []
+
+    # Глубина вложенности контекстов, своя для каждого потока
+    __state = threading.local()
+
+    def __enter__(self) -> "DesignContext":
+        DesignContext.__state.depth = DesignContext.__get_depth() + 1
+        return self
+
+    def __exit__(self, *args) -> None:
+        DesignContext.__state.depth = DesignContext.__get_depth() - 1
+
+    @staticmethod
+    def __get_depth() -> int:
+        return getattr(DesignContext.__state, "depth", 0)
+
+    @staticmethod
+    def is_active() -> bool:
+        """
+        Метод, проверяющий, открыт ли контекст расчёта варианта машины в текущем потоке.
+
+        :return: ``True``, если контекст открыт, иначе ``False``.
+        """
+
+        return DesignContext.__get_depth() > 0
+
+
+class DesignSingleton:
+    """
+    Класс-примесь, реализующий паттерн «Одиночка» для классов, описывающих конкретный вариант машины. Вне
+    ``DesignContext`` конструктор каждого класса-наследника возвращает один и тот же объект (свой для каждого класса, в
+    том числе для наследников друг друга), внутри контекста каждый вызов конструктора создаёт новый объект.
+
+    Примесь указывается первой в списке базовых классов::
+
+        class ACMachineStator(DesignSingleton, GeometryCache):
+            ...
+    """
+
+    __slots__ = []
+
+    # Единственные объекты классов-наследников, созданные вне контекста
+    __instances = {}
+
+    def __new__(cls, *args, **kwargs):
+        # Внутри контекста расчёта варианта машины каждый вызов конструктора создаёт новый объект
+        if DesignContext.is_active():
+            return super().__new__(cls)
+
+        if cls not in DesignSingleton.__instances:
+            DesignSingleton.__instances[cls] = super().__new__(cls)
+
+        return DesignSingleton.__instances[cls]
+
+
+__all__ = ["DesignContext", "DesignSingleton"]
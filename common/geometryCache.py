@@ -0,0 +1,112 @@
+"""
+Модуль, содержащий кэш производных геометрических величин для классов, описывающих части машины.
+
+Классы:
+
+* ``GeometryCache``
+
+  Класс-примесь, хранящий кэш геометрических величин и сбрасывающий его при изменении размеров.
+
+Функции:
+
+* ``cached_geometry``
+
+  Декоратор, кэширующий результат метода, зависящего только от размеров объекта.
+"""
+
+from functools import wraps
+from inspect import signature
+from typing import Any, Callable, Dict, FrozenSet, Tuple
+
+
+class GeometryCache:
+    """
+    Класс-примесь для классов с ``__slots__``, методы которых, помеченные декоратором ``cached_geometry``, являются
+    чистыми функциями размеров объекта (диаметры, зубцовые деления, высота ярма и т. п.). Результаты таких методов
+    сохраняются в словаре ``_geometry_cache`` и при повторных вызовах берутся из него.
+
+    Кэш сбрасывается целиком при любом присваивании атрибуту, перечисленному в ``_geometry_attributes`` наследника,
+    так что изменение размера объекта никогда не приводит к использованию устаревших значений. Присваивание прочим
+    атрибутам (расчётным величинам, обмотке и т. п.) кэш не трогает.
+
+    Атрибуты:
+
+    * ``_geometry_attributes: FrozenSet[str]``
+
+      Атрибут класса: имена размеров, от которых зависят кэшируемые методы. Задаётся наследником.
+
+    * ``_geometry_cache: Dict[Tuple[Callable, tuple, tuple], Any]``
+
+      Кэш результатов. Создаётся при первом обращении к кэшируемому методу.
+
+    Методы:
+
+    * ``clear_geometry_cache() -> None``
+
+      Сбрасывает кэш вручную.
+    """
+
+    __slots__ = ["_geometry_cache"]
+
+    _geometry_attributes: FrozenSet[str] = frozenset()
+
+    def __setattr__(self,
+                    name: str,
+                    value: Any
+                    ) -> None:
+        object.__setattr__(self, name, value)
+
+        if name in self._geometry_attributes:
+            self.clear_geometry_cache()
+
+    def clear_geometry_cache(self) -> None:
+        """
+        Метод, сбрасывающий кэш геометрических величин.
+        """
+
+        try:
+            self._geometry_cache.clear()
+        except AttributeError:
+            pass
+
+
+def cached_geometry(method: Callable) -> Callable:
+    """
+    Декоратор, кэширующий результат метода класса-наследника ``GeometryCache``. Ключом служат сам метод и его
+    аргументы, так что метод может принимать, например, уровень, на котором считается величина. Аргументы приводятся к
+    позиционному виду с подстановкой значений по умолчанию, поэтому вызовы ``f(1)``, ``f(x=1)`` и (при ``x=1`` по
+    умолчанию) ``f()`` разделяют одну запись кэша. Исключения не кэшируются.
+
+    :param method: Метод, зависящий только от размеров объекта и своих аргументов.
+    :return: Кэширующая обёртка метода.
+    """
+
+    method_signature = signature(method)
+    parameter_count = len(method_signature.parameters) - 1
+
+    @wraps(method)
+    def wrapper(self: GeometryCache, *args, **kwargs) -> Any:
+        # Если все аргументы переданы позиционно, они уже в нормальном виде и разбор сигнатуры не нужен
+        if kwargs or len(args) != parameter_count:
+            bound = method_signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            args = bound.args[1:]
+            kwargs = bound.kwargs
+
+        try:
+            cache = self._geometry_cache
+        except AttributeError:
+            cache: Dict[Tuple[Callable, tuple, tuple], Any] = {}
+            object.__setattr__(self, "_geometry_cache", cache)
+
+        key = (method, args, tuple(sorted(kwargs.items())))
+        try:
+            return cache[key]
+        except KeyError:
+            value = cache[key] = method(self, *args, **kwargs)
+            return value
+
+    return wrapper
+
+
+__all__ = ["GeometryCache", "cached_geometry"]
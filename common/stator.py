@@ -11,10 +11,12 @@
 import math
 from typing import Optional, Tuple, Union
 
+from common.designContext import DesignSingleton
+from common.geometryCache import GeometryCache, cached_geometry
 from common.statorArmature import *
 
 
-class ACMachineStator:
+class ACMachineStator(DesignSingleton, GeometryCache):
     """
     Класс, описывающий статор машины переменного тока. Универсальный класс, подходящий для всех типов машин.
 
@@ -178,7 +180,10 @@ class ACMachineStator:
 
       Возвращает коэффициент ответвления магнитного потока в пазы статора.
 
-    Реализует паттерн «Одиночка».
+    Диаметры, зубцовые деления и высота ярма на разных уровнях кэшируются (см. ``GeometryCache``); кэш сбрасывается
+    при присваивании любому из размеров, от которых они зависят.
+
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
 
     __slots__ = ["outer_diameter",
@@ -205,13 +210,9 @@ class ACMachineStator:
                  "current_load"
                  ]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
+    # Размеры, от которых зависят кэшируемые методы
+    _geometry_attributes = frozenset(["outer_diameter", "inner_diameter", "slot_count", "slot_height",
+                                      "stud_diameter"])
 
     def __init__(self,
                  outer_diameter: float,
@@ -366,6 +367,7 @@ class ACMachineStator:
 
         return coeff
 
+    @cached_geometry
     def get_diameter_third(self) -> float:
         """
         Метод, возвращающий диаметр статора на уровне `1/3`:math: высоты зубца.
@@ -375,6 +377,7 @@ class ACMachineStator:
 
         return self.inner_diameter + 2 * self.slot_height / 3
 
+    @cached_geometry
     def get_diameter_bottom(self) -> float:
         """
         Метод, возвращающий диаметр статора на уровне дна паза.
@@ -384,6 +387,7 @@ class ACMachineStator:
 
         return self.inner_diameter + 2 * self.slot_height
 
+    @cached_geometry
     def get_tooth_pitch_third(self) -> float:
         """
         Метод, возвращающий зубцовое деление статора на уровне `1/3`:math: высоты зубца.
@@ -393,6 +397,7 @@ class ACMachineStator:
 
         return math.pi * self.get_diameter_third() / self.slot_count
 
+    @cached_geometry
     def get_tooth_pitch_bottom(self) -> float:
         """
         Метод, возвращающий зубцовое деление статора на уровне дна паза.
@@ -402,6 +407,7 @@ class ACMachineStator:
 
         return math.pi * self.get_diameter_bottom() / self.slot_count
 
+    @cached_geometry
     def get_yoke_height(self) -> float:
         """
         Метод, возвращающий эффективную высоту ярма статора с учётом шпилек.
@@ -490,4 +496,4 @@ class ACMachineStator:
         return t13 * self.length / (t13 - self.slot_width) / effective_length - 1
 
 
-__all__ = "ACMachineStator"
+__all__ = ["ACMachineStator"]
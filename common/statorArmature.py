@@ -10,11 +10,15 @@
 
 from typing import Optional, Tuple, Union, Dict
 
+import numpy as np
+
 from common.armatureInsulation import *
+from common.constants import copper_temperature_factor
+from common.designContext import DesignSingleton
 from common.wireTypes import *
 
 
-class CoilArmature:
+class CoilArmature(DesignSingleton):
     """
     Класс, описывающий статорную обмотку катушечного типа машины переменного тока.
 
@@ -68,8 +72,8 @@ class CoilArmature:
 
     * ``resistance: Optional[Dict[int, float]]``
 
-      Сопротивление обмотки постоянному току, Ом. Рассчитывается для температур 15, 75, 105 и 120 градусов Цельсия. В
-      момент инициализации равно ``None``.
+      Сопротивление обмотки постоянному току, Ом. Рассчитывается для температур 15, 75, 105 и 120 градусов Цельсия
+      (для прочих температур см. ``get_resistance``). В момент инициализации равно ``None``.
 
     * ``current_density: Optional[float]``
 
@@ -82,7 +86,7 @@ class CoilArmature:
 
       Рассчитывает размеры катушки.
 
-    * ``set_wire(pressing: float, effective_wires: float ) -> None``
+    * ``set_wire(pressing: float, effective_wires: float, mode: str = "height") -> None``
 
       Автоматически подбирает размеры обмоточного проводника (а также толщину его изоляции, для определённых типов
       проводников).
@@ -103,6 +107,10 @@ class CoilArmature:
 
       Рассчитывает сопротивление обмотки при разных температурах. Сохраняет в словарь.
 
+    * ``get_resistance(temperature: Union[float, np.ndarray]) -> Union[float, np.ndarray]``
+
+      Возвращает сопротивление обмотки при произвольной температуре (или массиве температур).
+
     * ``compute_current_density(current: float) -> None``
 
       Рассчитывает плотность тока в обмотке.
@@ -111,7 +119,8 @@ class CoilArmature:
 
       Возвращает вспомогательные размеры обмотки для расчёта индуктивных сопротивлений.
 
-    Реализует паттерн «Одиночка», поскольку статор не может иметь более одной обмотки.
+    Реализует паттерн «Одиночка», поскольку статор не может иметь более одной обмотки. Внутри контекста
+    ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
 
     __slots__ = ["insulation_system",
@@ -129,14 +138,6 @@ class CoilArmature:
                  "current_density"
                  ]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self,
                  rows: int,
                  columns: int,
@@ -185,20 +186,22 @@ class CoilArmature:
 
     def set_wire(self,
                  pressing: float,
-                 effective_wires: int
+                 effective_wires: int,
+                 mode: str = "height"
                  ) -> None:
         """
         Метод, задающий размеры проводника обмотки.
 
         :param pressing: Величина опрессовки на элементарный проводник, мм.
         :param effective_wires: Количество эффективных проводников в пазу.
+        :param mode: Режим подбора проводника: ``"height"`` или ``"section"``, см. ``WireDB.pick_wire``.
         """
 
         max_wire_height = 2 * (self.coil_height - self.insulation_system.body_insulation[0] -
                                self.insulation_system.semicond_coating) / self.rows / effective_wires - \
             self.insulation_system.turn_insulation / self.rows + pressing
         max_wire_width = (self.coil_width - self.insulation_system.all_insulation()[1]) / self.columns + pressing
-        self.wire.pick_wire(max_wire_height, max_wire_width)
+        self.wire.pick_wire(max_wire_height, max_wire_width, mode)
 
     def compute_shortening(self,
                            slots_per_pole_phase: int,
@@ -262,7 +265,21 @@ class CoilArmature:
             (self.rows * self.columns * self.wire.wire_section)
 
         # Словарь из значений сопротивления при 15, 75, 105 и 120 градусах
-        self.resistance = dict(zip([15, 75, 105, 120], map(lambda x: x * base_value, [1, 1.24, 1.36, 1.42])))
+        self.resistance = {temperature: base_value * copper_temperature_factor(temperature)
+                           for temperature in (15, 75, 105, 120)}
+
+    def get_resistance(self,
+                       temperature: Union[float, np.ndarray]
+                       ) -> Union[float, np.ndarray]:
+        """
+        Метод, возвращающий сопротивление обмотки постоянному току при произвольной температуре. Сопротивление
+        пересчитывается со значения при 15 °C по температурной постоянной меди.
+
+        :param temperature: Температура обмотки, °C (число или массив).
+        :return: Сопротивление обмотки, Ом (число или массив той же формы, что и ``temperature``).
+        """
+
+        return self.resistance[15] * copper_temperature_factor(temperature)
 
     def compute_current_density(self,
                                 current: float
@@ -301,4 +318,4 @@ class CoilArmature:
         return copper_height, distance_to_air, insulation_thickness
 
 
-__all__ = "CoilArmature"
+__all__ = ["CoilArmature"]
@@ -0,0 +1,226 @@
+"""
+Модуль, содержащий реестр электротехнических сталей с ленивой загрузкой и дисковым кэшем.
+
+Классы:
+
+* ``SteelRegistry``
+
+  Реестр сталей из ``steelDatabase``, доступных по имени.
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+
+from common import steelDatabase
+from common.steelDatabase import Steel
+
+
+class SteelRegistry:
+    """
+    Реестр сталей, выдающий объекты ``Steel`` по имени класса (например, ``"M27050AMean"``). Сталь загружается только
+    при первом обращении к ней, поэтому скрипты, использующие одну-две марки, не платят за разбор таблиц и построение
+    сплайнов всех остальных.
+
+    Разобранные таблицы и построенный сплайн кривой намагничивания (узлы и коэффициенты) сохраняются в дисковом кэше в
+    виде файлов ``.npy``, которые при повторных запусках (в том числе в рабочих процессах) открываются отображением в
+    память, минуя разбор таблиц и построение сплайна. Кэш привязан к содержимому модуля ``steelDatabase``: при его
+    изменении используется новый подкаталог, так что устаревшие данные не подхватываются.
+
+    Каталог кэша берётся из переменной окружения ``EMCALCULATIONS_STEEL_CACHE``, а при её отсутствии ---
+    ``~/.cache/emcalculations/steels``. Если каталог недоступен для записи, реестр просто работает без кэша.
+
+    Объект, выдаваемый реестром, --- тот же «одиночка», что и при прямом вызове конструктора стали.
+
+    Атрибуты:
+
+    * ``cache_dir: Optional[str]``
+
+      Каталог кэша для текущей версии ``steelDatabase``, либо ``None``, если кэш отключён.
+
+    Методы:
+
+    * ``names() -> List[str]``
+
+      Возвращает имена всех доступных сталей.
+
+    * ``get(name: str) -> Steel``
+
+      Возвращает сталь по имени, загружая её при первом обращении.
+
+    * ``clear_cache() -> None``
+
+      Удаляет файлы кэша текущей версии ``steelDatabase``.
+
+    Реализует паттерн «Одиночка».
+    """
+
+    __slots__ = ["cache_dir",
+                 "__classes",
+                 "__steels"]
+
+    __instance = None
+
+    # Имена массивов, сохраняемых в кэше. Массивов потерь у роторной стали нет
+    __required = ("B", "H", "BH_knots", "BH_coefficients")
+    __optional = ("B_loss", "W_loss")
+
+    def __new__(cls, *args, **kwargs):
+        if cls.__instance is None:
+            cls.__instance = super().__new__(cls)
+
+        return cls.__instance
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None
+                 ) -> None:
+        # Реестр общий на процесс, поэтому повторный вызов конструктора его не сбрасывает
+        if hasattr(self, "cache_dir"):
+            return
+
+        self.__classes: Dict[str, Type[Steel]] = {name: getattr(steelDatabase, name)
+                                                  for name in steelDatabase.__all__
+                                                  if isinstance(getattr(steelDatabase, name), type)
+                                                  and issubclass(getattr(steelDatabase, name), Steel)
+                                                  and getattr(steelDatabase, name) is not Steel}
+        self.__steels: Dict[str, Steel] = {}
+
+        if cache_dir is None:
+            cache_dir = os.environ.get("EMCALCULATIONS_STEEL_CACHE",
+                                       os.path.join(os.path.expanduser("~"), ".cache", "emcalculations", "steels"))
+
+        with open(steelDatabase.__file__, "rb") as source:
+            version = hashlib.sha1(source.read()).hexdigest()[:12]
+
+        self.cache_dir: Optional[str] = os.path.join(cache_dir, version)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError:
+            self.cache_dir = None
+
+    def names(self) -> List[str]:
+        """
+        Метод, возвращающий имена всех доступных в реестре сталей.
+
+        :return: Список имён классов сталей.
+        """
+
+        return list(self.__classes)
+
+    def __contains__(self,
+                     name: str
+                     ) -> bool:
+        return name in self.__classes
+
+    def get(self,
+            name: str
+            ) -> Steel:
+        """
+        Метод, возвращающий сталь по имени. При первом обращении сталь загружается из кэша, а при его отсутствии ---
+        создаётся обычным образом и сохраняется в кэш.
+
+        :param name: Имя класса стали, например, ``"M27050AMean"``.
+        :return: Объект стали.
+        """
+
+        if name in self.__steels:
+            return self.__steels[name]
+
+        if name not in self.__classes:
+            raise KeyError(f"Неизвестная сталь: {name}")
+
+        steel_class = self.__classes[name]
+
+        if (data := self.__load(name)) is not None:
+            steel = steel_class.__new__(steel_class)
+            # Сталь могла быть уже создана напрямую - тогда её кривые уже построены и восстанавливать их не нужно
+            if not hasattr(steel, "BH_curve"):
+                steel._restore_curves(data)
+        else:
+            steel = steel_class()
+            self.__save(name, steel)
+
+        self.__steels[name] = steel
+        return steel
+
+    def clear_cache(self) -> None:
+        """
+        Метод, удаляющий файлы кэша текущей версии ``steelDatabase``. Уже загруженные стали остаются в памяти.
+        """
+
+        if self.cache_dir is None:
+            return
+
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(".npy"):
+                os.remove(os.path.join(self.cache_dir, file_name))
+
+    def __path(self,
+               name: str,
+               array_name: str
+               ) -> str:
+        return os.path.join(self.cache_dir, f"{name}.{array_name}.npy")
+
+    def __load(self,
+               name: str
+               ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Вспомогательный метод, открывающий массивы стали из кэша отображением в память.
+
+        :param name: Имя стали.
+        :return: Словарь массивов, либо ``None``, если кэш отключён или в нём нет этой стали.
+        """
+
+        if self.cache_dir is None:
+            return None
+
+        data = {}
+        for array_name in self.__required + self.__optional:
+            path = self.__path(name, array_name)
+            if os.path.exists(path):
+                data[array_name] = np.load(path, mmap_mode="r")
+            elif array_name in self.__required:
+                return None
+
+        return data
+
+    def __save(self,
+               name: str,
+               steel: Steel
+               ) -> None:
+        """
+        Вспомогательный метод, сохраняющий массивы стали в кэш. Каждый файл сначала пишется во временный и лишь затем
+        переименовывается, чтобы параллельно запущенные процессы не прочли его недописанным.
+
+        :param name: Имя стали.
+        :param steel: Объект стали.
+        """
+
+        if self.cache_dir is None:
+            return
+
+        data = {"B": steel.B,
+                "H": steel.H,
+                "BH_knots": steel.BH_interpolant.t,
+                "BH_coefficients": steel.BH_interpolant.c}
+        if hasattr(steel, "B_loss"):
+            data.update(B_loss=steel.B_loss, W_loss=steel.W_loss)
+
+        try:
+            # Обязательные массивы пишем последними: по их наличию __load и судит, что сталь сохранена целиком
+            for array_name in self.__optional + self.__required:
+                if array_name not in data:
+                    continue
+
+                descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                with os.fdopen(descriptor, "wb") as file:
+                    np.save(file, np.asarray(data[array_name], dtype=float))
+                os.replace(temp_path, self.__path(name, array_name))
+        except OSError:
+            pass
+
+
+__all__ = ["SteelRegistry"]
@@ -0,0 +1,298 @@
+"""
+Модуль, содержащий перебор вариантов укладки катушечной статорной обмотки в заданный паз.
+
+Классы:
+
+* ``WindingLayoutSearch``
+
+  Класс, перебирающий сочетания числа рядов, столбцов, параллельных ветвей и эффективных проводников в пазу.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from common.armatureInsulation import CustomCoilInsulation, Micafil
+from common.designContext import DesignContext
+from common.stator import ACMachineStator
+from common.wireDatabase import WireDB
+
+
+class WindingLayoutSearch:
+    r"""
+    Класс, перебирающий варианты укладки катушечной обмотки в паз статора. Для каждого сочетания числа горизонтальных
+    (``rows``) и вертикальных (``columns``) рядов элементарных проводников, числа параллельных ветвей и числа
+    эффективных проводников в пазу проводник подбирается по тем же формулам, что и в
+    ``CoilArmature.compute_coil_dimensions`` и ``CoilArmature.set_wire``, но сразу для всех сочетаний массивами NumPy.
+
+    Перебор идёт с отсечением: сначала по отдельности отбрасываются числа столбцов и пары «ряды --- эффективные
+    проводники», для которых на проводник не остаётся места, затем отбрасываются сочетания, для которых не определена
+    изоляция проводника или не нашлось стандартного проводника, и только оставшиеся размножаются по числам параллельных
+    ветвей.
+
+    Система изоляции и тип проводника берутся из обмотки статора (``stator.armature``); сама обмотка и статор при
+    переборе не меняются. Если задано напряжение статора, стандартная система изоляции пересоздаётся для каждого числа
+    эффективных проводников с числом витков катушки, равным половине этого числа: у изоляции Микафил от него зависят
+    витковая изоляция и допустимый тип проводника. Для Микафил напряжение обязательно, прочие стандартные системы от
+    числа витков не зависят, а пользовательская (``CustomCoilInsulation``) используется как есть.
+
+    Атрибуты:
+
+    * ``stator: ACMachineStator``
+
+      Статор, в паз которого укладывается обмотка. Должно быть рассчитано число пазов на полюс и фазу.
+
+    * ``arrangement_allowance: float``
+
+      Припуск на укладку, мм.
+
+    * ``pressing: float``
+
+      Величина опрессовки на элементарный проводник, мм.
+
+    * ``rows``, ``columns``, ``parallel_branches``, ``effective_wires: np.ndarray``
+
+      Перебираемые значения соответствующих параметров.
+
+    Методы:
+
+    * ``search(current: float, frequency: float, pole_pairs: int, mode: str = "height",
+      max_current_density: Optional[float] = None, voltage: Optional[float] = None) -> np.ndarray``
+
+      Возвращает упорядоченную таблицу допустимых вариантов укладки.
+
+    * ``apply(layout: np.void, mode: str = "height", voltage: Optional[float] = None) -> None``
+
+      Переносит выбранный вариант на статор и его обмотку.
+
+    Поля таблицы, возвращаемой ``search``:
+
+    * ``rows``, ``columns``, ``effective_wires``, ``parallel_branches`` --- параметры варианта;
+    * ``wire_height``, ``wire_width``, ``wire_section`` --- размеры (мм) и сечение (мм²) подобранного проводника;
+    * ``copper_section`` --- сечение меди эффективного проводника, мм²;
+    * ``current_density`` --- плотность тока в обмотке, А/мм²;
+    * ``turn_count`` --- число последовательных витков в фазе;
+    * ``Field_coefficient`` --- коэффициент Фильда (вытеснения тока), как в ``Losses.compute_stator_copper_losses``.
+
+    Варианты упорядочены по возрастанию плотности тока, при равной плотности --- по убыванию сечения меди, затем по
+    возрастанию коэффициента Фильда.
+    """
+
+    __slots__ = ["stator",
+                 "arrangement_allowance",
+                 "pressing",
+                 "rows",
+                 "columns",
+                 "parallel_branches",
+                 "effective_wires"]
+
+    FIELDS = [("rows", int),
+              ("columns", int),
+              ("effective_wires", int),
+              ("parallel_branches", int),
+              ("wire_height", float),
+              ("wire_width", float),
+              ("wire_section", float),
+              ("copper_section", float),
+              ("current_density", float),
+              ("turn_count", float),
+              ("Field_coefficient", float)]
+
+    def __init__(self,
+                 stator: ACMachineStator,
+                 arrangement_allowance: float,
+                 pressing: float,
+                 rows: Sequence[int] = range(1, 5),
+                 columns: Sequence[int] = range(1, 5),
+                 parallel_branches: Sequence[int] = (1, 2),
+                 effective_wires: Sequence[int] = range(2, 41, 2)
+                 ) -> None:
+        """
+        :param stator: Статор, в паз которого укладывается обмотка.
+        :param arrangement_allowance: Припуск на укладку, мм.
+        :param pressing: Величина опрессовки на элементарный проводник, мм.
+        :param rows: Перебираемые числа горизонтальных рядов элементарных проводников.
+        :param columns: Перебираемые числа вертикальных рядов элементарных проводников.
+        :param parallel_branches: Перебираемые числа параллельных ветвей.
+        :param effective_wires: Перебираемые числа эффективных проводников в пазу (для двухслойной обмотки --- чётные).
+        """
+
+        self.stator = stator
+        self.arrangement_allowance = arrangement_allowance
+        self.pressing = pressing
+
+        self.rows = np.unique(np.asarray(rows, dtype=int))
+        self.columns = np.unique(np.asarray(columns, dtype=int))
+        self.parallel_branches = np.unique(np.asarray(parallel_branches, dtype=int))
+        self.effective_wires = np.unique(np.asarray(effective_wires, dtype=int))
+
+    def search(self,
+               current: float,
+               frequency: float,
+               pole_pairs: int,
+               mode: str = "height",
+               max_current_density: Optional[float] = None,
+               voltage: Optional[float] = None
+               ) -> np.ndarray:
+        """
+        Метод, перебирающий варианты укладки и возвращающий допустимые из них.
+
+        :param current: Ток в обмотке, А.
+        :param frequency: Частота тока, Гц.
+        :param pole_pairs: Количество пар полюсов машины.
+        :param mode: Режим подбора проводника, см. ``WireDB.pick_wire``.
+        :param max_current_density: Наибольшая допустимая плотность тока, А/мм². Варианты с большей плотностью
+            отбрасываются. Если не задана, отбрасывания нет.
+        :param voltage: Напряжение статора, В. Если задано, система изоляции пересоздаётся для каждого числа
+            эффективных проводников (см. описание класса).
+        :return: Структурированный массив с полями ``FIELDS``, упорядоченный, как описано в описании класса.
+        """
+
+        stator = self.stator
+        wire = stator.armature.wire
+        # Толщины изоляции - по элементу на каждое перебираемое число эффективных проводников
+        fillings, body_insulations, semicond_coatings, turn_insulations, width_insulations = \
+            self.__get_insulation_table(voltage)
+
+        # Размеры катушки, как в CoilArmature.compute_coil_dimensions
+        coil_heights = (stator.slot_height - stator.slit_height - stator.wedge_height - fillings) / 2
+        coil_width = stator.slot_width - self.arrangement_allowance
+
+        # Наибольшие размеры изолированного проводника, как в CoilArmature.set_wire. Ширина зависит от числа столбцов
+        # и лишь через витковую изоляцию - от эффективных проводников, высота - от числа рядов и эффективных
+        # проводников, поэтому отсекаем их по отдельности: столбцы - по самой тонкой изоляции из возможных
+        thinnest = np.min(width_insulations, initial=np.inf, where=~np.isnan(width_insulations))
+        columns = self.columns[(coil_width - thinnest) / self.columns + self.pressing > 0]
+
+        rows, wires_index = (grid.ravel() for grid in np.meshgrid(self.rows, np.arange(self.effective_wires.size),
+                                                                  indexing="ij"))
+        effective_wires = self.effective_wires[wires_index]
+        max_heights = 2 * (coil_heights[wires_index] - body_insulations[wires_index] -
+                           semicond_coatings[wires_index]) / rows / effective_wires - \
+            turn_insulations[wires_index] / rows + self.pressing
+        # Где изоляция не определена, высота - NaN, и сравнение её тоже отбрасывает
+        fits = max_heights > 0
+        rows, wires_index, max_heights = rows[fits], wires_index[fits], max_heights[fits]
+
+        # Все сочетания оставшихся пар «ряды - эффективные проводники» и чисел столбцов
+        pair_index, column_index = (grid.ravel() for grid in np.meshgrid(np.arange(rows.size), np.arange(columns.size),
+                                                                         indexing="ij"))
+        rows, wires_index, max_heights = rows[pair_index], wires_index[pair_index], max_heights[pair_index]
+        columns = columns[column_index]
+        max_widths = (coil_width - width_insulations[wires_index]) / columns + self.pressing
+        fits = max_widths > 0
+        rows, columns, max_heights, max_widths = rows[fits], columns[fits], max_heights[fits], max_widths[fits]
+        effective_wires = self.effective_wires[wires_index[fits]]
+
+        insulation_heights, insulation_widths = wire.get_insulations(max_heights, max_widths)
+        # Отсекаем сочетания, для которых изоляция не определена, а затем те, для которых не нашлось проводника
+        fits = ~np.isnan(insulation_heights)
+        rows, columns, effective_wires = rows[fits], columns[fits], effective_wires[fits]
+        max_heights = max_heights[fits] - insulation_heights[fits]
+        max_widths = max_widths[fits] - insulation_widths[fits]
+
+        wire_heights, wire_widths, wire_sections = WireDB().pick_wires(max_heights, max_widths, mode)
+        fits = ~np.isnan(wire_sections)
+        rows, columns, effective_wires = rows[fits], columns[fits], effective_wires[fits]
+        wire_heights, wire_widths, wire_sections = wire_heights[fits], wire_widths[fits], wire_sections[fits]
+
+        # И лишь уцелевшие варианты размножаем по числам параллельных ветвей
+        variant_index, branch_index = (grid.ravel() for grid in np.meshgrid(np.arange(rows.size),
+                                                                            np.arange(self.parallel_branches.size),
+                                                                            indexing="ij"))
+        table = np.empty(variant_index.size, dtype=self.FIELDS)
+        table["rows"] = rows[variant_index]
+        table["columns"] = columns[variant_index]
+        table["effective_wires"] = effective_wires[variant_index]
+        table["parallel_branches"] = self.parallel_branches[branch_index]
+        table["wire_height"] = wire_heights[variant_index]
+        table["wire_width"] = wire_widths[variant_index]
+        table["wire_section"] = wire_sections[variant_index]
+
+        table["copper_section"] = table["rows"] * table["columns"] * table["wire_section"]
+        table["current_density"] = current / table["parallel_branches"] / table["copper_section"]
+        table["turn_count"] = pole_pairs * table["effective_wires"] * stator.slots_per_pole_phase / \
+            table["parallel_branches"]
+        table["Field_coefficient"] = 1 + 0.107 * (table["rows"] * table["columns"] * table["wire_width"] *
+                                                  table["effective_wires"] / stator.slot_width * frequency / 50) ** 2 *\
+            (table["wire_height"] / 10) ** 4
+
+        if max_current_density is not None:
+            table = table[table["current_density"] <= max_current_density]
+
+        order = np.lexsort((table["Field_coefficient"], -table["copper_section"], table["current_density"]))
+        return table[order]
+
+    def apply(self,
+              layout: np.void,
+              mode: str = "height",
+              voltage: Optional[float] = None
+              ) -> None:
+        """
+        Метод, переносящий выбранный вариант укладки на статор и его обмотку: задаёт числа рядов, столбцов,
+        параллельных ветвей и эффективных проводников, после чего рассчитывает размеры катушки и подбирает проводник
+        обычным образом.
+
+        :param layout: Строка таблицы, возвращённой методом ``search``.
+        :param mode: Режим подбора проводника, тот же, что и при поиске.
+        :param voltage: Напряжение статора, В, то же, что и при поиске. Если задано, обмотке назначается система
+            изоляции, пересозданная для числа эффективных проводников варианта.
+        """
+
+        stator = self.stator
+        armature = stator.armature
+
+        armature.rows = int(layout["rows"])
+        armature.columns = int(layout["columns"])
+        armature.parallel_branches = int(layout["parallel_branches"])
+        stator.effective_wires = int(layout["effective_wires"])
+
+        insulation = armature.insulation_system
+        if voltage is not None and not isinstance(insulation, CustomCoilInsulation):
+            armature.insulation_system = type(insulation)(armature.wire, voltage, stator.effective_wires // 2)
+
+        armature.compute_coil_dimensions(stator.slot_height, stator.slot_width, stator.slit_height,
+                                         stator.wedge_height, self.arrangement_allowance)
+        armature.set_wire(self.pressing, stator.effective_wires, mode)
+
+    def __get_insulation_table(self,
+                               voltage: Optional[float]
+                               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Вспомогательный метод, возвращающий толщины изоляции для каждого перебираемого числа эффективных проводников.
+        Стандартные системы изоляции принимают одни и те же аргументы (проводник, напряжение, число витков катушки),
+        поэтому пересоздаются по типу системы обмотки статора. Пересоздание идёт внутри ``DesignContext``, чтобы не
+        затронуть «одиночку», на которую ссылается обмотка.
+
+        :param voltage: Напряжение статора, В, или ``None``, если система изоляции используется как есть.
+        :return: Суммарная толщина прокладок, корпусная изоляция по высоте, полупроводящее покрытие, витковая изоляция
+            и суммарная изоляция по ширине, мм. Там, где система изоляции неприменима (например, Микафил с
+            проводником неподходящего типа), --- ``NaN``.
+        """
+
+        armature = self.stator.armature
+        insulation = armature.insulation_system
+
+        if voltage is None or isinstance(insulation, CustomCoilInsulation):
+            if isinstance(insulation, Micafil):
+                raise ValueError("Для изоляции Микафил необходимо задать напряжение: она зависит от числа витков")
+            systems = [insulation] * self.effective_wires.size
+        else:
+            systems = []
+            with DesignContext():
+                for effective_wires in self.effective_wires:
+                    try:
+                        systems.append(type(insulation)(armature.wire, voltage, int(effective_wires) // 2))
+                    except ValueError:
+                        systems.append(None)
+
+        table = np.full((5, len(systems)), np.nan)
+        for index, system in enumerate(systems):
+            if system is not None:
+                table[:, index] = (system.all_fillings(), system.body_insulation[0], system.semicond_coating,
+                                   system.turn_insulation, system.all_insulation()[1])
+
+        return tuple(table)
+
+
+__all__ = ["WindingLayoutSearch"]
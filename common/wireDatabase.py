@@ -12,7 +12,10 @@
   Класс, описывающий таблицу шин. Рассчитан на применение в сочетании с графическим интерфейсом.
 """
 
-from typing import Tuple, Dict
+from bisect import bisect_left
+from typing import Tuple, Dict, List
+
+import numpy as np
 
 
 class WireDB:
@@ -27,10 +30,18 @@ class WireDB:
 
     Методы:
 
-    * ``pick_wire(max_height: float, max_width: float) -> Tuple[float, float, float]``
+    * ``pick_wire(max_height: float, max_width: float, mode: str = "height") -> Tuple[float, float, float]``
 
       Осуществляет подбор стандартного проводника по максимально допустимым размерам *без учёта изоляции*. Возвращает
-      высоту, ширину и сечение неизолированного проводника.
+      высоту, ширину и сечение неизолированного проводника. В режиме ``"height"`` (по умолчанию) выбирается наибольшая
+      подходящая высота, а для неё --- наибольшая подходящая ширина. В режиме ``"section"`` выбирается проводник
+      наибольшего сечения среди всех, помещающихся в заданные размеры.
+
+    * ``pick_wires(max_heights: np.ndarray, max_widths: np.ndarray, mode: str = "height") ->
+      Tuple[np.ndarray, np.ndarray, np.ndarray]``
+
+      То же, что и ``pick_wire``, но сразу для массивов допустимых размеров. Там, где подходящего проводника нет,
+      возвращает ``NaN``.
 
     Возбуждает исключения:
 
@@ -43,8 +54,23 @@ class WireDB:
     """
 
     # Правим "__slots__" ради экономии памяти - тут и без того огромная таблица, так что таскать с собой ещё и
-    # "__dict__" не хочется. Да и заведомо известно, что этот класс делает и что более одного поля тут не нужно.
-    __slots__ = "wires"
+    # "__dict__" не хочется. Кроме самой таблицы храним только отсортированные индексы для быстрого подбора
+    __slots__ = ["wires",
+                 "__heights",
+                 "__widths",
+                 "__height_array",
+                 "__block_starts",
+                 "__keys",
+                 "__flat_heights",
+                 "__flat_widths",
+                 "__flat_sections",
+                 "__all_widths",
+                 "__all_width_list",
+                 "__skyline"]
+
+    # Множитель составного ключа "номер высоты * множитель + ширина" для векторизованного подбора. Должен быть больше
+    # любой ширины в таблице, чтобы ключи разных высот не перекрывались
+    __KEY_FACTOR = 1000.0
 
     # Для реализации "Одиночки", заявленной в документации, создаём поле класса "__instance" и проверяем его на
     # существование в магическом методе "__new__"
@@ -57,6 +83,10 @@ class WireDB:
         return cls.__instance
 
     def __init__(self) -> None:
+        # Таблица общая для всех рассчитываемых вариантов машин, так что заполняем её лишь при первом создании объекта
+        if hasattr(self, "wires"):
+            return
+
         # "self.wires" есть словарь из словарей, описывающий непосредственно таблицу проводников. "Внешний" ключ -
         # высота проводника (параметр "a" в методике), "внутренний" - его ширина (параметр "b")
         self.wires: Dict[float, Dict[float, float]]
@@ -457,9 +487,58 @@ class WireDB:
             12.50: {12.50: 155.410}
         }
 
+        self.__build_indexes()
+
+    def __build_indexes(self) -> None:
+        """
+        Вспомогательный метод, строящий отсортированные индексы таблицы один раз при её заполнении: списки высот и
+        ширин для двоичного поиска в ``pick_wire`` и плоские массивы составных ключей для ``pick_wires``, а также
+        таблицу наибольших сечений для режима ``"section"``.
+        """
+
+        self.__heights: List[float] = sorted(self.wires)
+        self.__widths: List[List[float]] = [sorted(self.wires[height]) for height in self.__heights]
+
+        # Все проводники подряд: сначала по номеру высоты, внутри - по ширине. Составной ключ упорядочен так же, поэтому
+        # один searchsorted находит наибольшую подходящую ширину сразу для всех запрошенных высот
+        block_sizes = [len(widths) for widths in self.__widths]
+        self.__height_array = np.array(self.__heights)
+        self.__block_starts = np.cumsum([0] + block_sizes[:-1])
+        self.__flat_widths = np.array([width for widths in self.__widths for width in widths])
+        self.__flat_sections = np.array([self.wires[height][width]
+                                         for height, widths in zip(self.__heights, self.__widths)
+                                         for width in widths])
+        height_indexes = np.repeat(np.arange(len(self.__heights)), block_sizes)
+        self.__keys = height_indexes * self.__KEY_FACTOR + self.__flat_widths
+        self.__flat_heights = self.__height_array[height_indexes]
+
+        # Таблица наибольших сечений ("горизонт" Парето по высоте, ширине и сечению): в ячейке [i, j] хранится номер
+        # проводника наибольшего сечения среди всех, чья высота не больше i-й стандартной высоты, а ширина - не больше
+        # j-й из всех встречающихся в таблице ширин. Строится накоплением максимума сначала по высотам, затем по
+        # ширинам, после чего любой запрос "наибольшее сечение в габарите h x w" сводится к двум двоичным поискам
+        self.__all_widths = np.unique(self.__flat_widths)
+        self.__all_width_list: List[float] = self.__all_widths.tolist()
+        width_indexes = np.searchsorted(self.__all_widths, self.__flat_widths)
+
+        sections = np.full((len(self.__heights), self.__all_widths.size), -np.inf)
+        skyline = np.full(sections.shape, -1)
+        sections[height_indexes, width_indexes] = self.__flat_sections
+        skyline[height_indexes, width_indexes] = np.arange(self.__flat_sections.size)
+
+        for axis in (0, 1):
+            for i in range(1, sections.shape[axis]):
+                previous = (slice(None), i - 1) if axis else (i - 1, slice(None))
+                current = (slice(None), i) if axis else (i, slice(None))
+                better = sections[previous] > sections[current]
+                sections[current] = np.where(better, sections[previous], sections[current])
+                skyline[current] = np.where(better, skyline[previous], skyline[current])
+
+        self.__skyline = skyline
+
     def pick_wire(self,
                   max_height: float,
-                  max_width: float
+                  max_width: float,
+                  mode: str = "height"
                   ) -> Tuple[float, float, float]:
         """
         Метод, осуществляющий автоматический подбор стандартного проводника (неизолированного) на основе максимально
@@ -467,30 +546,111 @@ class WireDB:
 
         :param max_height: Максимальная допустимая высота неизолированного проводника (мм, в методиках – параметр «a»).
         :param max_width: Максимальная допустимая ширина неизолированного проводника (мм, параметр «b»).
+        :param mode: Режим подбора: ``"height"`` --- наибольшая высота, а для неё наибольшая ширина, ``"section"`` ---
+            наибольшее сечение среди всех подходящих проводников.
         :return: Высота, ширина и сечение наиболее подходящего стандартного провода в мм.
         """
 
-        try:
-            # Составляем список всех стандартных высот проводников...
-            std_heights = list(self.wires.keys())
+        if mode == "section":
+            return self.__pick_max_section(max_height, max_width)
+        if mode != "height":
+            raise ValueError(f"Неизвестный режим подбора проводника: {mode}")
 
-            # ...отбираем из них только те, что меньше, а потому подходят для выполнения обмотки...
-            suitable_heights = list(filter(lambda x: x < max_height, std_heights))
+        # Наибольшая стандартная высота, строго меньшая допустимой, находится двоичным поиском по отсортированному
+        # списку высот...
+        height_index = bisect_left(self.__heights, max_height) - 1
 
-            # ...и берём наибольшую
-            wire_height = max(suitable_heights)
+        # ...и наибольшая ширина для неё - точно так же
+        widths = self.__widths[height_index]
+        width_index = bisect_left(widths, max_width) - 1
 
-            # Алгоритм для подбора ширины полностью аналогичен
-            std_widths = list(self.wires[wire_height].keys())
-            suitable_widths = list(filter(lambda x: x < max_width, std_widths))
-            wire_width = max(suitable_widths)
-
-            return wire_height, wire_width, self.wires[wire_height][wire_width]
-        except ValueError:
+        if height_index < 0 or width_index < 0:
             # - А-а-а-а!! Кошмар! Нету такого провода! Что же делать, что же делать?!
             # - Ну значит так и скажи, чего орать-то?
             raise ValueError("Не существует стандартного проводника подходящих размеров")
 
+        wire_height = self.__heights[height_index]
+        wire_width = widths[width_index]
+
+        return wire_height, wire_width, self.wires[wire_height][wire_width]
+
+    def __pick_max_section(self,
+                           max_height: float,
+                           max_width: float
+                           ) -> Tuple[float, float, float]:
+        """
+        Вспомогательный метод, подбирающий проводник наибольшего сечения среди всех, чьи высота и ширина строго меньше
+        допустимых.
+
+        :param max_height: Максимальная допустимая высота неизолированного проводника, мм.
+        :param max_width: Максимальная допустимая ширина неизолированного проводника, мм.
+        :return: Высота, ширина и сечение подобранного проводника в мм.
+        """
+
+        height_index = bisect_left(self.__heights, max_height) - 1
+        width_index = bisect_left(self.__all_width_list, max_width) - 1
+
+        if height_index < 0 or width_index < 0 or (wire := int(self.__skyline[height_index, width_index])) < 0:
+            raise ValueError("Не существует стандартного проводника подходящих размеров")
+
+        return float(self.__flat_heights[wire]), float(self.__flat_widths[wire]), float(self.__flat_sections[wire])
+
+    def pick_wires(self,
+                   max_heights: np.ndarray,
+                   max_widths: np.ndarray,
+                   mode: str = "height"
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Метод, осуществляющий подбор стандартных проводников (неизолированных) по тем же правилам, что и
+        ``pick_wire``, но сразу для массивов допустимых размеров. Вместо исключения там, где подходящего проводника нет,
+        возвращает ``NaN``. Допустимый размер, равный ``NaN``, считается неудовлетворимым.
+
+        :param max_heights: Максимальные допустимые высоты неизолированного проводника, мм.
+        :param max_widths: Максимальные допустимые ширины неизолированного проводника, мм.
+        :param mode: Режим подбора, как у ``pick_wire``.
+        :return: Массивы высот, ширин и сечений подобранных проводников в мм (формы, общей для входных массивов).
+        """
+
+        max_heights, max_widths = np.broadcast_arrays(np.asarray(max_heights, dtype=float),
+                                                      np.asarray(max_widths, dtype=float))
+
+        # searchsorted ставит NaN в конец массива, то есть принимает его за бесконечно большой размер
+        defined = ~(np.isnan(max_heights) | np.isnan(max_widths))
+
+        if mode == "section":
+            height_index = np.searchsorted(self.__height_array, max_heights, side="left") - 1
+            width_index = np.searchsorted(self.__all_widths, max_widths, side="left") - 1
+            found = defined & (height_index >= 0) & (width_index >= 0)
+
+            wire = np.where(found, self.__skyline[np.maximum(height_index, 0), np.maximum(width_index, 0)], -1)
+            found &= wire >= 0
+            wire = np.maximum(wire, 0)
+
+            return (np.where(found, self.__flat_heights[wire], np.nan),
+                    np.where(found, self.__flat_widths[wire], np.nan),
+                    np.where(found, self.__flat_sections[wire], np.nan))
+        if mode != "height":
+            raise ValueError(f"Неизвестный режим подбора проводника: {mode}")
+
+        height_index = np.searchsorted(self.__height_array, max_heights, side="left") - 1
+        found = defined & (height_index >= 0)
+        height_index = np.where(found, height_index, 0)
+
+        # Ширина ищется по составному ключу: позиция перед ключом запроса - наибольшая ширина, меньшая допустимой, если
+        # только она не вылезла в блок предыдущей высоты. Допустимая ширина ограничивается сверху чуть большей, чем
+        # наибольшая ширина в таблице, иначе большая (или бесконечная) ширина уводит ключ в блок следующей высоты
+        max_widths = np.minimum(max_widths, np.nextafter(self.__all_widths[-1], np.inf))
+        key = height_index * self.__KEY_FACTOR + max_widths
+        position = np.searchsorted(self.__keys, key, side="left") - 1
+        found &= position >= self.__block_starts[height_index]
+        position = np.where(found, position, 0)
+
+        heights = np.where(found, self.__height_array[height_index], np.nan)
+        widths = np.where(found, self.__flat_widths[position], np.nan)
+        sections = np.where(found, self.__flat_sections[position], np.nan)
+
+        return heights, widths, sections
+
 
 class BusDB:
     """
@@ -518,6 +678,9 @@ class BusDB:
         return cls.__instance
 
     def __init__(self) -> None:
+        if hasattr(self, "buses"):
+            return
+
         self.buses: Dict[float, Dict[float, float]]
         self.buses = {
             4.0: {40.0: 159.520, 45.0: 179.520,
@@ -23,9 +23,30 @@
 """
 
 from common.wireDatabase import WireDB
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+
+def _lookup_insulation(table: Dict[float, float],
+                       max_wire_sizes: np.ndarray
+                       ) -> np.ndarray:
+    """
+    Вспомогательная функция, выбирающая из таблицы СТО толщину изоляции для массива допустимых размеров проводника по
+    тому же правилу, что и ``__pick_insulation``: берётся строка с наибольшим размером, не превышающим допустимый.
+
+    :param table: Таблица «размер изолированного проводника --- толщина изоляции», мм.
+    :param max_wire_sizes: Максимальные размеры изолированного проводника, мм.
+    :return: Толщины изоляции в мм, ``NaN`` там, где изоляция не определена.
+    """
+
+    sizes = np.array(sorted(table))
+    thicknesses = np.array([table[size] for size in sizes])
+
+    index = np.searchsorted(sizes, max_wire_sizes, side="right") - 1
+    return np.where(index >= 0, thicknesses[np.maximum(index, 0)], np.nan)
+
 
 class WireType(ABC):
     r"""
@@ -56,9 +77,13 @@ class WireType(ABC):
 
     Методы:
 
-    * ``pick_wire(max_wire_height: float, max_wire_width: float) -> None``
+    * ``pick_wire(max_wire_height: float, max_wire_width: float, mode: str = "height") -> None``
 
       Подбирает проводник *с учётом изоляции.* В сущности, служит шлюзом к методу ``pick_wire`` класса ``WireDB``.
+
+    * ``get_insulations(max_wire_heights: np.ndarray, max_wire_widths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]``
+
+      Возвращает толщины изоляции для массивов допустимых размеров изолированного проводника, не меняя объект.
     """
 
     __slots__ = ["insulation_height",
@@ -81,19 +106,40 @@ class WireType(ABC):
 
     def pick_wire(self,
                   max_wire_height: float,
-                  max_wire_width: float
+                  max_wire_width: float,
+                  mode: str = "height"
                   ) -> None:
         """
         Метод, осуществляющий автоматический выбор стандартного проводника по максимально допустимым размерам.
 
         :param max_wire_height: Максимальная высота изолированного проводника в мм.
         :param max_wire_width: Максимальная высота изолированного проводника в мм.
+        :param mode: Режим подбора проводника, см. ``WireDB.pick_wire``.
         """
 
         max_copper_height = max_wire_height - self.insulation_height
         max_copper_width = max_wire_width - self.insulation_width
 
-        self.wire_height, self.wire_width, self.wire_section = WireDB().pick_wire(max_copper_height, max_copper_width)
+        self.wire_height, self.wire_width, self.wire_section = WireDB().pick_wire(max_copper_height, max_copper_width,
+                                                                                  mode)
+
+    def get_insulations(self,
+                        max_wire_heights: np.ndarray,
+                        max_wire_widths: np.ndarray
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Метод, возвращающий толщины изоляции проводника сразу для массивов максимально допустимых размеров
+        изолированного проводника. В отличие от ``pick_wire``, атрибуты объекта не меняет, а там, где изоляция для
+        заданных размеров не определена, вместо исключения возвращает ``NaN``. Для типов с постоянной изоляцией просто
+        размножает её толщины.
+
+        :param max_wire_heights: Максимальные высоты изолированного проводника в мм.
+        :param max_wire_widths: Максимальные ширины изолированного проводника в мм.
+        :return: Массивы толщин изоляции по высоте и по ширине в мм (формы, общей для входных массивов).
+        """
+
+        shape = np.broadcast_shapes(np.shape(max_wire_heights), np.shape(max_wire_widths))
+        return np.full(shape, self.insulation_height, dtype=float), np.full(shape, self.insulation_width, dtype=float)
 
 
 class PPTA2(WireType):
@@ -125,7 +171,7 @@ class PPTA2(WireType):
 
     Методы:
 
-    * ``pick_wire(max_wire_height: float, max_wire_width: float) -> None``
+    * ``pick_wire(max_wire_height: float, max_wire_width: float, mode: str = "height") -> None``
 
       Подбирает проводник *с учётом изоляции.* В сущности, служит шлюзом к методу ``pick_wire`` класса ``WireDB``.
 
@@ -172,7 +218,7 @@ class PPS(WireType):
 
         Методы:
 
-        * ``pick_wire(max_wire_height: float, max_wire_width: float) -> None``
+        * ``pick_wire(max_wire_height: float, max_wire_width: float, mode: str = "height") -> None``
 
           Подбирает проводник *с учётом изоляции.* В сущности, служит шлюзом к методу ``pick_wire`` класса ``WireDB``.
 
@@ -219,7 +265,7 @@ class PPLS(WireType):
 
         Методы:
 
-        * ``pick_wire(max_wire_height: float, max_wire_width: float) -> None``
+        * ``pick_wire(max_wire_height: float, max_wire_width: float, mode: str = "height") -> None``
 
           Подбирает проводник *с учётом изоляции.* В сущности, служит шлюзом к методу ``pick_wire`` класса ``WireDB``.
 
@@ -267,13 +313,21 @@ class PSDT(WireType):
 
     Методы:
 
-    * ``pick_wire(max_wire_height: float, max_wire_width: float) -> None``
+    * ``pick_wire(max_wire_height: float, max_wire_width: float, mode: str = "height") -> None``
 
       Подбирает проводник *с учётом изоляции,* а также саму толщину изоляции.
 
+    * ``get_insulations(max_wire_heights: np.ndarray, max_wire_widths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]``
+
+      Подбирает толщины изоляции для массивов допустимых размеров изолированного проводника, не меняя объект.
+
     Наследует класс ``WireType``.
     """
 
+    # Таблицы толщин изоляции по СТО
+    __ins_heights = {1.46: 0.28, 2.72: 0.3, 4.76: 0.38}
+    __ins_widths = {2.68: 0.28, 3.25: 0.3, 4.19: 0.32, 5.43: 0.34, 6.76: 0.38, 9.30: 0.4, 12.10: 0.45}
+
     def __str__(self) -> str:
         return "ПСДТ"
 
@@ -289,9 +343,8 @@ class PSDT(WireType):
         :param max_wire_width: Максимальная высота изолированного проводника в мм.
         """
 
-        # Локальные переменные, хранящие размеры изоляции
-        ins_heights = {1.46: 0.28, 2.72: 0.3, 4.76: 0.38}
-        ins_widths = {2.68: 0.28, 3.25: 0.3, 4.19: 0.32, 5.43: 0.34, 6.76: 0.38, 9.30: 0.4, 12.10: 0.45}
+        ins_heights = self.__ins_heights
+        ins_widths = self.__ins_widths
 
         try:
             # Подобно методу "pick_wire" класса WireDB, вычисляем нужные индексы в словарях
@@ -308,7 +361,8 @@ class PSDT(WireType):
 
     def pick_wire(self,
                   max_wire_height: float,
-                  max_wire_width: float
+                  max_wire_width: float,
+                  mode: str = "height"
                   ) -> None:
         """
         Метод, осуществляющий автоматический выбор стандартного проводника и толщины изоляции по максимально допустимым
@@ -316,9 +370,33 @@ class PSDT(WireType):
 
         :param max_wire_height: Максимальная высота изолированного проводника в мм.
         :param max_wire_width: Максимальная высота изолированного проводника в мм.
+        :param mode: Режим подбора проводника, см. ``WireDB.pick_wire``.
         """
         self.__pick_insulation(max_wire_height, max_wire_width)
-        super().pick_wire(max_wire_height, max_wire_width)
+        super().pick_wire(max_wire_height, max_wire_width, mode)
+
+    def get_insulations(self,
+                        max_wire_heights: np.ndarray,
+                        max_wire_widths: np.ndarray
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Метод, подбирающий толщины изоляции по СТО сразу для массивов максимально допустимых размеров изолированного
+        проводника. Атрибуты объекта не меняет.
+
+        :param max_wire_heights: Максимальные высоты изолированного проводника в мм.
+        :param max_wire_widths: Максимальные ширины изолированного проводника в мм.
+        :return: Массивы толщин изоляции по высоте и по ширине в мм, ``NaN`` там, где изоляция не определена.
+        """
+
+        max_wire_heights, max_wire_widths = np.broadcast_arrays(np.asarray(max_wire_heights, dtype=float),
+                                                                np.asarray(max_wire_widths, dtype=float))
+
+        heights = _lookup_insulation(self.__ins_heights, max_wire_heights)
+        widths = _lookup_insulation(self.__ins_widths, max_wire_widths)
+
+        # Как и в скалярном случае, изоляция не определена, если не подошла хотя бы одна из таблиц
+        undefined = np.isnan(heights) | np.isnan(widths)
+        return np.where(undefined, np.nan, heights), np.where(undefined, np.nan, widths)
 
 
 class PETVSD(WireType):
@@ -351,13 +429,24 @@ class PETVSD(WireType):
 
     Методы:
 
-    * ``pick_wire(max_wire_height: float, max_wire_width: float) -> None``
+    * ``pick_wire(max_wire_height: float, max_wire_width: float, mode: str = "height") -> None``
 
       Подбирает проводник *с учётом изоляции,* а также саму толщину изоляции.
 
+    * ``get_insulations(max_wire_heights: np.ndarray, max_wire_widths: np.ndarray) -> Tuple[np.ndarray, np.ndarray]``
+
+      Подбирает толщины изоляции для массивов допустимых размеров изолированного проводника, не меняя объект.
+
     Наследует класс ``WireType``.
     """
 
+    # Таблицы толщин изоляции по СТО. Толщина по ширине зависит ещё и от высоты проводника
+    __ins_heights = {1.31: 0.41, 1.53: 0.41, 2.47: 0.47, 4.03: 0.48}
+    __ins_widths = {1.31: {2.45: 0.45, 2.95: 0.45, 4.22: 0.47, 4.98: 0.48, 6.09: 0.49, 7.63: 0.53},
+                    1.53: {2.45: 0.45, 2.95: 0.45, 4.23: 0.48, 4.98: 0.48, 6.09: 0.49, 7.65: 0.55, 10.56: 0.56},
+                    2.47: {2.96: 0.46, 4.23: 0.48, 5.00: 0.50, 6.13: 0.53, 7.66: 0.56, 10.57: 0.57},
+                    4.03: {5.02: 0.52, 6.13: 0.53, 7.67: 0.57, 10.57: 0.57}}
+
     # А-а-а-а! Ещё более страшный монстр пришёл! Не-е-е-ет! Не надо! Кто-нибудь, помогите, меня ПЭТВСД обижает!
     def __pick_insulation(self,
                           max_wire_height: float,
@@ -370,11 +459,8 @@ class PETVSD(WireType):
         :param max_wire_width: Максимальная высота изолированного проводника в мм.
         """
 
-        ins_heights = {1.31: 0.41, 1.53: 0.41, 2.47: 0.47, 4.03: 0.48}
-        ins_widths = {1.31: {2.45: 0.45, 2.95: 0.45, 4.22: 0.47, 4.98: 0.48, 6.09: 0.49, 7.63: 0.53},
-                      1.53: {2.45: 0.45, 2.95: 0.45, 4.23: 0.48, 4.98: 0.48, 6.09: 0.49, 7.65: 0.55, 10.56: 0.56},
-                      2.47: {2.96: 0.46, 4.23: 0.48, 5.00: 0.50, 6.13: 0.53, 7.66: 0.56, 10.57: 0.57},
-                      4.03: {5.02: 0.52, 6.13: 0.53, 7.67: 0.57, 10.57: 0.57}}
+        ins_heights = self.__ins_heights
+        ins_widths = self.__ins_widths
 
         try:
             heights = filter(lambda h: h <= max_wire_height, ins_heights.keys())
@@ -390,7 +476,8 @@ class PETVSD(WireType):
 
     def pick_wire(self,
                   max_wire_height: float,
-                  max_wire_width: float
+                  max_wire_width: float,
+                  mode: str = "height"
                   ) -> None:
         """
         Метод, осуществляющий автоматический выбор стандартного проводника и толщины изоляции по максимально допустимым
@@ -398,10 +485,39 @@ class PETVSD(WireType):
 
         :param max_wire_height: Максимальная высота изолированного проводника в мм.
         :param max_wire_width: Максимальная высота изолированного проводника в мм.
+        :param mode: Режим подбора проводника, см. ``WireDB.pick_wire``.
         """
 
         self.__pick_insulation(max_wire_height, max_wire_width)
-        super().pick_wire(max_wire_height, max_wire_width)
+        super().pick_wire(max_wire_height, max_wire_width, mode)
+
+    def get_insulations(self,
+                        max_wire_heights: np.ndarray,
+                        max_wire_widths: np.ndarray
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Метод, подбирающий толщины изоляции по СТО сразу для массивов максимально допустимых размеров изолированного
+        проводника. Атрибуты объекта не меняет.
+
+        :param max_wire_heights: Максимальные высоты изолированного проводника в мм.
+        :param max_wire_widths: Максимальные ширины изолированного проводника в мм.
+        :return: Массивы толщин изоляции по высоте и по ширине в мм, ``NaN`` там, где изоляция не определена.
+        """
+
+        max_wire_heights, max_wire_widths = np.broadcast_arrays(np.asarray(max_wire_heights, dtype=float),
+                                                                np.asarray(max_wire_widths, dtype=float))
+
+        heights = _lookup_insulation(self.__ins_heights, max_wire_heights)
+        widths = np.full(heights.shape, np.nan)
+
+        # Своя таблица ширин для каждой строки таблицы высот
+        row = np.searchsorted(sorted(self.__ins_heights), max_wire_heights, side="right") - 1
+        for index, height in enumerate(sorted(self.__ins_heights)):
+            selected = row == index
+            widths[selected] = _lookup_insulation(self.__ins_widths[height], max_wire_widths[selected])
+
+        undefined = np.isnan(heights) | np.isnan(widths)
+        return np.where(undefined, np.nan, heights), np.where(undefined, np.nan, widths)
 
     def __str__(self) -> str:
         return "ПЭТВСД"
@@ -442,7 +558,7 @@ class CustomWire(WireType):
       Устанавливает толщину изоляции. Служит вспомогательным методом, присутствующим только в этом классе. Упрощает
       унификацию интерфейса.
 
-    * ``pick_wire(max_wire_height: float, max_wire_width: float) -> None``
+    * ``pick_wire(max_wire_height: float, max_wire_width: float, mode: str = "height") -> None``
 
       Подбирает проводник *с учётом изоляции.* В сущности, служит шлюзом к методу ``pick_wire`` класса ``WireDB``.
 
@@ -0,0 +1,8 @@
+"""
+Общие настройки тестов: пакеты ``common`` и ``turbo`` импортируются из корня репозитория.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,178 @@
+"""
+Эталонный вариант турбогенератора для тестов: полный расчёт от статора до потерь и постоянных времени, выполненный
+по шагам так же, как его выполнил бы пользователь.
+
+Функции:
+
+* ``build_design``
+
+  Рассчитывает эталонный вариант и возвращает словарь его частей.
+"""
+
+import math
+from typing import Any, Dict
+
+from common.armatureInsulation import Monolith2New
+from common.constants import COPPER_CONDUCTIVITY
+from common.designContext import DesignContext
+from common.stator import ACMachineStator
+from common.statorArmature import CoilArmature
+from common.steelDatabase import M27050AMean, Steel35HN3MFARotor
+from common.wireTypes import PPTA2
+from turbo.armatureInsulation import TurboMachineRotorInsulation
+from turbo.losses import Losses
+from turbo.magneticCircuit import LoadedMagneticCircuit, NoLoadMagneticCircuit
+from turbo.mass import Mass
+from turbo.reactances import Reactances
+from turbo.rotor import Shaft, TurboMachineRotor, TurboMachineRotorBandaging
+from turbo.rotorArmature import TurboMachineRotorArmature
+
+# Номинальные данные: число пар полюсов, число фаз, частота, Гц, напряжение, В, ток, А, коэффициент мощности
+POLE_PAIRS = 1
+PHASE_COUNT = 3
+FREQUENCY = 50
+VOLTAGE = 10500
+CURRENT = 412.0
+COS_PHI = 0.8
+EXCITER_EFFICIENCY = 0.9
+
+
+def build_design(air_gap: float = 40,
+                 vent_channel_width: float = 10,
+                 rotor_temperature: float = 75
+                 ) -> Dict[str, Any]:
+    """
+    Функция, рассчитывающая эталонный вариант турбогенератора. Все объекты создаются внутри ``DesignContext``, так что
+    варианты, рассчитанные разными вызовами, не делят между собой ни одного объекта.
+
+    :param air_gap: Воздушный зазор, мм.
+    :param vent_channel_width: Ширина вентиляционного канала статора, мм.
+    :param rotor_temperature: Температура обмотки ротора для потерь на возбуждение, °C.
+    :return: Словарь частей варианта: ``stator``, ``rotor``, ``bandaging``, ``shaft``, ``stator_steel``, ``no_load``,
+        ``loaded``, ``reactances``, ``mass``, ``losses``.
+    """
+
+    p, m = POLE_PAIRS, PHASE_COUNT
+    sin_phi = math.sqrt(1 - COS_PHI ** 2)
+
+    with DesignContext():
+        wire = PPTA2()
+        armature = CoilArmature(2, 2, 20, 2, Monolith2New(wire, VOLTAGE), wire)
+        stator = ACMachineStator(1500, 800, 1500, 48, 120, 24, 1, 8, 8, armature,
+                                 vent_channel_count=20, vent_channel_width=vent_channel_width,
+                                 stud_count=12, stud_diameter=30, bypass_thickness=20,
+                                 pressure_plate_thickness=40, copper_screen_thickness=5)
+        stator.compute_slots_per_pole_phase(p, m)
+        stator.compute_pole_pitch(p)
+        stator.compute_tooth_pitch()
+        stator.compute_effective_length(0.95)
+        armature.compute_coil_dimensions(stator.slot_height, stator.slot_width, stator.slit_height,
+                                         stator.wedge_height, 0.3)
+        armature.set_wire(0.1, stator.effective_wires)
+        armature.compute_shortening(stator.slots_per_pole_phase, m)
+        armature.compute_turn_count(p, stator.slots_per_pole_phase, stator.effective_wires)
+        armature.compute_turn_length(stator.length, stator.inner_diameter, p)
+        armature.compute_resistance(COPPER_CONDUCTIVITY)
+        armature.compute_current_density(CURRENT)
+        stator.compute_current_load(CURRENT)
+
+        rotor_armature = TurboMachineRotorArmature(1, TurboMachineRotorInsulation(0.3, 1.5, 1.0, 1.0), 8.0, 30.0)
+        rotor = TurboMachineRotor(air_gap, stator.inner_diameter, 0, 1600, 24, 36, 32, rotor_armature, 20, 36, 10,
+                                  effective_wires_small=7,
+                                  vert_vent_channel_pitch=60, vert_vent_channel_length=20, vert_vent_channel_width=8,
+                                  subslot_channel_height=15, subslot_channel_width=12,
+                                  big_tooth_slot_count=4, big_tooth_slot_width=10,
+                                  tooth_slot_width=6, tooth_slot_height=40)
+        rotor.compute_slot_height()
+        rotor.compute_surface_relation(p)
+        rotor.compute_coils_per_pole(p)
+        rotor.compute_pole_pitch(p)
+        rotor.compute_tooth_pitch()
+        rotor_armature.compute_turn_count(rotor.effective_wires, rotor.effective_wires_small, rotor.coils_per_pole)
+        rotor_armature.compute_turn_length(rotor.length, rotor.outer_diameter, p)
+        rotor_armature.compute_resistance(COPPER_CONDUCTIVITY, rotor.length, rotor.outer_diameter, p,
+                                          rotor.vert_vent_channel_length, rotor.vert_vent_channel_width,
+                                          rotor.vert_vent_channel_pitch)
+        bandaging = TurboMachineRotorBandaging(760, 640, 200, 20, False)
+        shaft = Shaft(journal_length=300, journal_diameter=250, brush_width=25, brush_length=32,
+                      ring_outer_diameter=400, ring_brush_count=8, ring_inner_diameter=380, crossarm_brush_count=8)
+
+        stator_steel, rotor_steel = M27050AMean(), Steel35HN3MFARotor()
+
+        no_load = NoLoadMagneticCircuit(stator, rotor, stator_steel, rotor_steel, p, 0.95)
+        no_load.compute_stator_flow(stator, VOLTAGE, FREQUENCY)
+        no_load.compute_stator_B_fields()
+        no_load.compute_stator_H_fields(rotor.surface_relation)
+        no_load.compute_stator_MMF()
+        no_load.compute_rotor_flow(rotor, bandaging, stator.length)
+        no_load.compute_rotor_B_fields()
+        no_load.compute_rotor_H_fields(rotor.get_yoke_saturation_factor())
+        no_load.compute_rotor_MMF()
+        no_load.compute_rotor_currents(rotor_armature.turn_count)
+
+        xs = Reactances(stator, CURRENT, VOLTAGE, FREQUENCY, p, m)
+        loaded = LoadedMagneticCircuit(stator, rotor, stator_steel, rotor_steel, p, 0.95)
+        loaded.compute_stator_reaction(CURRENT, p, m, armature.turn_count, stator.get_armature_coefficient(),
+                                       rotor_armature.turn_count, rotor.get_armature_coefficient(p))
+        xs.compute_x_ad(loaded.stator_reaction_current_reduced, no_load.magnetizing_current)
+        xs.compute_stator_armature_reactance(stator, rotor.air_gap, p)
+        xs.compute_x_d()
+        xs.compute_rotor_dissipation_factor(rotor, p, no_load.magnetizing_current, no_load.rotor_flow)
+        xs.compute_x_prime()
+        xs.compute_x_Potier(bandaging)
+        xs.compute_total_reactance()
+
+        loaded.compute_SC_current(xs.x_stator, no_load.magnetizing_current)
+        loaded.compute_rotor_SC_MMF(rotor_armature.turn_count)
+        loaded.compute_EMF(COS_PHI, sin_phi, xs.x_P)
+        loaded.compute_stator_flow(no_load.stator_flow)
+        loaded.compute_stator_B_fields()
+        loaded.compute_stator_H_fields(rotor.surface_relation)
+        loaded.compute_stator_MMF()
+        loaded.compute_rotor_flow(rotor, bandaging, stator.length, sin_phi, xs.x_P)
+        loaded.compute_rotor_B_fields()
+        loaded.compute_rotor_H_fields(rotor.get_yoke_saturation_factor())
+        loaded.compute_rotor_MMF()
+        loaded.compute_field_current(rotor_armature.turn_count, sin_phi, xs.x_P)
+
+        mass = Mass()
+        mass.compute_stator_masses(stator, m)
+        mass.compute_rotor_masses(rotor, p)
+
+        losses = Losses(stator_steel, FREQUENCY)
+        scr = loaded.get_SCR(no_load.rotor_current)
+        losses.compute_stator_copper_losses(stator, CURRENT, m)
+        losses.compute_SC_steel_losses(stator, rotor, loaded, mass, p)
+        losses.compute_OC_steel_losses(stator, rotor, no_load, mass, p, 1.0, scr)
+        losses.compute_end_part_SC_losses(stator, rotor, loaded, p, 4)
+        losses.compute_end_part_OC_losses(scr)
+        losses.compute_excitation_losses(rotor, loaded, EXCITER_EFFICIENCY, rotor_temperature)
+        losses.compute_mechanical_losses(rotor, bandaging, mass, shaft, p, 1, 1, 10, 10, 30, 5)
+
+    return dict(stator=stator, rotor=rotor, bandaging=bandaging, shaft=shaft, stator_steel=stator_steel,
+                no_load=no_load, loaded=loaded, reactances=xs, mass=mass, losses=losses)
+
+
+def get_nominal_power() -> float:
+    """
+    Функция, возвращающая номинальную активную мощность эталонного варианта.
+
+    :return: Активная мощность, кВт.
+    """
+
+    return math.sqrt(3) * VOLTAGE * CURRENT / 1e3 * COS_PHI
+
+
+def get_map_arguments(design: Dict[str, Any]) -> tuple:
+    """
+    Функция, возвращающая общие аргументы ``EfficiencyMap.compute_load_dependent_losses`` и
+    ``EnergyLosses.compute_energy`` для эталонного варианта.
+
+    :param design: Вариант, рассчитанный ``build_design``.
+    :return: Аргументы от ``losses`` до ``exc_efficiency`` включительно.
+    """
+
+    no_load = design["no_load"]
+    return (design["losses"], design["loaded"], design["rotor"], design["bandaging"], design["stator"].length,
+            design["reactances"], no_load.magnetizing_current, no_load.stator_flow, no_load.rotor_current,
+            EXCITER_EFFICIENCY)
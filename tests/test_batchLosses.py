@@ -0,0 +1,66 @@
+"""
+Тесты векторного расчёта потерь ``BatchLosses``: для каждого варианта набора он должен давать то же, что и ``Losses``.
+"""
+
+import numpy as np
+import pytest
+
+from common.batchStator import BatchACMachineStator
+from referenceDesign import CURRENT, EXCITER_EFFICIENCY, FREQUENCY, PHASE_COUNT, POLE_PAIRS, build_design
+from turbo.batchLosses import COMPONENTS, BatchLosses
+from turbo.batchMagneticCircuit import BatchMagneticCircuit
+from turbo.batchRotor import BatchTurboMachineRotor
+
+
+@pytest.fixture(scope="module")
+def designs():
+    return [build_design(air_gap, vent_channel_width) for air_gap, vent_channel_width in ((40, 10), (35, 10), (45, 8))]
+
+
+def column(designs, function) -> np.ndarray:
+    return np.array([function(design) for design in designs], dtype=float)
+
+
+def test_batch_losses_match_scalar(designs):
+    stator = BatchACMachineStator.from_stators([design["stator"] for design in designs])
+    rotor = BatchTurboMachineRotor.from_rotors([design["rotor"] for design in designs])
+    circuit = BatchMagneticCircuit.from_circuits([design["no_load"] for design in designs])
+    circuit.compute_no_load(column(designs, lambda design: design["no_load"].stator_flow),
+                            rotor.surface_relation,
+                            column(designs, lambda design: design["rotor"].armature.turn_count),
+                            column(designs, lambda design: design["no_load"].rotor_flow - design["no_load"].stator_flow
+                                   - design["no_load"].phi_s))
+
+    scr = column(designs, lambda design: design["loaded"].get_SCR(design["no_load"].rotor_current))
+    teeth_mass = column(designs, lambda design: design["mass"].stator_teeth)
+
+    losses = BatchLosses(designs[0]["stator_steel"], FREQUENCY)
+    losses.compute_stator_copper_losses(stator, CURRENT, PHASE_COUNT,
+                                        column(designs, lambda design: design["stator"].armature.resistance[75]), 2, 2,
+                                        column(designs, lambda design: design["stator"].armature.wire.wire_width),
+                                        column(designs, lambda design: design["stator"].armature.wire.wire_height))
+    losses.compute_SC_steel_losses(stator, rotor, circuit,
+                                   column(designs, lambda design: design["loaded"].rotor_SC_MMF), teeth_mass,
+                                   POLE_PAIRS, column(designs, lambda design: design["stator"].armature.shortening))
+    losses.compute_OC_steel_losses(stator, rotor, circuit, column(designs, lambda design: design["mass"].stator_yoke),
+                                   teeth_mass, POLE_PAIRS, 1.0, scr)
+    losses.compute_end_part_SC_losses(stator, rotor,
+                                      column(designs, lambda design: design["loaded"].stator_reaction_MMF),
+                                      POLE_PAIRS, 4)
+    losses.compute_end_part_OC_losses(scr)
+    losses.compute_excitation_losses(column(designs, lambda design: design["loaded"].nominal_field_current),
+                                     column(designs, lambda design: design["rotor"].armature.resistance[75]),
+                                     EXCITER_EFFICIENCY)
+    losses.compute_mechanical_losses(rotor, 200, 760, column(designs, lambda design: design["mass"].rotor),
+                                     designs[0]["shaft"], POLE_PAIRS, 1, 1, 10, 10, 30, 5)
+
+    matrix = losses.get_matrix()
+    assert matrix.shape == (len(designs), len(COMPONENTS))
+    assert losses.get_valid_mask().all()
+
+    for index, name in enumerate(COMPONENTS):
+        expected = column(designs, lambda design: getattr(design["losses"], name))
+        np.testing.assert_allclose(matrix[:, index], expected, rtol=1e-12, err_msg=name)
+
+    np.testing.assert_allclose(losses.get_efficiency(6000),
+                               column(designs, lambda design: design["losses"].get_efficiency(6000)), rtol=1e-12)
@@ -0,0 +1,48 @@
+"""
+Тесты диаграммы мощностей ``CapabilityChart``: при допустимых плотностях тока, равных номинальным, ограничения по
+нагреву проходят через номинальную точку, а ограничение по устойчивости при 90° --- прямая `Q = -1 / x_d`:math:.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from referenceDesign import COS_PHI, build_design
+from turbo.capabilityChart import CapabilityChart
+
+
+@pytest.fixture(scope="module")
+def design():
+    design = build_design()
+    design["rotor"].armature.compute_current_density(design["loaded"].nominal_field_current)
+    return design
+
+
+def test_heating_limits_pass_through_nominal_point(design):
+    stator, rotor, no_load, xs = design["stator"], design["rotor"], design["no_load"], design["reactances"]
+    chart = CapabilityChart(angle_points=361, level_points=301)
+
+    chart.compute_stator_limit(stator.armature, stator.armature.current_density)
+    chart.compute_rotor_limit(design["loaded"], rotor, design["bandaging"], stator.length, xs,
+                              no_load.magnetizing_current, no_load.stator_flow, no_load.rotor_current,
+                              rotor.armature.current_density)
+
+    np.testing.assert_allclose(chart.stator_limit, 1, rtol=1e-12)
+    # Номинальный режим - луч перевозбуждения с номинальным коэффициентом мощности
+    assert np.interp(math.acos(COS_PHI), chart.angles, chart.rotor_limit) == pytest.approx(1, abs=2e-3)
+    np.testing.assert_array_equal(chart.get_limit(), np.minimum(chart.stator_limit, chart.rotor_limit))
+
+
+def test_stability_limit_at_90_degrees(design):
+    x_d = design["reactances"].x_d
+    # Прямая должна попадать в сетку: |Q| = 1 / x_d < max_level
+    chart = CapabilityChart(max_level=3)
+    chart.compute_stability_limit(x_d, 90)
+
+    active, reactive = chart.get_curve("stability")
+    inside = chart.stability_limit < chart.levels[-1]
+
+    assert inside.sum() > 10
+    np.testing.assert_allclose(reactive[inside], -1 / x_d, rtol=1e-12)
+    assert np.all(active[inside] >= 0)
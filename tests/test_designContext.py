@@ -0,0 +1,33 @@
+"""
+Тесты контекста расчёта варианта машины ``DesignContext`` и примеси ``DesignSingleton``.
+"""
+
+from common.armatureInsulation import Micafil, Monolith2New
+from common.designContext import DesignContext
+from common.wireTypes import PETVSD, PPTA2
+
+
+def test_singleton_outside_context():
+    first = Monolith2New(PPTA2(), 10500, 10)
+    second = Monolith2New(PPTA2(), 6300, 10)
+    # Наследники одного базового класса не делят объект между собой
+    other = Micafil(PETVSD(), 6600, 10)
+
+    assert first is second
+    assert other is not first
+    assert type(first) is Monolith2New and type(other) is Micafil
+
+
+def test_new_object_inside_context():
+    outside = Monolith2New(PPTA2(), 10500, 10)
+
+    with DesignContext():
+        first = Monolith2New(PPTA2(), 10500, 10)
+        with DesignContext():
+            second = Monolith2New(PPTA2(), 6300, 10)
+
+        assert DesignContext.is_active()
+        assert first is not second and outside is not first
+
+    assert not DesignContext.is_active()
+    assert Monolith2New(PPTA2(), 10500, 10) is outside
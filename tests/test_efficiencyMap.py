@@ -0,0 +1,56 @@
+"""
+Тесты карты КПД ``EfficiencyMap``: номинальная точка сетки должна совпадать с расчётом номинального режима ``Losses``.
+"""
+
+import numpy as np
+import pytest
+
+from referenceDesign import COS_PHI, CURRENT, VOLTAGE, build_design, get_map_arguments, get_nominal_power
+from turbo.efficiencyMap import EfficiencyMap
+
+
+def compute_map(design, **kwargs) -> EfficiencyMap:
+    efficiency_map = EfficiencyMap(cos_phi=(COS_PHI, 0.9, 1), load_points=18)
+    efficiency_map.compute_load_independent_losses(design["losses"])
+    efficiency_map.compute_load_dependent_losses(*get_map_arguments(design), **kwargs)
+    efficiency_map.compute_efficiency(VOLTAGE, CURRENT)
+    return efficiency_map
+
+
+@pytest.fixture(scope="module")
+def design():
+    return build_design()
+
+
+def test_nominal_point_matches_losses(design):
+    efficiency_map = compute_map(design)
+    nominal = np.argmin(np.abs(efficiency_map.loads - 1))
+
+    assert efficiency_map.loads[nominal] == pytest.approx(1)
+    assert efficiency_map.power[nominal, 0] == pytest.approx(get_nominal_power(), rel=1e-12)
+    assert efficiency_map.efficiency[nominal, 0] == pytest.approx(design["losses"].get_efficiency(get_nominal_power()),
+                                                                  rel=1e-12)
+
+
+def test_efficiency_rises_with_cos_phi(design):
+    efficiency_map = compute_map(design)
+
+    assert np.all(np.diff(efficiency_map.efficiency, axis=1) > 0)
+    assert efficiency_map.get_weighted_efficiency().shape == efficiency_map.cos_phi.shape
+
+
+def test_nominal_point_at_rotor_temperature():
+    design = build_design(rotor_temperature=110)
+    efficiency_map = compute_map(design, rotor_temperature=110)
+    nominal = np.argmin(np.abs(efficiency_map.loads - 1))
+
+    assert efficiency_map.efficiency[nominal, 0] == pytest.approx(design["losses"].get_efficiency(get_nominal_power()),
+                                                                  rel=1e-12)
+
+
+def test_weighted_efficiency_requires_efficiency(design):
+    efficiency_map = EfficiencyMap(cos_phi=(COS_PHI,), load_points=18)
+    efficiency_map.compute_load_independent_losses(design["losses"])
+
+    with pytest.raises(ValueError, match="КПД не рассчитан"):
+        efficiency_map.get_weighted_efficiency()
@@ -0,0 +1,78 @@
+"""
+Тесты расчёта потерь энергии ``EnergyLosses``: результат не должен зависеть от того, в каком виде и какими порциями
+передан график нагрузки.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from referenceDesign import COS_PHI, CURRENT, VOLTAGE, build_design, get_map_arguments, get_nominal_power
+from turbo.energyLosses import EnergyLosses
+
+NAN_ROWS = (3, 150, 151)
+
+
+@pytest.fixture(scope="module")
+def design():
+    return build_design()
+
+
+@pytest.fixture(scope="module")
+def profile():
+    apparent_power = math.sqrt(3) * VOLTAGE * CURRENT / 1e3
+    generator = np.random.default_rng(0)
+    rows = generator.uniform((0.2 * apparent_power, -0.2 * apparent_power), (apparent_power, 0.6 * apparent_power),
+                             size=(500, 2))
+    rows[NAN_ROWS, 0] = np.nan
+    return rows
+
+
+def compute(design, profile, **kwargs) -> EnergyLosses:
+    energy_losses = EnergyLosses(chunk_size=64)
+    energy_losses.compute_energy(profile, *get_map_arguments(design), VOLTAGE, CURRENT, **kwargs)
+    return energy_losses
+
+
+def test_input_forms_agree(design, profile, tmp_path):
+    npy_path = tmp_path / "profile.npy"
+    csv_path = tmp_path / "profile.csv"
+    gaps_path = tmp_path / "gaps.csv"
+    np.save(npy_path, profile)
+    np.savetxt(csv_path, profile, delimiter=",", header="P,Q", comments="")
+    # Пропуски в виде пустых ячеек и пустые строки в конце файла, которых хватает на целую порцию
+    lines = [",".join("" if math.isnan(value) else repr(float(value)) for value in row) for row in profile]
+    gaps_path.write_text("\n".join(lines) + "\n" * 100)
+
+    reference = compute(design, profile)
+    assert reference.point_count == len(profile) - len(NAN_ROWS)
+    assert reference.skipped_count == len(NAN_ROWS)
+
+    for energy_losses in (compute(design, str(npy_path)),
+                          compute(design, csv_path, skip_rows=1),
+                          compute(design, gaps_path),
+                          compute(design, np.array_split(profile, 7))):
+        np.testing.assert_allclose(energy_losses.energy, reference.energy, rtol=1e-12)
+        assert energy_losses.point_count == reference.point_count
+        assert energy_losses.skipped_count == reference.skipped_count
+
+
+def test_nominal_profile_matches_losses(design):
+    active_power = get_nominal_power()
+    reactive_power = active_power / COS_PHI * math.sqrt(1 - COS_PHI ** 2)
+    energy_losses = compute(design, np.tile([active_power, reactive_power], (10, 1)))
+
+    total_losses = active_power / design["losses"].get_efficiency(active_power) - active_power
+    assert energy_losses.get_total_energy() == pytest.approx(10 * total_losses, rel=1e-12)
+    assert energy_losses.get_duration() == 10
+
+
+def test_nominal_profile_at_rotor_temperature():
+    design = build_design(rotor_temperature=110)
+    active_power = get_nominal_power()
+    reactive_power = active_power / COS_PHI * math.sqrt(1 - COS_PHI ** 2)
+    energy_losses = compute(design, np.array([[active_power, reactive_power]]), rotor_temperature=110)
+
+    total_losses = active_power / design["losses"].get_efficiency(active_power) - active_power
+    assert energy_losses.get_total_energy() == pytest.approx(total_losses, rel=1e-12)
@@ -0,0 +1,39 @@
+"""
+Тесты кэша геометрических величин ``GeometryCache``.
+"""
+
+from common.geometryCache import GeometryCache, cached_geometry
+
+
+class Part(GeometryCache):
+    __slots__ = ["diameter", "calls"]
+
+    _geometry_attributes = frozenset(["diameter"])
+
+    def __init__(self, diameter: float) -> None:
+        self.diameter = diameter
+        self.calls = 0
+
+    @cached_geometry
+    def get_pitch(self, slot_count: int, level: float = 1) -> float:
+        self.calls += 1
+        return self.diameter * level / slot_count
+
+
+def test_keyword_and_positional_calls_share_entry():
+    part = Part(100)
+
+    assert part.get_pitch(10) == part.get_pitch(slot_count=10) == part.get_pitch(10, 1) == part.get_pitch(10, level=1)
+    assert part.calls == 1
+
+    assert part.get_pitch(10, level=0.5) == 5
+    assert part.calls == 2
+
+
+def test_cache_reset_on_size_change():
+    part = Part(100)
+    part.get_pitch(10)
+
+    part.diameter = 200
+    assert part.get_pitch(slot_count=10) == 20
+    assert part.calls == 2
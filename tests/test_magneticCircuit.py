@@ -0,0 +1,99 @@
+"""
+Тесты магнитных цепей: обратный расчёт холостого хода (``solve_increasing`` и
+``NoLoadMagneticCircuit.get_voltage_level``), рабочая диаграмма ``LoadedMagneticCircuit.get_operating_chart`` и
+итерации по МДС возбуждения ``LoadedMagneticCircuit.compute_rotor_flow_iteratively``.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from referenceDesign import COS_PHI, build_design
+from turbo.magneticCircuit import solve_increasing
+
+
+def test_solve_increasing_with_offset():
+    # function(0) = 4, поэтому для значения 3 неотрицательного решения нет
+    solution = solve_increasing(lambda x: x ** 2 + x + 4, np.array([3.0, 4.0, 16.0, 114.0]), np.ones(4))
+
+    assert np.isnan(solution[0])
+    np.testing.assert_allclose(solution[1:], [0, 3, 10], atol=1e-9)
+
+
+def test_solve_increasing_rejects_negative_targets():
+    with pytest.raises(ValueError):
+        solve_increasing(lambda x: x, np.array([-1.0]), np.ones(1))
+
+
+def test_voltage_level_inverts_rotor_current():
+    design = build_design()
+    no_load, rotor = design["no_load"], design["rotor"]
+    # Выше номинального напряжения характеристика из-за скачка при 2.05 Тл в зубцах ротора может быть немонотонной
+    levels = np.array([0.2, 0.6, 0.9, 1.0])
+
+    currents = no_load.get_rotor_current(rotor, levels)
+    np.testing.assert_allclose(no_load.get_voltage_level(rotor, currents), levels, rtol=1e-8)
+
+    zero_current = no_load.get_rotor_current(rotor, np.zeros(1))[0]
+    assert zero_current > 0
+    assert np.isnan(no_load.get_voltage_level(rotor, zero_current / 2))
+
+
+def get_chart(design, levels, cos_phi, **kwargs):
+    no_load, rotor, xs = design["no_load"], design["rotor"], design["reactances"]
+    return design["loaded"].get_operating_chart(rotor, design["bandaging"], design["stator"].length, levels, cos_phi,
+                                                xs.x_stator, xs.x_P, no_load.magnetizing_current,
+                                                no_load.stator_flow, no_load.rotor_current, **kwargs)
+
+
+def test_operating_chart_matches_nominal_point():
+    design = build_design()
+    loaded = design["loaded"]
+    levels, cos_phi = np.array([0.5, 1.0]), np.array([COS_PHI, 0.9, 1.0])
+
+    chart = get_chart(design, levels, cos_phi, excitation="both")
+    assert chart.nominal_field_current.shape == (2, 2, 3)
+    # Первая ось - перевозбуждение и недовозбуждение, вторая - уровни тока, третья - коэффициенты мощности
+    assert chart.nominal_field_current[0, 1, 0] == pytest.approx(loaded.nominal_field_current, rel=1e-12)
+    assert chart.static_overload[0, 1, 0] == pytest.approx(loaded.get_static_overload(COS_PHI), rel=1e-12)
+    assert chart.iteration_count is None
+
+    for index, excitation in enumerate(("over", "under")):
+        single = get_chart(design, levels, cos_phi, excitation=excitation)
+        np.testing.assert_allclose(chart.nominal_field_current[index], single.nominal_field_current, rtol=1e-12)
+        assert np.all(np.sign(single.sin_phi[:, :2]) == (1 if excitation == "over" else -1))
+
+
+def iterate_field_current(design, **kwargs) -> float:
+    loaded, rotor, xs = design["loaded"], design["rotor"], design["reactances"]
+    sin_phi = math.sqrt(1 - COS_PHI ** 2)
+
+    loaded.compute_rotor_flow_iteratively(rotor, design["bandaging"], design["stator"].length, sin_phi, xs.x_P,
+                                          **kwargs)
+    loaded.compute_field_current(rotor.armature.turn_count, sin_phi, xs.x_P)
+    return loaded.nominal_field_current
+
+
+def test_single_iteration_matches_one_pass():
+    design = build_design()
+    one_pass = design["loaded"].nominal_field_current
+
+    assert iterate_field_current(design, max_iterations=1) == pytest.approx(one_pass, rel=1e-12)
+
+
+def test_iterations_converge():
+    design = build_design()
+    loaded = design["loaded"]
+
+    field_current = iterate_field_current(design)
+    assert 1 < loaded.iteration_count < 50
+    assert field_current == pytest.approx(809.23, abs=0.01)
+
+    # Сошедшаяся МДС - неподвижная точка: старт с неё сходится за одну итерацию к тому же значению
+    total_MMF = loaded.total_MMF
+    assert iterate_field_current(design, initial_MMF=total_MMF) == pytest.approx(field_current, rel=1e-7)
+    assert loaded.iteration_count == 1
+
+    with pytest.raises(ValueError):
+        iterate_field_current(design, max_iterations=0)
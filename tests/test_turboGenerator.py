@@ -0,0 +1,84 @@
+"""
+Тесты сквозного расчёта ``TurboGenerator``: полный расчёт и пересчёт после ``update`` должны совпадать с эталонным
+вариантом, рассчитанным по шагам (``build_design``), а кэш --- хранить только нужные этапы.
+"""
+
+import pytest
+
+from common.armatureInsulation import Monolith2New
+from common.designContext import DesignContext
+from common.steelDatabase import M27050AMean, Steel35HN3MFARotor
+from common.wireTypes import PPTA2
+from referenceDesign import (COS_PHI, CURRENT, EXCITER_EFFICIENCY, POLE_PAIRS, VOLTAGE, build_design,
+                             get_nominal_power)
+from turbo.rotor import Shaft, TurboMachineRotorBandaging
+from turbo.turboGenerator import TurboGenerator
+
+NO_LOAD_STAGES = {"stator_armature", "stator", "stator_steel", "rotor_steel", "rotor_armature", "rotor",
+                  "magnetic_geometry", "no_load", "no_load_characteristic"}
+
+
+def make_generator() -> TurboGenerator:
+    with DesignContext():
+        bandaging = TurboMachineRotorBandaging(760, 640, 200, 20, False)
+        shaft = Shaft(journal_length=300, journal_diameter=250, brush_width=25, brush_length=32,
+                      ring_outer_diameter=400, ring_brush_count=8, ring_inner_diameter=380, crossarm_brush_count=8)
+
+    return TurboGenerator(pole_pairs=POLE_PAIRS, voltage=VOLTAGE, current=CURRENT, power_factor=COS_PHI,
+                          stator_steel=M27050AMean(), rotor_steel=Steel35HN3MFARotor(),
+                          stator_outer_diameter=1500, stator_inner_diameter=800, stator_length=1500,
+                          stator_slot_count=48, stator_slot_height=120, stator_slot_width=24, stator_slit_height=1,
+                          stator_wedge_height=8, stator_effective_wires=8, vent_channel_count=20,
+                          vent_channel_width=10, stud_count=12, stud_diameter=30, bypass_thickness=20,
+                          pressure_plate_thickness=40, copper_screen_thickness=5,
+                          rows=2, columns=2, slot_step=20, parallel_branches=2, wire_type=PPTA2,
+                          insulation_type=Monolith2New, arrangement_allowance=0.3, pressing=0.1,
+                          air_gap=40, rotor_inner_diameter=0, rotor_length=1600, rotor_slot_count=24,
+                          rotor_slot_pitch_count=36, rotor_slot_width=32, rotor_wedge_height=20, rotor_wedge_width=36,
+                          rotor_effective_wires=10, rotor_effective_wires_small=7, vert_vent_channel_pitch=60,
+                          vert_vent_channel_length=20, vert_vent_channel_width=8, subslot_channel_height=15,
+                          subslot_channel_width=12, big_tooth_slot_count=4, big_tooth_slot_width=10,
+                          tooth_slot_width=6, tooth_slot_height=40, bandaging=bandaging,
+                          rotor_turn_insulation=0.3, rotor_body_insulation=1.5, rotor_wedge_filling=1.0,
+                          rotor_bottom_filling=1.0, rotor_wire_height=8.0, rotor_wire_width=30.0,
+                          exciter_efficiency=EXCITER_EFFICIENCY, shaft=shaft, slot_rate=1, end_part_rate=1,
+                          slot_velocity=10, end_part_velocity=10, overheat_gen=30, overheat_vent=5)
+
+
+def assert_matches(result, design) -> None:
+    assert result.loaded.nominal_field_current == pytest.approx(design["loaded"].nominal_field_current, rel=1e-12)
+    assert result.losses.get_efficiency(get_nominal_power()) == pytest.approx(
+        design["losses"].get_efficiency(get_nominal_power()), rel=1e-12)
+
+
+def test_full_run_matches_reference():
+    assert_matches(make_generator().run(), build_design())
+
+
+def test_no_load_characteristic_runs_only_no_load_stages():
+    generator = make_generator()
+    result = generator.run("no_load_characteristic")
+
+    assert set(generator.get_cached_stages()) == NO_LOAD_STAGES
+    assert result.losses is None and result.no_load_characteristic is not None
+
+
+def test_update_air_gap():
+    generator = make_generator()
+    generator.run()
+    generator.update(air_gap=45)
+
+    assert set(generator.get_cached_stages()) == {"stator_armature", "stator", "stator_steel", "rotor_steel",
+                                                  "rotor_armature"}
+    assert_matches(generator.run(), build_design(air_gap=45))
+
+
+def test_update_vent_channel_width():
+    generator = make_generator()
+    generator.run()
+    generator.update(vent_channel_width=12)
+
+    cached = set(generator.get_cached_stages())
+    assert {"rotor_armature", "rotor", "stator_armature"} <= cached
+    assert cached.isdisjoint({"stator", "no_load", "loaded", "losses"})
+    assert_matches(generator.run(), build_design(vent_channel_width=12))
@@ -0,0 +1,72 @@
+"""
+Тесты перебора укладки статорной обмотки ``WindingLayoutSearch``: таблица вариантов должна совпадать с тем, что дают
+``CoilArmature.compute_coil_dimensions`` и ``CoilArmature.set_wire`` для каждого сочетания по отдельности.
+"""
+
+import pytest
+
+from common.armatureInsulation import Micafil, Monolith2New
+from common.designContext import DesignContext
+from common.stator import ACMachineStator
+from common.statorArmature import CoilArmature
+from common.wireTypes import PETVSD, PPTA2
+from common.windingLayout import WindingLayoutSearch
+
+ARRANGEMENT_ALLOWANCE = 0.3
+PRESSING = 0.1
+
+
+def make_search(insulation_class, wire_class, voltage: float) -> WindingLayoutSearch:
+    wire = wire_class()
+    armature = CoilArmature(2, 2, 20, 2, insulation_class(wire, voltage, 10), wire)
+    stator = ACMachineStator(1500, 800, 1500, 48, 120, 24, 1, 8, 8, armature)
+    stator.compute_slots_per_pole_phase(1, 3)
+    return WindingLayoutSearch(stator, ARRANGEMENT_ALLOWANCE, PRESSING, effective_wires=range(4, 41, 4))
+
+
+def pick_scalar(search: WindingLayoutSearch, insulation_class, voltage, rows, columns, effective_wires):
+    stator = search.stator
+    armature = stator.armature
+    try:
+        armature.insulation_system = insulation_class(armature.wire, voltage, effective_wires // 2)
+    except ValueError:
+        return None
+
+    armature.rows, armature.columns = rows, columns
+    armature.compute_coil_dimensions(stator.slot_height, stator.slot_width, stator.slit_height, stator.wedge_height,
+                                     ARRANGEMENT_ALLOWANCE)
+    try:
+        armature.set_wire(PRESSING, effective_wires)
+    except ValueError:
+        return None
+
+    return armature.wire.wire_height, armature.wire.wire_width
+
+
+@pytest.mark.parametrize("insulation_class, wire_class, voltage", [(Monolith2New, PPTA2, 10500),
+                                                                   (Micafil, PETVSD, 6600)])
+def test_search_matches_scalar_selection(insulation_class, wire_class, voltage):
+    with DesignContext():
+        search = make_search(insulation_class, wire_class, voltage)
+        table = search.search(412, 50, 1, voltage=voltage)
+        found = {(int(row["rows"]), int(row["columns"]), int(row["effective_wires"])):
+                 (float(row["wire_height"]), float(row["wire_width"])) for row in table}
+
+        for rows in search.rows:
+            for columns in search.columns:
+                for effective_wires in search.effective_wires:
+                    key = (int(rows), int(columns), int(effective_wires))
+                    assert found.get(key) == pick_scalar(search, insulation_class, voltage, *key), key
+
+
+def test_micafil_turn_count_dependence():
+    # При 6600 В изоляция Микафил с проводником ПЭТВСД допустима только для катушек от 10 витков
+    with DesignContext():
+        search = make_search(Micafil, PETVSD, 6600)
+        table = search.search(412, 50, 1, voltage=6600)
+
+        assert table.size > 0
+        assert (table["effective_wires"] >= 20).all()
+
+        with pytest.raises(ValueError):
+            search.search(412, 50, 1)
@@ -0,0 +1,48 @@
+"""
+Тесты подбора стандартных проводников: векторный ``WireDB.pick_wires`` должен давать то же, что и ``pick_wire``.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from common.wireDatabase import WireDB
+
+HEIGHTS = [0.5, 1.0, 2.24, 3.0, 4.75, 5, 5.6, 7.1, 100]
+WIDTHS = [0.5, 2.0, 3.55, 8, 12.5, 16, 16.01, 30, 999, 1000, 2000, math.inf]
+
+
+def pick_scalar(database: WireDB, max_height: float, max_width: float, mode: str):
+    try:
+        return database.pick_wire(max_height, max_width, mode)
+    except ValueError:
+        return math.nan, math.nan, math.nan
+
+
+@pytest.mark.parametrize("mode", ["height", "section"])
+def test_pick_wires_matches_pick_wire(mode):
+    database = WireDB()
+    heights, widths = np.meshgrid(HEIGHTS, WIDTHS, indexing="ij")
+
+    picked = np.stack(database.pick_wires(heights, widths, mode), axis=-1)
+    expected = np.array([[pick_scalar(database, height, width, mode) for width in WIDTHS] for height in HEIGHTS])
+
+    np.testing.assert_array_equal(picked, expected)
+
+
+def test_pick_wires_large_width():
+    # Большая или бесконечная ширина не должна уводить поиск в блок следующей высоты
+    database = WireDB()
+    expected = database.pick_wire(5, math.inf)
+
+    for width in (2000, math.inf):
+        height, width, section = database.pick_wires(np.array([5.0]), np.array([width]))
+        assert (height[0], width[0], section[0]) == expected
+
+
+def test_pick_wires_undefined_size():
+    database = WireDB()
+    heights, widths, sections = database.pick_wires(np.array([np.nan, 5.0, 0.1]), np.array([10.0, np.nan, 10.0]))
+
+    assert np.isnan(heights).all() and np.isnan(widths).all() and np.isnan(sections).all()
@@ -8,8 +8,10 @@
   Класс, описывающий изоляцию обмотки ротора турбомашины.
 """
 
+from common.designContext import DesignSingleton
 
-class TurboMachineRotorInsulation:
+
+class TurboMachineRotorInsulation(DesignSingleton):
     """
     Класс, описывающий изоляцию обмотки ротора турбомашины.
 
@@ -37,21 +39,13 @@ class TurboMachineRotorInsulation:
 
       Возвращает суммарную толщину прокладок в пазу, мм.
 
-    Реализует паттерн «Одиночка».
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
     __slots__ = ["turn_insulation",
                  "body_insulation",
                  "wedge_filling",
                  "bottom_filling"]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self,
                  turn_insulation: float,
                  body_insulation: float,
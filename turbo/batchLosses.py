@@ -0,0 +1,520 @@
+"""
+Модуль, содержащий векторизованный расчёт потерь турбомашин для пакетного расчёта множества вариантов.
+
+Классы:
+
+* ``BatchLosses``
+
+  Класс, рассчитывающий потери и КПД набора турбомашин в виде матрицы «варианты × составляющие потерь».
+"""
+
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from common.batchStator import BatchACMachineStator
+from common.steelDatabase import Steel
+from turbo.batchMagneticCircuit import BatchMagneticCircuit
+from turbo.batchRotor import BatchTurboMachineRotor
+from turbo.losses import phi_beta, phi_gamma
+from turbo.magneticCircuit import Section
+from turbo.rotor import Shaft
+
+
+# Элементарные составляющие потерь - столбцы матрицы, возвращаемой BatchLosses.get_matrix
+COMPONENTS = ("stator_copper",
+              "stator_SC_surface_harmonics",
+              "stator_SC_surface_teeth",
+              "stator_SC_pulse",
+              "rotor_SC_surface_harmonics",
+              "rotor_SC_surface_teeth",
+              "screen_and_plate",
+              "end_part_yoke",
+              "end_part_teeth",
+              "structural_parts",
+              "stator_yoke",
+              "stator_teeth",
+              "stator_OC_surface_harmonics",
+              "stator_OC_surface_teeth",
+              "stator_OC_pulse",
+              "stator_OC_add_pulse",
+              "rotor_add_surface",
+              "end_part_OC_losses",
+              "excitation",
+              "bearings",
+              "rotor_friction",
+              "bandaging_friction",
+              "brush_ring",
+              "brush_crossarm",
+              "ventilation")
+
+
+class BatchLosses:
+    """
+    Класс, рассчитывающий потери `N`:math: вариантов турбомашины по тем же формулам, что и ``Losses``, но сразу для
+    всех вариантов массивами NumPy. Каждая составляющая потерь --- одномерный массив длины `N`:math:, кВт.
+
+    Геометрия берётся из пакетов статоров (``BatchACMachineStator``) и роторов (``BatchTurboMachineRotor``),
+    индукции и коэффициенты зазора --- из пакета магнитных цепей (``BatchMagneticCircuit``). Величины, которых в
+    пакетах нет (массы, параметры обмоток, МДС и токи режима нагрузки), передаются массивами (или числами, общими для
+    всех вариантов). Сталь статора и вал считаются общими для всех вариантов пакета.
+
+    Вместо ветвлений ``Losses`` используются маски: у вариантов без нажимной пластины потери в ней и в крайнем пакете
+    ярма равны нулю. Вместо ``ValueError`` при отрицательном расходе воздуха на вентиляцию или при выходе за таблицы
+    ``phi_gamma`` и ``phi_beta`` (тогда потери получаются ``NaN``) такие варианты отбрасываются маской
+    ``get_valid_mask``.
+
+    Атрибуты:
+
+    * ``freq_reduced: np.ndarray``
+
+      Приведённая частота (частота, делённая на 50 Гц).
+
+    * Составляющие потерь, перечисленные в ``COMPONENTS``, и их суммы ``stator_ohmic``, ``steel_SC_losses``,
+      ``end_part_SC_losses``, ``stator_steel``, ``steel_OC_losses``, ``mechanical: Optional[np.ndarray]``
+
+      То же, что и одноимённые атрибуты ``Losses``. В момент инициализации равны ``None``.
+
+    * ``Field_coefficient: Optional[np.ndarray]``
+
+      Коэффициенты Фильда. В момент инициализации равны ``None``.
+
+    * ``air_flow_rate: Optional[np.ndarray]``
+
+      Расходы воздуха на вентиляцию. В момент инициализации равны ``None``.
+
+    Методы:
+
+    * ``compute_stator_copper_losses(stator, current, phase_count, resistance, rows, columns, wire_width,
+      wire_height) -> None``
+
+      Рассчитывает потери в обмотке статора.
+
+    * ``compute_SC_steel_losses(stator, rotor, mag_circuit, rotor_SC_MMF, stator_teeth_mass, pole_pairs,
+      shortening) -> None``
+
+      Рассчитывает потери в стали при коротком замыкании.
+
+    * ``compute_OC_steel_losses(stator, rotor, mag_circuit, stator_yoke_mass, stator_teeth_mass, pole_pairs, k_x,
+      scr) -> None``
+
+      Рассчитывает потери в стали на холостом ходу.
+
+    * ``compute_end_part_SC_losses(stator, rotor, stator_reaction_MMF, pole_pairs, k_z) -> None``,
+      ``compute_end_part_OC_losses(scr) -> None``
+
+      Рассчитывают потери в торцевой зоне при коротком замыкании и на холостом ходу.
+
+    * ``compute_excitation_losses(nominal_field_current, rotor_resistance, exc_efficiency) -> None``
+
+      Рассчитывает потери на возбуждение.
+
+    * ``compute_mechanical_losses(rotor, bandaging_ring_width, bandaging_diameter, rotor_mass, shaft, pole_pairs,
+      slot_rate, end_part_rate, slot_velocity, end_part_velocity, overheat_gen, overheat_vent) -> None``
+
+      Рассчитывает механические потери.
+
+    * ``get_normal_stator_steel_losses()``, ``get_total_SC_losses()``, ``get_total_OC_losses()``,
+      ``get_total_losses() -> np.ndarray``
+
+      Возвращают суммы потерь, как одноимённые методы ``Losses``.
+
+    * ``get_matrix() -> np.ndarray``
+
+      Возвращает матрицу составляющих потерь формы `(N, C)`:math:, столбцы --- в порядке ``COMPONENTS``.
+
+    * ``get_efficiency(power) -> np.ndarray``
+
+      Возвращает КПД вариантов.
+
+    * ``get_valid_mask() -> np.ndarray``
+
+      Возвращает маску вариантов, для которых ``Losses`` не возбудил бы ``ValueError``.
+    """
+
+    __slots__ = ["__stator_steel",
+                 "freq_reduced",
+                 *COMPONENTS,
+                 "stator_ohmic",
+                 "steel_SC_losses",
+                 "end_part_SC_losses",
+                 "stator_steel",
+                 "steel_OC_losses",
+                 "mechanical",
+                 "Field_coefficient",
+                 "air_flow_rate"
+                 ]
+
+    def __init__(self,
+                 stator_steel: Union[Dict[str, Steel], Steel],
+                 frequency: Union[float, np.ndarray]
+                 ) -> None:
+        """
+        :param stator_steel: Сталь статора. Словарь с ключами ``yoke`` и ``teeth`` либо одна сталь, как у ``Losses``.
+        :param frequency: Номинальная частота, Гц (число или массив).
+        """
+
+        self.__stator_steel = stator_steel
+        self.freq_reduced = np.asarray(frequency, dtype=float) / 50
+
+        # Все потери в киловаттах
+        for name in COMPONENTS:
+            setattr(self, name, None)
+
+        self.stator_ohmic: Optional[np.ndarray] = None  # Омические потери в статоре
+        self.steel_SC_losses: Optional[np.ndarray] = None  # Сумма потерь в стали при КЗ
+        self.end_part_SC_losses: Optional[np.ndarray] = None  # Сумма потерь в торцевой зоне при КЗ
+        self.stator_steel: Optional[np.ndarray] = None  # Полные потери в стали статора при ХХ
+        self.steel_OC_losses: Optional[np.ndarray] = None  # Сумма потерь ХХ
+        self.mechanical: Optional[np.ndarray] = None  # Полные механические потери
+
+        self.Field_coefficient: Optional[np.ndarray] = None  # Коэф-т Фильда / коэф-т добавочных потерь
+        self.air_flow_rate: Optional[np.ndarray] = None  # Расход воздуха на вентиляцию
+
+    def compute_stator_copper_losses(self,
+                                     stator: BatchACMachineStator,
+                                     current: Union[float, np.ndarray],
+                                     phase_count: Union[int, np.ndarray],
+                                     resistance: Union[float, np.ndarray],
+                                     rows: Union[int, np.ndarray],
+                                     columns: Union[int, np.ndarray],
+                                     wire_width: Union[float, np.ndarray],
+                                     wire_height: Union[float, np.ndarray]
+                                     ) -> None:
+        """
+        Метод, рассчитывающий потери в обмотке статора. Пакет статоров не хранит обмотку, поэтому её параметры
+        передаются явно.
+
+        :param stator: Пакет статоров.
+        :param current: Ток в обмотке, А (число или массив).
+        :param phase_count: Количество фаз (число или массив).
+        :param resistance: Сопротивление фазы обмотки при расчётной температуре, Ом (число или массив), например
+            ``CoilArmature.get_resistance(75)``.
+        :param rows: Число горизонтальных рядов элементарных проводников (число или массив).
+        :param columns: Число вертикальных рядов элементарных проводников (число или массив).
+        :param wire_width: Ширина элементарного проводника, мм (число или массив).
+        :param wire_height: Высота элементарного проводника, мм (число или массив).
+        """
+
+        self.stator_ohmic = phase_count * np.asarray(resistance, dtype=float) * np.square(current) / 1e3
+        self.Field_coefficient = 1 + 0.107 * (rows * columns * wire_width * stator.effective_wires
+                                              / stator.slot_width * self.freq_reduced) ** 2 *\
+                                 (np.asarray(wire_height, dtype=float) / 10) ** 4
+        self.stator_copper = self.stator_ohmic * self.Field_coefficient
+
+    def compute_SC_steel_losses(self,
+                                stator: BatchACMachineStator,
+                                rotor: BatchTurboMachineRotor,
+                                mag_circuit: BatchMagneticCircuit,
+                                rotor_SC_MMF: Union[float, np.ndarray],
+                                stator_teeth_mass: Union[float, np.ndarray],
+                                pole_pairs: Union[int, np.ndarray],
+                                shortening: Union[float, np.ndarray]
+                                ) -> None:
+        """
+        Метод, рассчитывающий потери в стали статора и ротора при коротком замыкании.
+
+        :param stator: Пакет статоров. Должна быть рассчитана токовая нагрузка.
+        :param rotor: Пакет роторов.
+        :param mag_circuit: Пакет магнитных цепей.
+        :param rotor_SC_MMF: МДС ротора при коротком замыкании, А (``LoadedMagneticCircuit.rotor_SC_MMF``, число или
+            массив).
+        :param stator_teeth_mass: Масса зубцов статора, кг (число или массив).
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param shortening: Укорочение обмотки статора (число или массив).
+        """
+
+        freq_15 = self.freq_reduced ** 1.5
+        MMF_freq_15 = (rotor_SC_MMF / mag_circuit.air_gap_coef / rotor.air_gap) ** 2 * freq_15
+
+        # Статор
+        self.stator_SC_surface_harmonics = phi_gamma(rotor.surface_relation) * MMF_freq_15 * \
+            stator.effective_length * stator.inner_diameter ** 3 / rotor.outer_diameter ** 3.5 / 10 ** 7.5
+
+        aux = 2 * np.pi * rotor.air_gap / rotor.tooth_pitch
+        k_t2 = (aux / np.sinh(aux)) ** 2
+        phi_Z2 = 5e4 / rotor.surface_relation * (pole_pairs / rotor.slot_pitch_count) ** 2.5
+        self.stator_SC_surface_teeth = phi_Z2 * k_t2 * MMF_freq_15 * stator.effective_length * \
+            stator.inner_diameter ** 3 / np.square(pole_pairs) / 1e18
+
+        self.stator_SC_pulse = 12.5 / rotor.surface_relation * k_t2 * MMF_freq_15 * stator_teeth_mass / \
+            np.sqrt(rotor.slot_pitch_count) / 1e9
+
+        # Ротор
+        self.rotor_SC_surface_harmonics = phi_beta(shortening) * freq_15 * stator.inner_diameter ** 5 / \
+            np.power(pole_pairs, 4) * rotor.length * \
+            (stator.current_load / mag_circuit.air_gap_coef / rotor.air_gap) ** 2 / 1e20
+
+        phi_delta = 62.7 * (stator.get_armature_coefficient(shortening) /
+                            np.sinh(2 * np.pi * rotor.air_gap / stator.tooth_pitch)) ** 2
+        self.rotor_SC_surface_teeth = phi_delta * freq_15 * stator.current_load ** 2 * stator.inner_diameter ** 3 / \
+            np.power(pole_pairs, 1.5) * rotor.length / np.sqrt(stator.slot_count) / 1e16
+
+        self.steel_SC_losses = self.stator_SC_surface_harmonics + self.stator_SC_surface_teeth + \
+            self.stator_SC_pulse + self.rotor_SC_surface_harmonics + self.rotor_SC_surface_teeth
+
+    def compute_OC_steel_losses(self,
+                                stator: BatchACMachineStator,
+                                rotor: BatchTurboMachineRotor,
+                                mag_circuit: BatchMagneticCircuit,
+                                stator_yoke_mass: Union[float, np.ndarray],
+                                stator_teeth_mass: Union[float, np.ndarray],
+                                pole_pairs: Union[int, np.ndarray],
+                                k_x: Union[float, np.ndarray],
+                                scr: Union[float, np.ndarray]
+                                ) -> None:
+        """
+        Метод, рассчитывающий потери в стали на холостом ходу. Потери при коротком замыкании должны быть уже
+        рассчитаны.
+
+        :param stator: Пакет статоров.
+        :param rotor: Пакет роторов.
+        :param mag_circuit: Пакет магнитных цепей холостого хода с рассчитанными индукциями при номинальном
+            напряжении (потоки формы `(N,)`:math:).
+        :param stator_yoke_mass: Масса ярма статора, кг (число или массив).
+        :param stator_teeth_mass: Масса зубцов статора, кг (число или массив).
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param k_x: Коэффициент увеличения потерь в стали (число или массив).
+        :param scr: Отношение короткого замыкания (число или массив).
+        """
+
+        B_yoke = mag_circuit.B_field[..., Section.STATOR_YOKE]
+
+        # Удельные потери, как в Losses: при одной стали на статор зубцы (почему-то) считаются по индукции в ярме
+        if isinstance(self.__stator_steel, dict):
+            W_a = self.__stator_steel["yoke"].losses_curve(B_yoke)
+            W_z = self.__stator_steel["teeth"].losses_curve(mag_circuit.B_field[..., Section.STATOR_TEETH])
+        else:
+            W_a = W_z = self.__stator_steel.losses_curve(B_yoke)
+
+        freq_15 = self.freq_reduced ** 1.5
+
+        self.stator_yoke = 1.3 * k_x * W_a * stator_yoke_mass * freq_15 / 1e3
+        self.stator_teeth = 1.5 * W_z * stator_teeth_mass * freq_15 / 1e3
+
+        scr = np.square(scr)
+        aux = rotor.slot_width / rotor.air_gap
+        gamma_c = aux ** 2 / (aux + 5)
+
+        self.stator_OC_surface_harmonics = self.stator_SC_surface_harmonics * scr
+        self.stator_OC_surface_teeth = self.stator_SC_surface_teeth * scr
+        self.stator_OC_pulse = self.stator_SC_pulse * scr
+        self.stator_OC_add_pulse = W_z * stator_teeth_mass * rotor.surface_relation * \
+            (gamma_c * rotor.air_gap * rotor.slot_pitch_count * self.freq_reduced /
+             2 / stator.tooth_pitch / pole_pairs) ** 2 / 1e3
+
+        self.stator_steel = self.stator_yoke + self.stator_teeth + self.stator_OC_surface_harmonics + \
+            self.stator_OC_surface_teeth + self.stator_OC_pulse + self.stator_OC_add_pulse
+
+        # Коэффициент зазора от зубчатости статора, как в BatchMagneticCircuit.from_batch. Пакет цепей хранит только
+        # полный коэффициент зазора
+        stator_teeth_air_gap_coef = 1 + stator.slot_width ** 2 / \
+            (stator.tooth_pitch * (stator.slot_width + 5 * rotor.air_gap) - stator.slot_width ** 2)
+
+        self.rotor_add_surface = 5.1 / np.sqrt(stator.slot_count) * stator.effective_length * freq_15 * \
+            stator.inner_diameter ** 3 / np.power(pole_pairs, 1.5) * \
+            (mag_circuit.B_field[..., Section.AIR_GAP] * (stator_teeth_air_gap_coef - 1)) ** 2 / 1e8
+
+        self.steel_OC_losses = self.stator_steel + self.rotor_add_surface
+
+    def compute_end_part_SC_losses(self,
+                                   stator: BatchACMachineStator,
+                                   rotor: BatchTurboMachineRotor,
+                                   stator_reaction_MMF: Union[float, np.ndarray],
+                                   pole_pairs: Union[int, np.ndarray],
+                                   k_z: Union[int, np.ndarray]
+                                   ) -> None:
+        """
+        Метод, рассчитывающий потери в торцевой зоне при коротком замыкании. У вариантов без нажимной пластины потери
+        в ней и в крайнем пакете ярма равны нулю.
+
+        :param stator: Пакет статоров. Должна быть рассчитана токовая нагрузка.
+        :param rotor: Пакет роторов.
+        :param stator_reaction_MMF: МДС реакции якоря, А (``LoadedMagneticCircuit.stator_reaction_MMF``, число или
+            массив).
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param k_z: Число разбиений крайнего пакета (число или массив).
+        """
+
+        yoke_height = stator.get_yoke_height()
+        freq_15 = self.freq_reduced ** 1.5
+
+        self.structural_parts = (stator.current_load * stator.inner_diameter) ** 2 / 1e11
+        b_z = (stator.tooth_pitch + stator.get_tooth_pitch_bottom()) / 2 - stator.slot_width
+        self.end_part_teeth = 0.21 * stator.slot_count / k_z * \
+            (b_z * stator_reaction_MMF * stator.slot_height / (stator.slot_height + rotor.slot_height)) ** 2 * \
+            freq_15 / 1e13
+
+        # Толщины отсутствующих пластин и экранов в пакете статоров равны нулю, так что у вариантов без пластины
+        # формулы дают деление на ноль - считаем их для всех, а потом зануляем
+        plate = stator.pressure_plate_thickness
+        screen = stator.copper_screen_thickness
+        with np.errstate(divide="ignore", invalid="ignore"):
+            beta = np.pi / 10 * np.sqrt(plate / yoke_height * self.freq_reduced * (1 + screen / plate))
+            phi_beta_plate = 155 * (10 / beta) ** 2 / yoke_height
+
+            screen_and_plate = phi_beta_plate * (0.16 * plate + 3.2 * screen) / \
+                (stator.outer_diameter - 2 * yoke_height) * \
+                (stator_reaction_MMF * self.freq_reduced / beta / pole_pairs) ** 2 / 1e11
+            end_part_yoke = 0.015 * yoke_height * np.square(stator_reaction_MMF) / beta / np.power(pole_pairs, 3) * \
+                freq_15 / 1e10
+
+        self.screen_and_plate = np.where(stator.has_pressure_plate, screen_and_plate, 0)
+        self.end_part_yoke = np.where(stator.has_pressure_plate, end_part_yoke, 0)
+
+        self.end_part_SC_losses = self.end_part_teeth + self.structural_parts + self.screen_and_plate + \
+            self.end_part_yoke
+
+    def compute_end_part_OC_losses(self,
+                                   scr: Union[float, np.ndarray]
+                                   ) -> None:
+        """
+        Метод, рассчитывающий потери в торцевой зоне на холостом ходу.
+
+        :param scr: Отношение короткого замыкания (число или массив).
+        """
+
+        self.end_part_OC_losses = self.end_part_SC_losses * np.square(scr)
+
+    def compute_excitation_losses(self,
+                                  nominal_field_current: Union[float, np.ndarray],
+                                  rotor_resistance: Union[float, np.ndarray],
+                                  exc_efficiency: Union[float, np.ndarray]
+                                  ) -> None:
+        """
+        Метод, рассчитывающий потери на возбуждение.
+
+        :param nominal_field_current: Номинальный ток возбуждения, А (число или массив).
+        :param rotor_resistance: Сопротивление обмотки ротора при расчётной температуре, Ом (число или массив),
+            например ``TurboMachineRotorArmature.get_resistance(75)``.
+        :param exc_efficiency: КПД возбудителя (число или массив).
+        """
+
+        self.excitation = (np.square(nominal_field_current) * rotor_resistance + 2 * nominal_field_current) / \
+            exc_efficiency / 1e3
+
+    def compute_mechanical_losses(self,
+                                  rotor: BatchTurboMachineRotor,
+                                  bandaging_ring_width: Union[float, np.ndarray],
+                                  bandaging_diameter: Union[float, np.ndarray],
+                                  rotor_mass: Union[float, np.ndarray],
+                                  shaft: Shaft,
+                                  pole_pairs: Union[int, np.ndarray],
+                                  slot_rate: Union[float, np.ndarray],
+                                  end_part_rate: Union[float, np.ndarray],
+                                  slot_velocity: Union[float, np.ndarray],
+                                  end_part_velocity: Union[float, np.ndarray],
+                                  overheat_gen: Union[float, np.ndarray],
+                                  overheat_vent: Union[float, np.ndarray]
+                                  ) -> None:
+        """
+        Метод, рассчитывающий механические потери. Расход воздуха на вентиляцию зависит от всех прочих потерь,
+        поэтому они должны быть уже рассчитаны.
+
+        :param rotor: Пакет роторов.
+        :param bandaging_ring_width: Ширина бандажного кольца, мм (число или массив).
+        :param bandaging_diameter: Внешний диаметр бандажного кольца, мм (число или массив).
+        :param rotor_mass: Масса ротора, кг (число или массив).
+        :param shaft: Вал, общий для всех вариантов.
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param slot_rate: См. ``Losses.compute_mechanical_losses`` (число или массив).
+        :param end_part_rate: См. ``Losses.compute_mechanical_losses`` (число или массив).
+        :param slot_velocity: См. ``Losses.compute_mechanical_losses`` (число или массив).
+        :param end_part_velocity: См. ``Losses.compute_mechanical_losses`` (число или массив).
+        :param overheat_gen: Превышение температуры воздуха в генераторе, °C (число или массив).
+        :param overheat_vent: Превышение температуры воздуха в вентиляторе, °C (число или массив).
+        """
+
+        freq_p = self.freq_reduced / pole_pairs
+
+        self.bearings = 255 * np.sqrt(rotor_mass * shaft.journal_length / 2) * \
+            (freq_p * shaft.journal_diameter) ** 1.5 / 10 ** 7.5
+
+        self.rotor_friction = 57.3 * freq_p ** 3 * rotor.length * rotor.outer_diameter ** 4 / 1e15
+        self.bandaging_friction = 25 * freq_p ** 3 * bandaging_ring_width * np.power(bandaging_diameter, 4) / 1e15
+
+        aux = freq_p * shaft.brush_width * shaft.brush_length / 2
+        self.brush_ring = shaft.ring_outer_diameter * shaft.ring_brush_count * aux / 1e6
+        self.brush_crossarm = shaft.ring_inner_diameter * shaft.crossarm_brush_count * aux / 1e6
+
+        channel = (slot_velocity * np.asarray(slot_rate, dtype=float) + end_part_velocity * end_part_rate) / 10
+        self.air_flow_rate = (self.get_total_SC_losses() + self.get_total_OC_losses() + self.excitation +
+                              self.rotor_friction + self.bandaging_friction + channel) / 1.1 / \
+            (np.asarray(overheat_gen, dtype=float) - overheat_vent)
+        self.ventilation = 1.1 * self.air_flow_rate * overheat_vent
+
+        # Потери на трение щёток о кольцо учитываются дважды, как в Losses
+        self.mechanical = self.rotor_friction + self.bandaging_friction + 2 * self.brush_ring + self.bearings + \
+            self.ventilation
+
+    def get_normal_stator_steel_losses(self) -> np.ndarray:
+        """
+        Метод, возвращающий потери в ярме и зубцах статора без добавочных.
+
+        :return: Потери, кВт.
+        """
+
+        return self.stator_yoke + self.stator_teeth
+
+    def get_total_SC_losses(self) -> np.ndarray:
+        """
+        Метод, возвращающий полные потери короткого замыкания.
+
+        :return: Потери, кВт.
+        """
+
+        return self.stator_copper + self.steel_SC_losses + self.end_part_SC_losses
+
+    def get_total_OC_losses(self) -> np.ndarray:
+        """
+        Метод, возвращающий полные потери холостого хода.
+
+        :return: Потери, кВт.
+        """
+
+        return self.stator_steel + self.rotor_add_surface + self.end_part_OC_losses
+
+    def get_total_losses(self) -> np.ndarray:
+        """
+        Метод, возвращающий полные потери, по которым считается КПД. Это не сумма строки матрицы ``get_matrix``:
+        как и в ``Losses``, потери на траверсе в них не входят, а потери на кольце входят дважды.
+
+        :return: Потери, кВт.
+        """
+
+        return self.get_total_SC_losses() + self.get_total_OC_losses() + self.excitation + self.mechanical
+
+    def get_matrix(self) -> np.ndarray:
+        """
+        Метод, возвращающий все элементарные составляющие потерь одной матрицей.
+
+        :return: Потери, кВт. Массив формы `(N, C)`:math:, столбцы --- в порядке ``COMPONENTS``.
+        """
+
+        return np.column_stack(np.broadcast_arrays(*(getattr(self, name) for name in COMPONENTS)))
+
+    def get_efficiency(self,
+                       power: Union[float, np.ndarray]
+                       ) -> np.ndarray:
+        """
+        Метод, возвращающий КПД вариантов.
+
+        :param power: Номинальная активная мощность, кВт (число или массив).
+        :return: КПД, о. е.
+        """
+
+        return power / (power + self.get_total_losses())
+
+    def get_valid_mask(self) -> np.ndarray:
+        """
+        Метод, возвращающий маску вариантов с неотрицательным расходом воздуха на вентиляцию. Расход не определён
+        (``NaN``) у вариантов, вышедших за таблицы ``phi_gamma`` и ``phi_beta``, и они тоже считаются недопустимыми.
+        Это те же условия, при нарушении которых ``Losses`` возбуждает ``ValueError``.
+
+        :return: Логический массив, ``True`` для допустимых вариантов.
+        """
+
+        return self.air_flow_rate >= 0
+
+
+__all__ = ["COMPONENTS", "BatchLosses"]
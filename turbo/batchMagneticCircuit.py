@@ -0,0 +1,572 @@
+"""
+Модуль, содержащий векторизованный расчёт магнитной цепи турбомашин для пакетного расчёта множества вариантов.
+
+Классы:
+
+* ``BatchMagneticCircuit``
+
+  Класс, описывающий магнитные цепи набора турбомашин в виде двумерных массивов «варианты × участки цепи».
+"""
+
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from common.batchStator import BatchACMachineStator
+from common.steelDatabase import Steel
+from turbo.batchRotor import BatchTurboMachineRotor
+from turbo.magneticCircuit import (ROTOR_SECTIONS, ROTOR_TEETH_SECTIONS, SECTION_NAMES, STATOR_SECTIONS,
+                                   MagneticCircuit, Section, solve_increasing)
+
+
+# Порядок участков магнитной цепи по последней оси массивов - тот же, что и у MagneticCircuit (см. Section)
+SECTIONS = SECTION_NAMES
+
+_STATOR = STATOR_SECTIONS  # Участки статора (вместе с зазором)
+_ROTOR = ROTOR_SECTIONS  # Участки ротора
+_ROTOR_TEETH = ROTOR_TEETH_SECTIONS  # Участки зубцов ротора, для которых есть коэффициенты ответвления потока
+
+
+class BatchMagneticCircuit:
+    """
+    Класс, описывающий магнитные цепи `N`:math: вариантов турбомашины. Длины магнитных линий, сечения и индукции,
+    напряжённости и МДС хранятся в массивах той же раскладки, что и у ``MagneticCircuit``, но с первой осью по
+    вариантам: последняя ось соответствует участкам цепи в порядке ``Section`` (названия --- ``SECTIONS``).
+    Отсутствующие у варианта участки (зубцы в области подпазовых каналов) обозначаются ``NaN`` и не учитываются в
+    суммарных МДС.
+
+    Потоки могут быть заданы массивом формы `(N,)`:math: --- по значению на вариант --- или `(N, M)`:math: --- по
+    `M`:math: значений на вариант (например, для нескольких уровней напряжения). Индукции, напряжённости и МДС тогда
+    имеют форму `(N, 8)`:math: или `(N, M, 8)`:math: соответственно, а суммарные МДС и токи --- форму потока.
+
+    Стали считаются общими для всех вариантов пакета.
+
+    Атрибуты:
+
+    * ``stator_steel: Union[Dict[str, Steel], Steel]``
+
+      Сталь статора. Словарь с ключами ``yoke`` и ``teeth`` либо одна сталь, как у ``MagneticCircuit``.
+
+    * ``rotor_steel: Steel``
+
+      Сталь ротора.
+
+    * ``lines: np.ndarray``
+
+      Длины магнитных линий на участках цепи, см. Форма `(N, 8)`:math:.
+
+    * ``sections: np.ndarray``
+
+      Сечения участков цепи, м². Форма `(N, 8)`:math:.
+
+    * ``rotor_branching_factors: np.ndarray``
+
+      Коэффициенты ответвления потока в пазы ротора для участков зубцов ротора. Форма `(N, 4)`:math:.
+
+    * ``air_gap_coef: np.ndarray``
+
+      Коэффициенты воздушного зазора.
+
+    * ``lambda_2: np.ndarray``
+
+      Магнитные проводимости для поперечно-пазового рассеяния.
+
+    * ``stator_flow``, ``rotor_flow``, ``phi_s: Optional[np.ndarray]``
+
+      Потоки статора и ротора и поперечно-пазовый поток рассеяния, Вб. В момент инициализации равны ``None``.
+
+    * ``B_field``, ``H_field``, ``MMF: Optional[np.ndarray]``
+
+      Индукции, Тл, напряжённости, А/см, и МДС, А, по участкам цепи. В момент инициализации равны ``None``.
+
+    * ``stator_MMF``, ``total_MMF: Optional[np.ndarray]``
+
+      МДС на статор и полная МДС, А. В момент инициализации равны ``None``.
+
+    * ``rotor_current``, ``magnetizing_current: Optional[np.ndarray]``
+
+      Токи ротора и намагничивания на холостом ходу, А. В момент инициализации равны ``None``.
+
+    Методы:
+
+    * ``from_batch(stator, rotor, stator_steel, rotor_steel, pole_pairs, wedge_filling, body_insulation, fillings)``
+
+      Собирает магнитные цепи по пакетам статоров и роторов.
+
+    * ``from_circuits(circuits: Sequence[MagneticCircuit]) -> BatchMagneticCircuit``
+
+      Собирает пакет из набора обычных магнитных цепей.
+
+    * ``compute_stator_flow(voltage, frequency, stator_turn_count, stator_armature_coefficient) -> None``
+
+      Вычисляет потоки статора на холостом ходу.
+
+    * ``compute_rotor_flow(phi_b=0) -> None``
+
+      Вычисляет потоки ротора на холостом ходу.
+
+    * ``compute_stator_B_fields``, ``compute_stator_H_fields``, ``compute_stator_MMF``, ``compute_rotor_B_fields``,
+      ``compute_rotor_H_fields``, ``compute_rotor_MMF``
+
+      Аналоги одноимённых методов ``MagneticCircuit``.
+
+    * ``compute_rotor_currents(rotor_turn_count) -> None``
+
+      Вычисляет токи ротора и намагничивания на холостом ходу.
+
+    * ``compute_no_load(stator_flow, rotor_surface_relation, rotor_turn_count, phi_b=0,
+      rotor_yoke_saturation_factor=1) -> None``
+
+      Выполняет весь расчёт магнитной цепи холостого хода за один вызов.
+
+    * ``get_no_load_characteristic(stator_flow, rotor_surface_relation, rotor_turn_count, phi_b=0,
+      rotor_yoke_saturation_factor=1, points=30, max_level=1.2, min_level=0) -> Tuple[np.ndarray, np.ndarray]``
+
+      Возвращает характеристики холостого хода всех вариантов одним двумерным массивом.
+
+    * ``get_rotor_current(stator_flow, rotor_surface_relation, rotor_turn_count, voltage_levels, phi_b=0,
+      rotor_yoke_saturation_factor=1) -> np.ndarray``
+
+      Возвращает токи ротора на холостом ходу при произвольных уровнях напряжения.
+
+    * ``get_voltage_level(stator_flow, rotor_surface_relation, rotor_turn_count, rotor_current, phi_b=0,
+      rotor_yoke_saturation_factor=1, tolerance=1e-10, max_iterations=50) -> np.ndarray``
+
+      Возвращает уровни напряжения холостого хода, при которых токи ротора равны заданным.
+    """
+
+    __slots__ = ["stator_steel",
+                 "rotor_steel",
+                 "lines",
+                 "sections",
+                 "rotor_branching_factors",
+                 "air_gap_coef",
+                 "lambda_2",
+                 "stator_flow",
+                 "rotor_flow",
+                 "phi_s",
+                 "B_field",
+                 "H_field",
+                 "MMF",
+                 "stator_MMF",
+                 "total_MMF",
+                 "rotor_current",
+                 "magnetizing_current"
+                 ]
+
+    def __init__(self,
+                 lines: Union[np.ndarray, Sequence[np.ndarray]],
+                 sections: Union[np.ndarray, Sequence[np.ndarray]],
+                 rotor_branching_factors: Union[np.ndarray, Sequence[np.ndarray]],
+                 air_gap_coef: Union[float, np.ndarray, Sequence[float]],
+                 lambda_2: Union[float, np.ndarray, Sequence[float]],
+                 stator_steel: Union[Dict[str, Steel], Steel],
+                 rotor_steel: Steel
+                 ) -> None:
+        self.stator_steel = stator_steel
+        self.rotor_steel = rotor_steel
+
+        self.lines = np.atleast_2d(np.asarray(lines, dtype=float))
+        self.sections = np.atleast_2d(np.asarray(sections, dtype=float))
+        self.rotor_branching_factors = np.atleast_2d(np.asarray(rotor_branching_factors, dtype=float))
+        self.air_gap_coef = np.atleast_1d(np.asarray(air_gap_coef, dtype=float))
+        self.lambda_2 = np.atleast_1d(np.asarray(lambda_2, dtype=float))
+
+        self.stator_flow: Optional[np.ndarray] = None  # Поток статора, Вб
+        self.rotor_flow: Optional[np.ndarray] = None  # Поток ротора, Вб
+        self.phi_s: Optional[np.ndarray] = None  # Поперечно-пазовый поток рассеяния
+
+        self.B_field: Optional[np.ndarray] = None  # Индукции, Тл
+        self.H_field: Optional[np.ndarray] = None  # Напряжённости, А/см
+        self.MMF: Optional[np.ndarray] = None  # МДС, А
+
+        self.stator_MMF: Optional[np.ndarray] = None  # МДС на статор, А
+        self.total_MMF: Optional[np.ndarray] = None  # Полная МДС, А
+
+        self.rotor_current: Optional[np.ndarray] = None  # Ток ротора на холостом ходу, А
+        self.magnetizing_current: Optional[np.ndarray] = None  # Ток намагничивания, А
+
+    @classmethod
+    def from_batch(cls,
+                   stator: BatchACMachineStator,
+                   rotor: BatchTurboMachineRotor,
+                   stator_steel: Union[Dict[str, Steel], Steel],
+                   rotor_steel: Steel,
+                   pole_pairs: Union[int, np.ndarray],
+                   wedge_filling: Union[float, np.ndarray],
+                   body_insulation: Union[float, np.ndarray],
+                   fillings: Union[float, np.ndarray]
+                   ) -> "BatchMagneticCircuit":
+        """
+        Метод, собирающий магнитные цепи по пакетам статоров и роторов. Статоры и роторы должны быть полностью
+        рассчитаны (деления, эффективная длина, глубины пазов, отношения обмотанной поверхности). Параметры изоляции
+        ротора передаются явно, поскольку пакет ротора не хранит обмотку.
+
+        :param stator: Пакет статоров.
+        :param rotor: Пакет роторов.
+        :param stator_steel: Сталь статора.
+        :param rotor_steel: Сталь ротора.
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param wedge_filling: Толщина прокладки под клин в пазу ротора, мм (число или массив).
+        :param body_insulation: Толщина корпусной изоляции ротора, мм (число или массив).
+        :param fillings: Суммарная толщина прокладок в пазу ротора, мм (число или массив).
+        :return: Пакет магнитных цепей.
+        """
+
+        rotor_tooth_line = rotor.get_tooth_half_magnetic_line()
+        rotor_tooth_slot_line = rotor.get_tooth_slot_half_magnetic_line().filled(np.nan)
+
+        lines = np.column_stack([rotor.air_gap * 0.1,
+                                 stator.get_yoke_magnetic_line(pole_pairs, rotor.surface_relation),
+                                 stator.get_tooth_magnetic_line(),
+                                 rotor.get_yoke_magnetic_line(pole_pairs),
+                                 rotor_tooth_line,
+                                 rotor_tooth_line,
+                                 rotor_tooth_slot_line,
+                                 rotor_tooth_slot_line])
+
+        sections = np.column_stack([rotor.get_air_gap_section(pole_pairs, stator.length),
+                                    2 * stator.get_yoke_section(stator.effective_length),
+                                    stator.get_teeth_section_third(stator.effective_length),
+                                    2 * rotor.get_yoke_section(),
+                                    rotor.get_teeth_section_02(pole_pairs),
+                                    rotor.get_teeth_section_07(pole_pairs),
+                                    rotor.get_teeth_section_slot_02(pole_pairs).filled(np.nan),
+                                    rotor.get_teeth_section_slot_07(pole_pairs).filled(np.nan)])
+
+        factors = np.column_stack([rotor.get_flow_branching_factor_02(),
+                                   rotor.get_flow_branching_factor_07(),
+                                   rotor.get_flow_branching_factor_slot_02().filled(np.nan),
+                                   rotor.get_flow_branching_factor_slot_07().filled(np.nan)])
+
+        # Коэффициенты воздушного зазора, как в MagneticCircuit. Размеры отсутствующих каналов и шунтов у пакета
+        # статоров равны нулю, а коэффициент от каналов тогда обращается в единицу сам собой
+        stator_teeth_coef = 1 + stator.slot_width ** 2 / \
+            (stator.tooth_pitch * (stator.slot_width + 5 * rotor.air_gap) - stator.slot_width ** 2)
+
+        package_width = (stator.length - stator.vent_channel_width * stator.vent_channel_count -
+                         2 * stator.bypass_thickness) / (stator.vent_channel_count + 1)
+        stator_vent_coef = 1 + stator.vent_channel_width ** 2 / \
+            ((stator.vent_channel_width + package_width) * (5 * rotor.air_gap + stator.vent_channel_width) -
+             stator.vent_channel_width ** 2)
+
+        stator_step_coef = 1 + 5 / np.sqrt(rotor.air_gap * (stator.length + rotor.length) / 2)
+
+        rotor_teeth_coef = 1 + rotor.surface_relation / 2 * rotor.slot_width ** 2 / \
+            (rotor.tooth_pitch * (rotor.slot_width + 5 * rotor.air_gap) - rotor.slot_width ** 2)
+
+        air_gap_coef = stator_teeth_coef + stator_vent_coef + stator_step_coef + rotor_teeth_coef - 3
+
+        lambda_2 = rotor.length * pole_pairs / rotor.slot_count * \
+            ((rotor.slot_height - rotor.wedge_height - fillings - body_insulation) / 2 / rotor.slot_width +
+             (wedge_filling + rotor.wedge_height) / rotor.wedge_width +
+             rotor.air_gap / (2 * rotor.tooth_pitch + rotor.air_gap / 2))
+
+        return cls(lines, sections, factors, air_gap_coef, lambda_2, stator_steel, rotor_steel)
+
+    @classmethod
+    def from_circuits(cls,
+                      circuits: Sequence[MagneticCircuit]
+                      ) -> "BatchMagneticCircuit":
+        """
+        Метод, собирающий пакет из набора обычных магнитных цепей. Стали берутся у первой цепи набора.
+
+        :param circuits: Набор магнитных цепей.
+        :return: Пакет магнитных цепей.
+        """
+
+        # Раскладка по участкам у обычной цепи та же, так что достаточно сложить её массивы один на другой
+        return cls([circuit.geometry.lines for circuit in circuits],
+                   [circuit.geometry.sections for circuit in circuits],
+                   [circuit.geometry.rotor_branching_factors for circuit in circuits],
+                   [circuit.air_gap_coef for circuit in circuits],
+                   [circuit.lambda_2 for circuit in circuits],
+                   circuits[0].stator_steel, circuits[0].rotor_steel)
+
+    def __expand(self,
+                 value: Union[float, np.ndarray]
+                 ) -> np.ndarray:
+        """
+        Вспомогательный метод, добавляющий к массиву по вариантам оси, недостающие до формы потока, чтобы он правильно
+        транслировался на потоки формы `(N, M)`:math:.
+
+        :param value: Число или массив формы `(N,)`:math: или `(N, K)`:math:.
+        :return: Массив, согласованный по форме с потоком статора.
+        """
+
+        value = np.asarray(value, dtype=float)
+        extra = np.ndim(self.stator_flow) - 1
+        if value.ndim == 0 or extra <= 0:
+            return value
+
+        return value.reshape(value.shape[:1] + (1,) * extra + value.shape[1:])
+
+    def compute_stator_flow(self,
+                            voltage: Union[float, np.ndarray],
+                            frequency: Union[float, np.ndarray],
+                            stator_turn_count: Union[float, np.ndarray],
+                            stator_armature_coefficient: Union[float, np.ndarray]
+                            ) -> None:
+        """
+        Метод, рассчитывающий потоки статоров на холостом ходу.
+
+        :param voltage: Номинальное линейное напряжение, В (число или массив).
+        :param frequency: Номинальная частота, Гц (число или массив).
+        :param stator_turn_count: Число витков обмотки статора (число или массив).
+        :param stator_armature_coefficient: Обмоточный коэффициент статора (число или массив).
+        """
+
+        self.stator_flow = 0.13 * np.asarray(voltage, dtype=float) / frequency / stator_turn_count / \
+            stator_armature_coefficient
+
+    def compute_rotor_flow(self,
+                           phi_b: Union[float, np.ndarray] = 0
+                           ) -> None:
+        """
+        Метод, рассчитывающий потоки роторов на холостом ходу.
+
+        :param phi_b: Поток рассеяния через бандажи, Вб (число или массив). Для немагнитных бандажей равен нулю.
+        """
+
+        self.phi_s = self.__expand(self.lambda_2) * self.stator_MMF * 1e-8
+        self.rotor_flow = self.stator_flow + self.phi_s + phi_b
+
+    def compute_stator_B_fields(self) -> None:
+        """
+        Метод, рассчитывающий индукции на участках статора и в зазоре.
+        """
+
+        self.B_field = np.full(np.shape(self.stator_flow) + (len(SECTIONS),), np.nan)
+        self.B_field[..., _STATOR] = self.stator_flow[..., None] / self.__expand(self.sections[:, _STATOR])
+
+    def compute_stator_H_fields(self,
+                                rotor_surface_relation: Union[float, np.ndarray]
+                                ) -> None:
+        """
+        Метод, рассчитывающий напряжённости на участках статора и МДС зазора.
+
+        :param rotor_surface_relation: Отношение обмотанной поверхности ротора к полной (число или массив).
+        """
+
+        relation = self.__expand(rotor_surface_relation)
+        stator_yoke_eff_B = self.B_field[..., Section.STATOR_YOKE] * (18 - 10 * relation) / (18 - 9 * relation)
+
+        if type(self.stator_steel) is dict:
+            yoke_steel, teeth_steel = self.stator_steel["yoke"], self.stator_steel["teeth"]
+        else:
+            yoke_steel = teeth_steel = self.stator_steel
+
+        self.H_field = np.full_like(self.B_field, np.nan)
+        self.H_field[..., Section.AIR_GAP] = 8e3 * self.__expand(self.air_gap_coef) *\
+                                             self.B_field[..., Section.AIR_GAP]
+        self.H_field[..., Section.STATOR_YOKE] = yoke_steel.BH_curve(stator_yoke_eff_B)
+        self.H_field[..., Section.STATOR_TEETH] = teeth_steel.BH_curve(self.B_field[..., Section.STATOR_TEETH])
+
+    def compute_stator_MMF(self) -> None:
+        """
+        Метод, рассчитывающий МДС на участках статора и в зазоре, а также МДС на статор.
+        """
+
+        self.MMF = self.H_field * self.__expand(self.lines)
+        self.stator_MMF = self.MMF[..., _STATOR].sum(axis=-1)
+
+    def compute_rotor_B_fields(self) -> None:
+        """
+        Метод, рассчитывающий индукции на участках ротора.
+        """
+
+        self.B_field[..., _ROTOR] = self.rotor_flow[..., None] / self.__expand(self.sections[:, _ROTOR])
+
+    def compute_rotor_H_fields(self,
+                               rotor_yoke_saturation_factor: Union[float, np.ndarray] = 1
+                               ) -> None:
+        """
+        Метод, рассчитывающий напряжённости на участках ротора.
+
+        :param rotor_yoke_saturation_factor: Коэффициент насыщения ярма ротора (число или массив).
+        """
+
+        self.H_field[..., Section.ROTOR_YOKE] = self.rotor_steel.BH_curve(self.B_field[..., Section.ROTOR_YOKE]) * \
+            self.__expand(rotor_yoke_saturation_factor)
+
+        # Выше 2.05 Тл кривая намагничивания заменяется прямой с учётом ответвления потока в паз, как в MagneticCircuit
+        b_field = self.B_field[..., _ROTOR_TEETH]
+        saturated = (b_field - 1.956) * 5.2 / (8 + 6.5 * self.__expand(self.rotor_branching_factors)) * 1e4
+        self.H_field[..., _ROTOR_TEETH] = np.where(b_field > 2.05, saturated, self.rotor_steel.BH_curve(b_field))
+
+    def compute_rotor_MMF(self) -> None:
+        """
+        Метод, рассчитывающий МДС на участках ротора и полную МДС.
+        """
+
+        self.MMF[..., _ROTOR] = self.H_field[..., _ROTOR] * self.__expand(self.lines[:, _ROTOR])
+        self.total_MMF = np.nansum(self.MMF, axis=-1)
+
+    def compute_rotor_currents(self,
+                               rotor_turn_count: Union[float, np.ndarray]
+                               ) -> None:
+        """
+        Метод, рассчитывающий токи ротора и намагничивания на холостом ходу.
+
+        :param rotor_turn_count: Число витков обмотки ротора (число или массив).
+        """
+
+        turn_count = self.__expand(rotor_turn_count)
+
+        self.rotor_current = self.total_MMF / turn_count
+        self.magnetizing_current = self.MMF[..., Section.AIR_GAP] / turn_count
+
+    def compute_no_load(self,
+                        stator_flow: Union[float, np.ndarray],
+                        rotor_surface_relation: Union[float, np.ndarray],
+                        rotor_turn_count: Union[float, np.ndarray],
+                        phi_b: Union[float, np.ndarray] = 0,
+                        rotor_yoke_saturation_factor: Union[float, np.ndarray] = 1
+                        ) -> None:
+        """
+        Метод, выполняющий весь расчёт магнитной цепи холостого хода при заданных потоках статора в том же порядке,
+        что и для ``NoLoadMagneticCircuit``.
+
+        :param stator_flow: Потоки статора, Вб. Массив формы `(N,)`:math: или `(N, M)`:math:.
+        :param rotor_surface_relation: Отношение обмотанной поверхности ротора к полной (число или массив).
+        :param rotor_turn_count: Число витков обмотки ротора (число или массив).
+        :param phi_b: Поток рассеяния через бандажи, Вб (число или массив той же формы, что и поток).
+        :param rotor_yoke_saturation_factor: Коэффициент насыщения ярма ротора (число или массив).
+        """
+
+        self.stator_flow = np.asarray(stator_flow, dtype=float)
+
+        self.compute_stator_B_fields()
+        self.compute_stator_H_fields(rotor_surface_relation)
+        self.compute_stator_MMF()
+        self.compute_rotor_flow(phi_b)
+        self.compute_rotor_B_fields()
+        self.compute_rotor_H_fields(rotor_yoke_saturation_factor)
+        self.compute_rotor_MMF()
+        self.compute_rotor_currents(rotor_turn_count)
+
+    def get_no_load_characteristic(self,
+                                   stator_flow: Union[float, np.ndarray],
+                                   rotor_surface_relation: Union[float, np.ndarray],
+                                   rotor_turn_count: Union[float, np.ndarray],
+                                   phi_b: Union[float, np.ndarray] = 0,
+                                   rotor_yoke_saturation_factor: Union[float, np.ndarray] = 1,
+                                   points: int = 30,
+                                   max_level: float = 1.2,
+                                   min_level: float = 0
+                                   ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Метод, возвращающий характеристики холостого хода всех вариантов пакета, как
+        ``NoLoadMagneticCircuit.get_no_load_characteristic``. Атрибуты пакета при этом не изменяются.
+
+        :param stator_flow: Номинальные потоки статора, Вб. Массив формы `(N,)`:math:.
+        :param rotor_surface_relation: Отношение обмотанной поверхности ротора к полной (число или массив).
+        :param rotor_turn_count: Число витков обмотки ротора (число или массив).
+        :param phi_b: Номинальный поток рассеяния через бандажи, Вб (число или массив).
+        :param rotor_yoke_saturation_factor: Коэффициент насыщения ярма ротора (число или массив).
+        :param points: Число точек характеристики.
+        :param max_level: Наибольшее напряжение в долях номинального.
+        :param min_level: Наименьшее напряжение в долях номинального.
+        :return: Токи ротора формы `(N, points)`:math:, А, и уровни напряжения формы `(points,)`:math:, о. е.
+        """
+
+        voltage_levels = np.linspace(min_level, max_level, num=points)
+        rotor_current = self.get_rotor_current(stator_flow, rotor_surface_relation, rotor_turn_count,
+                                               np.broadcast_to(voltage_levels, np.shape(stator_flow) + (points,)),
+                                               phi_b, rotor_yoke_saturation_factor)
+
+        return rotor_current, voltage_levels
+
+    def get_rotor_current(self,
+                          stator_flow: Union[float, np.ndarray],
+                          rotor_surface_relation: Union[float, np.ndarray],
+                          rotor_turn_count: Union[float, np.ndarray],
+                          voltage_levels: Union[float, np.ndarray],
+                          phi_b: Union[float, np.ndarray] = 0,
+                          rotor_yoke_saturation_factor: Union[float, np.ndarray] = 1
+                          ) -> np.ndarray:
+        """
+        Метод, возвращающий токи роторов на холостом ходу при произвольных уровнях напряжения, как
+        ``NoLoadMagneticCircuit.get_rotor_current``: для каждого уровня рассчитывается вся магнитная цепь, без
+        интерполяции по характеристике. Атрибуты пакета при этом не изменяются.
+
+        :param stator_flow: Номинальные потоки статора, Вб. Массив формы `(N,)`:math:.
+        :param rotor_surface_relation: Отношение обмотанной поверхности ротора к полной (число или массив).
+        :param rotor_turn_count: Число витков обмотки ротора (число или массив).
+        :param voltage_levels: Уровни напряжения в долях номинального. Массив формы `(N,)`:math: или `(N, M)`:math:.
+        :param phi_b: Номинальный поток рассеяния через бандажи, Вб (число или массив).
+        :param rotor_yoke_saturation_factor: Коэффициент насыщения ярма ротора (число или массив).
+        :return: Токи ротора, А. Массив той же формы, что и ``voltage_levels``.
+        """
+
+        voltage_levels = np.asarray(voltage_levels, dtype=float)
+
+        # Расчёт ведётся на отдельном объекте, разделяющем с этим массивы геометрии, чтобы не затереть результаты
+        # расчёта номинальной точки
+        circuit = BatchMagneticCircuit(self.lines, self.sections, self.rotor_branching_factors, self.air_gap_coef,
+                                       self.lambda_2, self.stator_steel, self.rotor_steel)
+        circuit.compute_no_load(self.__align(stator_flow, voltage_levels) * voltage_levels, rotor_surface_relation,
+                                rotor_turn_count, self.__align(phi_b, voltage_levels) * voltage_levels,
+                                rotor_yoke_saturation_factor)
+
+        return circuit.rotor_current
+
+    def get_voltage_level(self,
+                          stator_flow: Union[float, np.ndarray],
+                          rotor_surface_relation: Union[float, np.ndarray],
+                          rotor_turn_count: Union[float, np.ndarray],
+                          rotor_current: Union[float, np.ndarray],
+                          phi_b: Union[float, np.ndarray] = 0,
+                          rotor_yoke_saturation_factor: Union[float, np.ndarray] = 1,
+                          tolerance: float = 1e-10,
+                          max_iterations: int = 50
+                          ) -> np.ndarray:
+        """
+        Метод, решающий обратную задачу холостого хода, как ``NoLoadMagneticCircuit.get_voltage_level``: возвращает
+        уровни напряжения, при которых токи роторов равны заданным. Уравнения для всех вариантов и токов решаются
+        одновременно функцией ``solve_increasing``; начальное приближение --- по прямой через номинальную точку
+        каждого варианта. Атрибуты пакета при этом не изменяются.
+
+        :param stator_flow: Номинальные потоки статора, Вб. Массив формы `(N,)`:math:.
+        :param rotor_surface_relation: Отношение обмотанной поверхности ротора к полной (число или массив).
+        :param rotor_turn_count: Число витков обмотки ротора (число или массив).
+        :param rotor_current: Заданные токи ротора, А. Массив формы `(N,)`:math: или `(N, M)`:math:.
+        :param phi_b: Номинальный поток рассеяния через бандажи, Вб (число или массив).
+        :param rotor_yoke_saturation_factor: Коэффициент насыщения ярма ротора (число или массив).
+        :param tolerance: Допустимая погрешность уровня напряжения, о. е.
+        :param max_iterations: Наибольшее число итераций.
+        :return: Уровни напряжения, о. е. Массив той же формы, что и ``rotor_current``.
+        """
+
+        rotor_current = np.asarray(rotor_current, dtype=float)
+
+        def function(voltage_levels: np.ndarray) -> np.ndarray:
+            return self.get_rotor_current(stator_flow, rotor_surface_relation, rotor_turn_count, voltage_levels,
+                                          phi_b, rotor_yoke_saturation_factor)
+
+        nominal_current = function(np.ones(np.shape(stator_flow)))
+
+        return solve_increasing(function, rotor_current, rotor_current / self.__align(nominal_current, rotor_current),
+                                tolerance, max_iterations)
+
+    @staticmethod
+    def __align(value: Union[float, np.ndarray],
+                levels: np.ndarray
+                ) -> Union[float, np.ndarray]:
+        """
+        Вспомогательный метод, добавляющий к массиву по вариантам оси в конце, чтобы он правильно транслировался на
+        массив уровней формы `(N, M, ...)`:math:. Числа возвращаются как есть.
+
+        :param value: Число или массив формы `(N,)`:math:.
+        :param levels: Массив уровней.
+        :return: Число или массив, согласованный по форме с ``levels``.
+        """
+
+        if np.ndim(value) == 0:
+            return value
+
+        value = np.asarray(value, dtype=float)
+        return value.reshape(value.shape + (1,) * (levels.ndim - value.ndim))
+
+
+__all__ = ["SECTIONS", "BatchMagneticCircuit"]
@@ -0,0 +1,659 @@
+"""
+Модуль, содержащий векторизованное описание роторов турбомашин для пакетного расчёта множества вариантов.
+
+Классы:
+
+* ``BatchTurboMachineRotor``
+
+  Класс, описывающий набор роторов турбомашин в виде структуры массивов.
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from turbo.rotor import TurboMachineRotor
+
+
+class BatchTurboMachineRotor:
+    """
+    Класс, описывающий набор из `N`:math: роторов турбомашин. Каждый атрибут --- одномерный массив NumPy длины
+    `N`:math:, а все методы считают величины для всех вариантов разом, повторяя формулы ``TurboMachineRotor``.
+
+    Необязательные элементы конструкции (малые пазы, вертикальные вентиляционные каналы, подпазовые каналы, пазы в
+    большом зубе и в зубцах) хранятся в виде маскированных массивов ``numpy.ma.MaskedArray``: значение замаскировано
+    у тех вариантов, где элемент отсутствует. При создании отсутствие элемента обозначается ``NaN`` (или ``None``).
+    Методы, которые у ``TurboMachineRotor`` возвращают ``None`` при отсутствии подпазовых каналов, здесь возвращают
+    маскированные массивы с той же маской.
+
+    Атрибуты:
+
+    * ``size: int``
+
+      Число вариантов `N`:math:.
+
+    * ``air_gap``, ``outer_diameter``, ``inner_diameter``, ``length``, ``slot_count``, ``slot_pitch_count``,
+      ``slot_width``, ``wedge_height``, ``wedge_width``, ``effective_wires: np.ndarray``
+
+      То же, что и одноимённые атрибуты ``TurboMachineRotor``.
+
+    * ``effective_wires_small``, ``vert_vent_channel_pitch``, ``vert_vent_channel_length``,
+      ``vert_vent_channel_width``, ``subslot_channel_height``, ``subslot_channel_width``, ``big_tooth_slot_count``,
+      ``big_tooth_slot_width``, ``tooth_slot_width``, ``tooth_slot_height: np.ma.MaskedArray``
+
+      Параметры необязательных элементов, замаскированные при их отсутствии.
+
+    * ``slot_height``, ``coils_per_pole``, ``pole_pitch``, ``surface_relation``, ``surface_relation_small``,
+      ``tooth_pitch``, ``current_load: Optional[np.ndarray]``
+
+      Расчётные величины. В момент инициализации равны ``None``.
+
+    * ``slot_height_small: Optional[np.ma.MaskedArray]``
+
+      Глубины малых пазов, замаскированные у вариантов без малых пазов. В момент инициализации равны ``None``.
+
+    Методы:
+
+    * ``from_rotors(rotors: Sequence[TurboMachineRotor]) -> BatchTurboMachineRotor``
+
+      Собирает пакет из набора обычных роторов.
+
+    * ``compute_slot_height(wire_height, turn_insulation, body_insulation, fillings) -> None``
+
+      Вычисляет глубины нормальных и малых пазов. Параметры обмотки и изоляции передаются числами или массивами.
+
+    * ``compute_geometry(pole_pairs: int) -> None``
+
+      Вычисляет разом отношения обмотанной поверхности, число катушек на полюс, полюсное и зубцовое деления.
+
+    * ``compute_surface_relation``, ``compute_coils_per_pole``, ``compute_pole_pitch``, ``compute_tooth_pitch``,
+      ``compute_current_load``
+
+      Аналоги одноимённых методов ``TurboMachineRotor``.
+
+    * ``get_armature_coefficient``, ``get_tooth_width``, ``get_teeth_section_02``, ``get_teeth_section_07``,
+      ``get_teeth_section_slot_02``, ``get_teeth_section_slot_07``, ``get_yoke_section``, ``get_air_gap_section``,
+      ``get_tooth_half_magnetic_line``, ``get_tooth_slot_half_magnetic_line``, ``get_yoke_magnetic_line``,
+      ``get_flow_branching_factor_02``, ``get_flow_branching_factor_07``, ``get_flow_branching_factor_slot_02``,
+      ``get_flow_branching_factor_slot_07``, ``get_yoke_saturation_factor``
+
+      Аналоги одноимённых методов ``TurboMachineRotor``, возвращающие массивы.
+
+    * ``get_valid_mask() -> np.ndarray``
+
+      Возвращает маску вариантов с физически допустимой геометрией.
+
+    В отличие от ``TurboMachineRotor``, не возбуждает ``ValueError`` ни при отрицательной ширине зубца, ни при
+    вентиляционном канале в зубце глубже паза: такие варианты отмечаются в маске, возвращаемой ``get_valid_mask``.
+    """
+
+    __slots__ = ["size",
+                 "air_gap",
+                 "outer_diameter",
+                 "inner_diameter",
+                 "length",
+                 "slot_count",
+                 "slot_pitch_count",
+                 "slot_width",
+                 "slot_height",
+                 "slot_height_small",
+                 "wedge_height",
+                 "wedge_width",
+                 "effective_wires",
+                 "effective_wires_small",
+                 "coils_per_pole",
+                 "pole_pitch",
+                 "surface_relation",
+                 "surface_relation_small",
+                 "vert_vent_channel_pitch",
+                 "vert_vent_channel_length",
+                 "vert_vent_channel_width",
+                 "subslot_channel_height",
+                 "subslot_channel_width",
+                 "big_tooth_slot_count",
+                 "big_tooth_slot_width",
+                 "tooth_slot_width",
+                 "tooth_slot_height",
+                 "tooth_pitch",
+                 "current_load"]
+
+    def __init__(self,
+                 air_gap: Union[float, np.ndarray],
+                 stator_diameter: Union[float, np.ndarray],
+                 inner_diameter: Union[float, np.ndarray],
+                 length: Union[float, np.ndarray],
+                 slot_count: Union[int, np.ndarray],
+                 slot_pitch_count: Union[int, np.ndarray],
+                 slot_width: Union[float, np.ndarray],
+                 wedge_height: Union[float, np.ndarray],
+                 wedge_width: Union[float, np.ndarray],
+                 effective_wires: Union[int, np.ndarray],
+                 effective_wires_small: Optional[Union[int, np.ndarray]] = None,
+                 vert_vent_channel_pitch: Optional[Union[float, np.ndarray]] = None,
+                 vert_vent_channel_length: Optional[Union[float, np.ndarray]] = None,
+                 vert_vent_channel_width: Optional[Union[float, np.ndarray]] = None,
+                 subslot_channel_height: Optional[Union[float, np.ndarray]] = None,
+                 subslot_channel_width: Optional[Union[float, np.ndarray]] = None,
+                 big_tooth_slot_count: Optional[Union[int, np.ndarray]] = None,
+                 big_tooth_slot_width: Optional[Union[float, np.ndarray]] = None,
+                 tooth_slot_width: Optional[Union[float, np.ndarray]] = None,
+                 tooth_slot_height: Optional[Union[float, np.ndarray]] = None
+                 ) -> None:
+        # Скаляр, поданный вместо массива, означает одинаковое значение для всех вариантов, а None -
+        # отсутствие элемента
+        def to_array(value: Optional[Union[float, np.ndarray]]) -> np.ndarray:
+            return np.asarray(np.nan if value is None else value, dtype=float)
+
+        arrays = np.broadcast_arrays(*(to_array(x) for x in
+                                       (air_gap, stator_diameter, inner_diameter, length, slot_count, slot_pitch_count,
+                                        slot_width, wedge_height, wedge_width, effective_wires, effective_wires_small,
+                                        vert_vent_channel_pitch, vert_vent_channel_length, vert_vent_channel_width,
+                                        subslot_channel_height, subslot_channel_width, big_tooth_slot_count,
+                                        big_tooth_slot_width, tooth_slot_width, tooth_slot_height)))
+        arrays = [np.array(x, dtype=float, ndmin=1) for x in arrays]
+
+        self.size: int = arrays[0].size
+
+        (self.air_gap, stator_diameter, self.inner_diameter, self.length, self.slot_count, self.slot_pitch_count,
+         self.slot_width, self.wedge_height, self.wedge_width, self.effective_wires) = arrays[:10]
+        self.outer_diameter: np.ndarray = stator_diameter - 2 * self.air_gap
+
+        (self.effective_wires_small, self.vert_vent_channel_pitch, self.vert_vent_channel_length,
+         self.vert_vent_channel_width, self.subslot_channel_height, self.subslot_channel_width,
+         self.big_tooth_slot_count, self.big_tooth_slot_width, self.tooth_slot_width,
+         self.tooth_slot_height) = (np.ma.masked_invalid(x) for x in arrays[10:])
+
+        # Подпазовый канал описывается двумя размерами, и считать его присутствующим можно, только если заданы оба
+        absent = np.ma.getmaskarray(self.subslot_channel_height) | np.ma.getmaskarray(self.subslot_channel_width)
+        self.subslot_channel_height = np.ma.masked_array(self.subslot_channel_height.data, mask=absent)
+        self.subslot_channel_width = np.ma.masked_array(self.subslot_channel_width.data, mask=absent)
+
+        self.slot_height: Optional[np.ndarray] = None  # Глубина паза
+        self.slot_height_small: Optional[np.ma.MaskedArray] = None  # Глубина малого паза
+        self.coils_per_pole: Optional[np.ndarray] = None  # Число катушек на полюс
+        self.pole_pitch: Optional[np.ndarray] = None  # Полюсное деление
+        self.surface_relation: Optional[np.ndarray] = None  # Отношение обмотанной поверхности к полной
+        self.surface_relation_small: Optional[np.ndarray] = None  # То же самое, только с учётом малых пазов
+        self.tooth_pitch: Optional[np.ndarray] = None  # Зубцовое деление
+        self.current_load: Optional[np.ndarray] = None  # Токовая нагрузка
+
+    @classmethod
+    def from_rotors(cls,
+                    rotors: Sequence[TurboMachineRotor]
+                    ) -> "BatchTurboMachineRotor":
+        """
+        Метод, собирающий пакет из набора обычных роторов. Расчётные величины (глубина паза, деления и т. д.)
+        переносятся, если они посчитаны у всех роторов набора.
+
+        :param rotors: Набор роторов.
+        :return: Пакет роторов.
+        """
+
+        def column(name: str) -> list:
+            return [getattr(rotor, name) for rotor in rotors]
+
+        # Конструктор ждёт диаметр расточки статора, а ротор хранит свой внешний диаметр
+        stator_diameter = [rotor.outer_diameter + 2 * rotor.air_gap for rotor in rotors]
+
+        batch = cls(column("air_gap"), stator_diameter,
+                    *(column(name) for name in ("inner_diameter", "length", "slot_count", "slot_pitch_count",
+                                                "slot_width", "wedge_height", "wedge_width", "effective_wires",
+                                                "effective_wires_small", "vert_vent_channel_pitch",
+                                                "vert_vent_channel_length", "vert_vent_channel_width",
+                                                "subslot_channel_height", "subslot_channel_width",
+                                                "big_tooth_slot_count", "big_tooth_slot_width", "tooth_slot_width",
+                                                "tooth_slot_height")))
+
+        for name in ("slot_height", "coils_per_pole", "pole_pitch", "surface_relation", "surface_relation_small",
+                     "tooth_pitch", "current_load"):
+            values = column(name)
+            if None not in values:
+                setattr(batch, name, np.array(values, dtype=float))
+
+        if batch.slot_height is not None:
+            batch.slot_height_small = np.ma.masked_invalid(np.array(column("slot_height_small"), dtype=float))
+
+        return batch
+
+    def compute_slot_height(self,
+                            wire_height: Union[float, np.ndarray],
+                            turn_insulation: Union[float, np.ndarray],
+                            body_insulation: Union[float, np.ndarray],
+                            fillings: Union[float, np.ndarray]
+                            ) -> None:
+        """
+        Метод, рассчитывающий глубины нормальных и малых (при их наличии) пазов ротора. В отличие от
+        ``TurboMachineRotor``, обмотка здесь не хранится, поэтому её параметры передаются явно.
+
+        :param wire_height: Высота проводника обмотки ротора, мм (число или массив).
+        :param turn_insulation: Толщина витковой изоляции, мм (число или массив).
+        :param body_insulation: Толщина корпусной изоляции, мм (число или массив).
+        :param fillings: Суммарная толщина прокладок в пазу, мм (число или массив).
+        """
+
+        def height(wires: np.ndarray) -> np.ndarray:
+            return wires * wire_height + (wires - 1) * turn_insulation + body_insulation + fillings + \
+                self.wedge_height
+
+        self.slot_height = np.round(height(self.effective_wires), 1)
+        self.slot_height_small = np.ma.round(height(self.effective_wires_small), 1)
+
+    def compute_geometry(self,
+                         pole_pairs: Union[int, np.ndarray]
+                         ) -> None:
+        """
+        Метод, рассчитывающий за один проход отношения обмотанной поверхности ротора к полной, число катушек на полюс,
+        полюсное и зубцовое деления.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        """
+
+        self.compute_surface_relation(pole_pairs)
+        self.compute_coils_per_pole(pole_pairs)
+        self.compute_pole_pitch(pole_pairs)
+        self.compute_tooth_pitch()
+
+    def compute_surface_relation(self,
+                                 pole_pairs: Union[int, np.ndarray]
+                                 ) -> None:
+        """
+        Метод, рассчитывающий отношение обмотанной поверхности ротора к полной при наличии и отсутствии малых пазов.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        """
+
+        self.surface_relation = self.slot_count / self.slot_pitch_count
+        self.surface_relation_small = (self.slot_count - 4 * pole_pairs) / self.slot_pitch_count
+
+    def compute_coils_per_pole(self,
+                               pole_pairs: Union[int, np.ndarray]
+                               ) -> None:
+        """
+        Метод, рассчитывающий число катушек роторной обмотки на полюс.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        """
+
+        self.coils_per_pole = self.slot_count / 4 / pole_pairs
+
+    def compute_pole_pitch(self,
+                           pole_pairs: Union[int, np.ndarray]
+                           ) -> None:
+        """
+        Метод, рассчитывающий полюсное деление.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        """
+
+        self.pole_pitch = np.pi * self.outer_diameter / 2 / pole_pairs
+
+    def compute_tooth_pitch(self) -> None:
+        """
+        Метод, рассчитывающий зубцовое деление ротора.
+        """
+
+        self.tooth_pitch = np.pi * self.outer_diameter / self.slot_pitch_count
+
+    def compute_current_load(self,
+                             current: Union[float, np.ndarray],
+                             parallel_branches: Union[int, np.ndarray]
+                             ) -> None:
+        """
+        Метод, рассчитывающий линейную токовую нагрузку ротора.
+
+        :param current: Ток в обмотке, А (число или массив).
+        :param parallel_branches: Число параллельных ветвей обмотки (число или массив).
+        """
+
+        self.current_load = 10 * current * self.effective_wires / parallel_branches / self.tooth_pitch
+
+    def get_armature_coefficient(self,
+                                 pole_pairs: Union[int, np.ndarray]
+                                 ) -> np.ndarray:
+        """
+        Метод, возвращающий обмоточные коэффициенты роторов.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :return: Обмоточные коэффициенты.
+        """
+
+        coef_prime = 2 * pole_pairs * np.sin(np.pi * self.surface_relation_small / 2) / \
+            (self.slot_count - 4 * pole_pairs) / np.sin(np.pi * pole_pairs / self.slot_pitch_count)
+
+        # Для вариантов без малых пазов отношение числа проводников подставляем любое - оно всё равно отбрасывается
+        wires_relation = self.effective_wires_small.filled(0) / self.effective_wires
+        coef = (wires_relation * np.sin(np.pi / 2 * (1 - self.surface_relation + 0.5 / self.coils_per_pole)) +
+                coef_prime * (self.coils_per_pole - 1)) / (self.coils_per_pole - 1 + wires_relation)
+
+        return np.where(np.ma.getmaskarray(self.effective_wires_small), coef_prime, coef)
+
+    def get_tooth_width(self) -> np.ndarray:
+        """
+        Метод, возвращающий ширины зубцов роторов по расточке.
+
+        :return: Ширины зубцов, мм.
+        """
+
+        return self.tooth_pitch - self.slot_width - self.tooth_slot_width.filled(0)
+
+    def __get_diameter_bottom(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий диаметры роторов на уровне дна паза.
+        """
+
+        return self.outer_diameter - 2 * self.slot_height
+
+    def __get_diameter_02(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий диаметры роторов на уровне 20% высоты паза.
+        """
+
+        return self.outer_diameter - 1.6 * self.slot_height
+
+    def __get_diameter_07(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий диаметры роторов на уровне 70% высоты паза.
+        """
+
+        return self.outer_diameter - 0.6 * self.slot_height
+
+    # При отсутствии подпазовых каналов диаметры на их уровнях совпадают с диаметром по дну паза, так что достаточно
+    # занулить замаскированную глубину канала
+
+    def __get_diameter_slot_bottom(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий диаметры роторов на уровне дна подпазового канала.
+        """
+
+        return self.__get_diameter_bottom() - 2 * self.subslot_channel_height.filled(0)
+
+    def __get_diameter_slot_02(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий диаметры роторов на уровне 20% высоты подпазового канала.
+        """
+
+        return self.__get_diameter_bottom() - 1.6 * self.subslot_channel_height.filled(0)
+
+    def __get_diameter_slot_07(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий диаметры роторов на уровне 70% высоты подпазового канала.
+        """
+
+        return self.__get_diameter_bottom() - 0.6 * self.subslot_channel_height.filled(0)
+
+    def __get_tooth_slot_width(self,
+                               level: float
+                               ) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий ширину вентиляционного паза в зубце, попадающего в сечение зубца на
+        заданной доле высоты паза, считая от дна, либо ноль, если паз в зубце туда не доходит или отсутствует.
+
+        :param level: Доля высоты паза (0.2 или 0.7).
+        :return: Ширины вентиляционных пазов в сечении, мм.
+        """
+
+        reaches = (self.tooth_slot_height >= (1 - level) * self.slot_height).filled(False)
+        return np.where(reaches, self.tooth_slot_width.filled(0), 0)
+
+    def __get_tooth_width_bottom(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий ширины зубцов роторов на уровне дна паза.
+        """
+
+        return np.pi * self.__get_diameter_bottom() / self.slot_pitch_count - self.slot_width
+
+    def __get_tooth_width_02(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий ширины зубцов роторов на уровне 20% высоты паза.
+        """
+
+        return np.pi * self.__get_diameter_02() / self.slot_pitch_count - self.slot_width - \
+            self.__get_tooth_slot_width(0.2)
+
+    def __get_tooth_width_07(self) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий ширины зубцов роторов на уровне 70% высоты паза.
+        """
+
+        return np.pi * self.__get_diameter_07() / self.slot_pitch_count - self.slot_width - \
+            self.__get_tooth_slot_width(0.7)
+
+    def __get_tooth_width_slot_bottom(self) -> np.ma.MaskedArray:
+        """
+        Вспомогательный метод, возвращающий ширины зубцов роторов на уровне дна подпазового канала.
+        """
+
+        return np.pi * self.__get_diameter_slot_bottom() / self.slot_pitch_count - self.subslot_channel_width
+
+    def __get_tooth_width_slot_02(self) -> np.ma.MaskedArray:
+        """
+        Вспомогательный метод, возвращающий ширины зубцов роторов на уровне 20% высоты подпазового
+        канала.
+        """
+
+        return np.pi * self.__get_diameter_slot_02() / self.slot_pitch_count - self.subslot_channel_width
+
+    def __get_tooth_width_slot_07(self) -> np.ma.MaskedArray:
+        """
+        Вспомогательный метод, возвращающий ширины зубцов роторов на уровне 70% высоты подпазового
+        канала.
+        """
+
+        return np.pi * self.__get_diameter_slot_07() / self.slot_pitch_count - self.subslot_channel_width
+
+    def __get_sin_alpha(self,
+                        pole_pairs: Union[int, np.ndarray]
+                        ) -> np.ndarray:
+        r"""
+        Вспомогательный метод, рассчитывающий сумму проекций ширины пазов на поперечную ось ротора при ширине
+        паза, равной 1 см, соответствующую `\gamma`:math:.
+        """
+
+        return (1 - np.cos(np.pi * self.surface_relation / 2)) / np.sin(np.pi * pole_pairs / self.slot_pitch_count)
+
+    def __get_sin_alpha_small(self,
+                              pole_pairs: Union[int, np.ndarray]
+                              ) -> np.ndarray:
+        r"""
+        Вспомогательный метод, рассчитывающий сумму проекций ширины пазов на поперечную ось ротора при
+        ширине паза, равной 1 см, соответствующую `\gamma'`:math:.
+        """
+
+        return (1 - np.cos(np.pi * self.surface_relation_small / 2)) / \
+            np.sin(np.pi * pole_pairs / self.slot_pitch_count)
+
+    def __get_teeth_section(self,
+                            diameter: np.ndarray,
+                            level: float,
+                            pole_pairs: Union[int, np.ndarray]
+                            ) -> np.ndarray:
+        """
+        Вспомогательный метод, возвращающий суммарное сечение зубцов на заданной доле высоты паза.
+
+        :param diameter: Диаметр ротора на этом уровне, мм.
+        :param level: Доля высоты паза (0.2 или 0.7).
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :return: Суммарные сечения зубцов, м².
+        """
+
+        total_slot_width = self.slot_width + self.__get_tooth_slot_width(level)
+        big_tooth_slots = (self.big_tooth_slot_width * self.big_tooth_slot_count).filled(0)
+
+        return self.length * (diameter / pole_pairs - total_slot_width * self.__get_sin_alpha(pole_pairs) -
+                              big_tooth_slots) * 1e-6
+
+    def get_teeth_section_02(self,
+                             pole_pairs: Union[int, np.ndarray]
+                             ) -> np.ndarray:
+        """
+        Метод, возвращающий суммарные сечения зубцов роторов на уровне 20% высоты паза.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :return: Суммарные сечения зубцов, м².
+        """
+
+        return self.__get_teeth_section(self.__get_diameter_02(), 0.2, pole_pairs)
+
+    def get_teeth_section_07(self,
+                             pole_pairs: Union[int, np.ndarray]
+                             ) -> np.ndarray:
+        """
+        Метод, возвращающий суммарные сечения зубцов роторов на уровне 70% высоты паза.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :return: Суммарные сечения зубцов, м².
+        """
+
+        return self.__get_teeth_section(self.__get_diameter_07(), 0.7, pole_pairs)
+
+    def get_teeth_section_slot_02(self,
+                                  pole_pairs: Union[int, np.ndarray]
+                                  ) -> np.ma.MaskedArray:
+        """
+        Метод, возвращающий суммарные сечения зубцов роторов на уровне 20% высоты подпазового канала. У вариантов без
+        подпазовых каналов значения замаскированы.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :return: Суммарные сечения зубцов, м².
+        """
+
+        return self.length * (self.__get_diameter_slot_02() / pole_pairs - self.subslot_channel_width *
+                              self.__get_sin_alpha_small(pole_pairs)) * 1e-6
+
+    def get_teeth_section_slot_07(self,
+                                  pole_pairs: Union[int, np.ndarray]
+                                  ) -> np.ma.MaskedArray:
+        """
+        Метод, возвращающий суммарные сечения зубцов роторов на уровне 70% высоты подпазового канала. У вариантов без
+        подпазовых каналов значения замаскированы.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :return: Суммарные сечения зубцов, м².
+        """
+
+        return self.length * (self.__get_diameter_slot_07() / pole_pairs - self.subslot_channel_width *
+                              self.__get_sin_alpha(pole_pairs)) * 1e-6
+
+    def get_yoke_section(self) -> np.ndarray:
+        """
+        Метод, возвращающий эффективные сечения ярма роторов.
+
+        :return: Эффективные сечения ярма, м².
+        """
+
+        diameter_slot_bottom = self.__get_diameter_slot_bottom()
+        return (diameter_slot_bottom - self.inner_diameter) / 2 * (self.length + diameter_slot_bottom / 3) * 1e-6
+
+    def get_air_gap_section(self,
+                            pole_pairs: Union[int, np.ndarray],
+                            stator_length: Union[float, np.ndarray]
+                            ) -> np.ndarray:
+        """
+        Метод, возвращающий площади сечения воздушного зазора на полюс.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :param stator_length: Длина сердечника статора, мм (число или массив).
+        :return: Площади сечения, м².
+        """
+
+        coef = np.pi / 2 * (1 - self.surface_relation / 2)
+        return (self.outer_diameter + self.air_gap) * (stator_length + 2 * self.air_gap) * coef / pole_pairs * 1e-6
+
+    def get_tooth_half_magnetic_line(self) -> np.ndarray:
+        """
+        Метод, возвращающий половины расчётной длины магнитной линии в зубце роторов.
+
+        :return: Половины длины магнитной линии, см.
+        """
+
+        return self.slot_height / 2 * 0.1
+
+    def get_tooth_slot_half_magnetic_line(self) -> np.ma.MaskedArray:
+        """
+        Метод, возвращающий половины расчётной длины магнитной линии в зубце роторов в области подпазового канала. У
+        вариантов без подпазовых каналов значения замаскированы.
+
+        :return: Половины длины магнитной линии, см.
+        """
+
+        return self.subslot_channel_height / 2 * 0.1
+
+    def get_yoke_magnetic_line(self,
+                               pole_pairs: Union[int, np.ndarray]
+                               ) -> np.ndarray:
+        """
+        Метод, возвращающий расчётные длины магнитной линии в ярме роторов.
+
+        :param pole_pairs: Количество пар полюсов машины (число или массив).
+        :return: Длины магнитной линии, см.
+        """
+
+        return self.__get_diameter_slot_bottom() / 2 / np.sin(np.pi / 2 / pole_pairs) * 0.1
+
+    def get_flow_branching_factor_02(self) -> np.ndarray:
+        """
+        Метод, возвращающий коэффициенты ответвления потока в пазы роторов на уровне 20% высоты паза.
+
+        :return: Коэффициенты ответвления.
+        """
+
+        return self.slot_width / self.__get_tooth_width_02()
+
+    def get_flow_branching_factor_07(self) -> np.ndarray:
+        """
+        Метод, возвращающий коэффициенты ответвления потока в пазы роторов на уровне 70% высоты паза.
+
+        :return: Коэффициенты ответвления.
+        """
+
+        return self.slot_width / self.__get_tooth_width_07()
+
+    def get_flow_branching_factor_slot_02(self) -> np.ma.MaskedArray:
+        """
+        Метод, возвращающий коэффициенты ответвления потока в пазы роторов на уровне 20% высоты подпазового канала. У
+        вариантов без подпазовых каналов значения замаскированы.
+
+        :return: Коэффициенты ответвления.
+        """
+
+        return self.subslot_channel_width / self.__get_tooth_width_slot_02()
+
+    def get_flow_branching_factor_slot_07(self) -> np.ma.MaskedArray:
+        """
+        Метод, возвращающий коэффициенты ответвления потока в пазы роторов на уровне 70% высоты подпазового канала. У
+        вариантов без подпазовых каналов значения замаскированы.
+
+        :return: Коэффициенты ответвления.
+        """
+
+        return self.subslot_channel_width / self.__get_tooth_width_slot_07()
+
+    def get_yoke_saturation_factor(self) -> np.ndarray:
+        """
+        Метод, возвращающий коэффициенты насыщения ярма роторов.
+
+        :return: Коэффициенты насыщения ярма.
+        """
+
+        # Как и в TurboMachineRotor, пока что это единица
+        return np.ones(self.size)
+
+    def get_valid_mask(self) -> np.ndarray:
+        """
+        Метод, возвращающий маску вариантов с физически допустимой геометрией. Вариант недопустим, если вентиляционный
+        паз в зубце глубже паза ротора, либо если ширина зубца на дне паза, на уровне 20% его высоты или на дне
+        подпазового канала неположительна. Это те же условия, при нарушении которых ``TurboMachineRotor`` возбуждает
+        ``ValueError``.
+
+        :return: Логический массив, ``True`` для допустимых вариантов.
+        """
+
+        valid = ~(self.tooth_slot_height >= self.slot_height).filled(False)
+        valid &= self.__get_tooth_width_bottom() > 0
+        valid &= self.__get_tooth_width_02() > 0
+        valid &= (self.__get_tooth_width_slot_bottom() > 0).filled(True)
+
+        return valid
+
+
+__all__ = ["BatchTurboMachineRotor"]
@@ -0,0 +1,260 @@
+"""
+Модуль, содержащий построение диаграммы мощностей (P-Q диаграммы) турбогенератора.
+
+Классы:
+
+* ``CapabilityChart``
+
+  Класс, рассчитывающий ограничения по нагреву статора, нагреву ротора и устойчивости на плоскости P-Q.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from common.designContext import DesignSingleton
+from common.statorArmature import CoilArmature
+from turbo.magneticCircuit import LoadedMagneticCircuit
+from turbo.reactances import Reactances
+from turbo.rotor import TurboMachineRotor, TurboMachineRotorBandaging
+
+
+class CapabilityChart(DesignSingleton):
+    r"""
+    Класс, строящий диаграмму мощностей турбогенератора при номинальном напряжении. Плоскость P-Q покрывается полярной
+    сеткой: луч задаётся углом `\varphi`:math: вектора полной мощности от оси активной мощности (положительным при
+    перевозбуждении, отрицательным при недовозбуждении), а точки на луче --- полной мощностью `S`:math: в долях
+    номинальной. Для каждого луча находится наибольшая полная мощность, допустимая по каждому из ограничений:
+
+    * нагрев статора --- плотность тока обмотки статора (``CoilArmature.compute_current_density``) не выше допустимой;
+    * нагрев ротора --- плотность тока обмотки возбуждения (``TurboMachineRotorArmature.compute_current_density``) не
+      выше допустимой. Токи возбуждения во всех узлах сетки считаются одним вызовом
+      ``LoadedMagneticCircuit.get_operating_chart``, то есть с учётом насыщения;
+    * устойчивость --- угол нагрузки неявнополюсной машины с синхронным индуктивным сопротивлением ``Reactances.x_d``
+      не больше заданного.
+
+    Граница диаграммы --- наименьшее из трёх ограничений на каждом луче. Ограничения не выходят за пределы сетки:
+    если на луче ограничение не достигается, его значение равно ``max_level``.
+
+    Атрибуты:
+
+    * ``angles: np.ndarray``
+
+      Углы лучей сетки `\varphi`:math:, рад, от `-\pi/2`:math: до `\pi/2`:math:.
+
+    * ``levels: np.ndarray``
+
+      Значения полной мощности на лучах, о. е.
+
+    * ``stator_limit``, ``rotor_limit``, ``stability_limit: Optional[np.ndarray]``
+
+      Наибольшая допустимая полная мощность на каждом луче по соответствующему ограничению, о. е. В момент
+      инициализации равны ``None``.
+
+    Методы:
+
+    * ``compute_stator_limit(armature: CoilArmature, max_current_density: float) -> None``
+
+      Рассчитывает ограничение по нагреву статора.
+
+    * ``compute_rotor_limit(mag_circuit: LoadedMagneticCircuit, rotor: TurboMachineRotor,
+      bandaging: TurboMachineRotorBandaging, stator_length: float, xs: Reactances, magnetizing_current: float,
+      no_load_flow: float, no_load_current: float, max_current_density: float) -> None``
+
+      Рассчитывает ограничение по нагреву ротора.
+
+    * ``compute_stability_limit(x_d: float, max_load_angle: float = 90) -> None``
+
+      Рассчитывает ограничение по устойчивости.
+
+    * ``get_limit() -> np.ndarray``
+
+      Возвращает границу диаграммы --- наименьшее из рассчитанных ограничений на каждом луче.
+
+    * ``get_curve(limit: str = "total") -> Tuple[np.ndarray, np.ndarray]``
+
+      Возвращает кривую ограничения в координатах P-Q.
+
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
+    """
+
+    __slots__ = ["angles",
+                 "levels",
+                 "stator_limit",
+                 "rotor_limit",
+                 "stability_limit"]
+
+    def __init__(self,
+                 angle_points: int = 181,
+                 level_points: int = 151,
+                 max_level: float = 1.5
+                 ) -> None:
+        """
+        :param angle_points: Число лучей сетки.
+        :param level_points: Число точек на луче.
+        :param max_level: Наибольшая полная мощность сетки, о. е.
+        """
+
+        self.angles = np.linspace(-math.pi / 2, math.pi / 2, num=angle_points)
+        self.levels = np.linspace(0, max_level, num=level_points)
+
+        self.stator_limit: Optional[np.ndarray] = None  # Ограничение по нагреву статора
+        self.rotor_limit: Optional[np.ndarray] = None  # Ограничение по нагреву ротора
+        self.stability_limit: Optional[np.ndarray] = None  # Ограничение по устойчивости
+
+    def compute_stator_limit(self,
+                             armature: CoilArmature,
+                             max_current_density: float
+                             ) -> None:
+        """
+        Метод, рассчитывающий ограничение по нагреву статора. При номинальном напряжении полная мощность
+        пропорциональна току статора, так что ограничение --- окружность.
+
+        :param armature: Обмотка статора. Плотность тока должна быть рассчитана для номинального тока.
+        :param max_current_density: Допустимая плотность тока в обмотке статора, А/мм².
+        """
+
+        limit = min(max_current_density / armature.current_density, self.levels[-1])
+        self.stator_limit = np.full_like(self.angles, limit)
+
+    def compute_rotor_limit(self,
+                            mag_circuit: LoadedMagneticCircuit,
+                            rotor: TurboMachineRotor,
+                            bandaging: TurboMachineRotorBandaging,
+                            stator_length: float,
+                            xs: Reactances,
+                            magnetizing_current: float,
+                            no_load_flow: float,
+                            no_load_current: float,
+                            max_current_density: float
+                            ) -> None:
+        """
+        Метод, рассчитывающий ограничение по нагреву ротора. Ток возбуждения рассчитывается во всех узлах сетки, после
+        чего на каждом луче находится первая точка, где он превышает допустимый, и граница уточняется линейной
+        интерполяцией между соседними узлами.
+
+        :param mag_circuit: Магнитная цепь под нагрузкой. Должны быть рассчитаны реакция якоря для номинального тока
+            и номинальный ток возбуждения.
+        :param rotor: Ротор машины. Плотность тока обмотки возбуждения должна быть рассчитана для номинального тока
+            возбуждения.
+        :param bandaging: Бандаж ротора.
+        :param stator_length: Длина сердечника статора, мм.
+        :param xs: Индуктивные сопротивления машины.
+        :param magnetizing_current: Ток намагничивания на холостом ходу, А.
+        :param no_load_flow: Поток статора на холостом ходу, Вб.
+        :param no_load_current: Ток ротора на холостом ходу, А.
+        :param max_current_density: Допустимая плотность тока в обмотке возбуждения, А/мм².
+        """
+
+        max_field_current = mag_circuit.nominal_field_current * max_current_density / rotor.armature.current_density
+
+        # Сетка по лучам перевозбуждения и недовозбуждения считается двумя вызовами - режим возбуждения у
+        # get_operating_chart общий на вызов. В недовозбуждённой области при больших токах корень в "магических"
+        # формулах МДС может стать мнимым - такие точки получаются NaN и считаются недопустимыми
+        field_currents = np.empty((self.levels.size, self.angles.size))
+        with np.errstate(invalid="ignore"):
+            for excitation, rays in (("over", self.angles >= 0), ("under", self.angles < 0)):
+                chart = mag_circuit.get_operating_chart(rotor, bandaging, stator_length, self.levels,
+                                                        np.cos(self.angles[rays]), xs.x_stator, xs.x_P,
+                                                        magnetizing_current, no_load_flow, no_load_current,
+                                                        excitation)
+                field_currents[:, rays] = chart.nominal_field_current
+
+        self.rotor_limit = self.__get_first_crossing(field_currents, max_field_current)
+
+    def compute_stability_limit(self,
+                                x_d: float,
+                                max_load_angle: float = 90
+                                ) -> None:
+        r"""
+        Метод, рассчитывающий ограничение по устойчивости. Для неявнополюсной машины при номинальном напряжении угол
+        нагрузки `\theta`:math: в точке `S e^{j\varphi}`:math: определяется из
+        `\tan\theta = x_d S \cos\varphi / (1 + x_d S \sin\varphi)`:math:, откуда наибольшая полная мощность на луче
+        `S = \sin\theta_{max} / (x_d \cos(\varphi + \theta_{max}))`:math:. При
+        `\theta_{max} = 90^\circ`:math: это известная прямая `Q = -1 / x_d`:math:.
+
+        :param x_d: Синхронное индуктивное сопротивление по продольной оси, о. е.
+        :param max_load_angle: Наибольший допустимый угол нагрузки, градусы. Для учёта запаса устойчивости задаётся
+            меньше 90.
+        """
+
+        max_angle = math.radians(max_load_angle)
+        denominator = x_d * np.cos(self.angles + max_angle)
+
+        with np.errstate(divide="ignore"):
+            limit = np.where(denominator > 0, math.sin(max_angle) / denominator, np.inf)
+
+        self.stability_limit = np.minimum(limit, self.levels[-1])
+
+    def get_limit(self) -> np.ndarray:
+        """
+        Метод, возвращающий границу диаграммы: наименьшее из рассчитанных ограничений на каждом луче. Нерассчитанные
+        ограничения не учитываются.
+
+        :return: Наибольшая допустимая полная мощность на каждом луче, о. е.
+        """
+
+        limits = [limit for limit in (self.stator_limit, self.rotor_limit, self.stability_limit) if limit is not None]
+        if not limits:
+            raise ValueError("Не рассчитано ни одно ограничение")
+
+        return np.minimum.reduce(limits)
+
+    def get_curve(self,
+                  limit: str = "total"
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Метод, возвращающий кривую ограничения в координатах P-Q.
+
+        :param limit: Ограничение: ``"stator"``, ``"rotor"``, ``"stability"`` или ``"total"`` (граница диаграммы).
+        :return: Активная и реактивная мощности точек кривой, о. е.
+        """
+
+        if limit == "stator":
+            levels = self.stator_limit
+        elif limit == "rotor":
+            levels = self.rotor_limit
+        elif limit == "stability":
+            levels = self.stability_limit
+        elif limit == "total":
+            levels = self.get_limit()
+        else:
+            raise ValueError(f"Неизвестное ограничение: {limit}")
+
+        if levels is None:
+            raise ValueError(f"Ограничение не рассчитано: {limit}")
+
+        return levels * np.cos(self.angles), levels * np.sin(self.angles)
+
+    def __get_first_crossing(self,
+                             values: np.ndarray,
+                             max_value: float
+                             ) -> np.ndarray:
+        """
+        Вспомогательный метод, находящий на каждом луче полную мощность, при которой величина впервые превышает
+        допустимое значение.
+
+        :param values: Значения величины в узлах сетки. Массив формы (число точек на луче, число лучей).
+        :param max_value: Допустимое значение.
+        :return: Наибольшая допустимая полная мощность на каждом луче, о. е.
+        """
+
+        exceeded = ~(values <= max_value)
+        first = np.argmax(exceeded, axis=0)
+        rays = np.arange(self.angles.size)
+
+        # Точка перед первым превышением и само превышение; на лучах без превышений - конец сетки
+        crossing = self.levels[first].copy()
+        inside = exceeded.any(axis=0) & (first > 0)
+        before, after = values[first[inside] - 1, rays[inside]], values[first[inside], rays[inside]]
+        # Если за границей NaN, интерполировать не по чему - берём точку перед ней
+        with np.errstate(invalid="ignore"):
+            fraction = np.nan_to_num((max_value - before) / (after - before))
+        crossing[inside] = self.levels[first[inside] - 1] + fraction * (self.levels[1] - self.levels[0])
+        crossing[~exceeded.any(axis=0)] = self.levels[-1]
+
+        return crossing
+
+
+__all__ = ["CapabilityChart"]
@@ -0,0 +1,280 @@
+"""
+Модуль, содержащий расчёт карты КПД турбогенератора по нагрузке и коэффициенту мощности.
+
+Классы:
+
+* ``EfficiencyMap``
+
+  Класс, рассчитывающий потери и КПД на сетке «нагрузка × коэффициент мощности».
+
+Функции:
+
+* ``get_load_dependent_losses``
+
+  Функция, пересчитывающая зависящие от нагрузки потери из номинальных на произвольные рабочие точки.
+"""
+
+import math
+from typing import Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from common.designContext import DesignSingleton
+from turbo.losses import Losses
+from turbo.magneticCircuit import LoadedMagneticCircuit, OperatingChart
+from turbo.reactances import Reactances
+from turbo.rotor import TurboMachineRotor, TurboMachineRotorBandaging
+
+
+def get_load_dependent_losses(losses: Losses,
+                              mag_circuit: LoadedMagneticCircuit,
+                              rotor: TurboMachineRotor,
+                              chart: OperatingChart,
+                              exc_efficiency: float,
+                              rotor_temperature: Union[float, np.ndarray] = 75
+                              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Функция, пересчитывающая потери, зависящие от нагрузки, из номинальных на рабочие точки, рассчитанные
+    ``LoadedMagneticCircuit.get_operating_chart`` или ``LoadedMagneticCircuit.get_operating_points``. Потери в
+    обмотке статора, в стали и в торцевой зоне при коротком замыкании пропорциональны квадрату тока статора, кроме
+    потерь на поверхности статора и пульсационных: они пропорциональны квадрату тока ротора при коротком замыкании.
+    Потери на возбуждение считаются по току возбуждения в рабочей точке, как в ``Losses.compute_excitation_losses``.
+
+    :param losses: Потери машины, рассчитанные для номинального режима.
+    :param mag_circuit: Магнитная цепь под нагрузкой, по которой рассчитаны рабочие точки. Должен быть рассчитан ток
+        ротора при коротком замыкании.
+    :param rotor: Ротор машины.
+    :param chart: Рабочие точки.
+    :param exc_efficiency: КПД возбудителя.
+    :param rotor_temperature: Температура обмотки ротора, °C (число или массив, согласованный по форме с рабочими
+        точками).
+    :return: Потери в обмотке статора, в стали и в торцевой зоне при коротком замыкании и на возбуждение, кВт.
+        Массивы той же формы, что и рабочие точки.
+    """
+
+    current_factor = chart.current_levels ** 2
+    # МДС ротора при коротком замыкании не пропорциональна току статора из-за тока намагничивания
+    rotor_SC_factor = (chart.rotor_SC_current / mag_circuit.rotor_SC_current) ** 2
+
+    copper = losses.stator_copper * current_factor
+    steel_SC = (losses.stator_SC_surface_harmonics + losses.stator_SC_surface_teeth + losses.stator_SC_pulse) * \
+        rotor_SC_factor + (losses.rotor_SC_surface_harmonics + losses.rotor_SC_surface_teeth) * current_factor
+    end_part_SC = losses.end_part_SC_losses * current_factor
+
+    field_current = chart.nominal_field_current
+    excitation = (field_current ** 2 * rotor.armature.get_resistance(rotor_temperature) + 2 * field_current) / \
+        exc_efficiency / 1e3
+
+    return copper, steel_SC, end_part_SC, excitation
+
+
+class EfficiencyMap(DesignSingleton):
+    r"""
+    Класс, рассчитывающий КПД турбогенератора при номинальном напряжении на сетке нагрузок `k`:math: (в долях
+    номинального тока статора, по первой оси) и коэффициентов мощности `\cos\varphi`:math: (по второй оси) с
+    перевозбуждением. Потери разделяются на две группы:
+
+    * не зависящие от нагрузки --- потери холостого хода (``Losses.get_total_OC_losses``) и механические потери
+      (``Losses.mechanical``). Они берутся из рассчитанного для номинального режима объекта ``Losses`` один раз;
+    * зависящие от нагрузки --- потери в обмотке статора, потери в стали и в торцевой зоне при коротком замыкании и
+      потери на возбуждение. Первые пересчитываются из номинальных пропорционально квадрату тока: потери на
+      поверхности и пульсационные в статоре --- квадрату тока ротора при коротком замыкании, остальные --- квадрату
+      `k`:math:. Токи ротора при коротком замыкании и токи возбуждения во всех узлах сетки считаются одним вызовом
+      ``LoadedMagneticCircuit.get_operating_chart``, то есть с учётом насыщения.
+
+    В номинальной точке (`k = 1`:math:, номинальный `\cos\varphi`:math:) полные потери и КПД совпадают с
+    ``Losses.get_efficiency``.
+
+    Атрибуты:
+
+    * ``loads: np.ndarray``
+
+      Нагрузки `k`:math:, о. е.
+
+    * ``cos_phi: np.ndarray``
+
+      Коэффициенты мощности.
+
+    * ``load_independent: Optional[float]``
+
+      Потери, не зависящие от нагрузки, кВт. В момент инициализации равны ``None``.
+
+    * ``copper``, ``steel_SC``, ``end_part_SC``, ``excitation: Optional[np.ndarray]``
+
+      Потери в обмотке статора, в стали и в торцевой зоне при коротком замыкании и на возбуждение в узлах сетки,
+      кВт. Массивы формы (число нагрузок, число коэффициентов мощности). В момент инициализации равны ``None``.
+
+    * ``power``, ``efficiency: Optional[np.ndarray]``
+
+      Активная мощность, кВт, и КПД в узлах сетки. В момент инициализации равны ``None``.
+
+    Методы:
+
+    * ``compute_load_independent_losses(losses: Losses) -> None``
+
+      Рассчитывает потери, не зависящие от нагрузки.
+
+    * ``compute_load_dependent_losses(losses: Losses, mag_circuit: LoadedMagneticCircuit, rotor: TurboMachineRotor,
+      bandaging: TurboMachineRotorBandaging, stator_length: float, xs: Reactances, magnetizing_current: float,
+      no_load_flow: float, no_load_current: float, exc_efficiency: float, iterate: bool = False,
+      rotor_temperature: Union[float, np.ndarray] = 75) -> None``
+
+      Рассчитывает потери, зависящие от нагрузки, во всех узлах сетки.
+
+    * ``compute_efficiency(voltage: float, current: float) -> None``
+
+      Рассчитывает активную мощность и КПД во всех узлах сетки.
+
+    * ``get_total_losses() -> np.ndarray``
+
+      Возвращает полные потери в узлах сетки.
+
+    * ``get_weighted_efficiency(weights: Optional[Mapping[float, float]] = None) -> np.ndarray``
+
+      Возвращает средневзвешенный по нагрузкам КПД для каждого коэффициента мощности.
+
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
+    """
+
+    __slots__ = ["loads",
+                 "cos_phi",
+                 "load_independent",
+                 "copper",
+                 "steel_SC",
+                 "end_part_SC",
+                 "excitation",
+                 "power",
+                 "efficiency"]
+
+    def __init__(self,
+                 cos_phi: Sequence[float] = (0.8, 0.85, 0.9, 0.95, 1),
+                 load_points: int = 18,
+                 min_load: float = 0.25,
+                 max_load: float = 1.1
+                 ) -> None:
+        """
+        :param cos_phi: Коэффициенты мощности сетки.
+        :param load_points: Число нагрузок сетки.
+        :param min_load: Наименьшая нагрузка, о. е.
+        :param max_load: Наибольшая нагрузка, о. е.
+        """
+
+        self.loads = np.linspace(min_load, max_load, num=load_points)
+        self.cos_phi = np.asarray(cos_phi, dtype=float)
+
+        self.load_independent: Optional[float] = None  # Потери, не зависящие от нагрузки
+        self.copper: Optional[np.ndarray] = None  # Потери в обмотке статора
+        self.steel_SC: Optional[np.ndarray] = None  # Потери в стали при КЗ
+        self.end_part_SC: Optional[np.ndarray] = None  # Потери в торцевой зоне при КЗ
+        self.excitation: Optional[np.ndarray] = None  # Потери на возбуждение
+        self.power: Optional[np.ndarray] = None  # Активная мощность
+        self.efficiency: Optional[np.ndarray] = None  # КПД
+
+    def compute_load_independent_losses(self,
+                                        losses: Losses
+                                        ) -> None:
+        """
+        Метод, рассчитывающий потери, не зависящие от нагрузки.
+
+        :param losses: Потери машины, рассчитанные для номинального режима.
+        """
+
+        self.load_independent = losses.get_total_OC_losses() + losses.mechanical
+
+    def compute_load_dependent_losses(self,
+                                      losses: Losses,
+                                      mag_circuit: LoadedMagneticCircuit,
+                                      rotor: TurboMachineRotor,
+                                      bandaging: TurboMachineRotorBandaging,
+                                      stator_length: float,
+                                      xs: Reactances,
+                                      magnetizing_current: float,
+                                      no_load_flow: float,
+                                      no_load_current: float,
+                                      exc_efficiency: float,
+                                      iterate: bool = False,
+                                      rotor_temperature: Union[float, np.ndarray] = 75
+                                      ) -> None:
+        """
+        Метод, рассчитывающий потери, зависящие от нагрузки, во всех узлах сетки.
+
+        :param losses: Потери машины, рассчитанные для номинального режима.
+        :param mag_circuit: Магнитная цепь под нагрузкой. Должны быть рассчитаны реакция якоря для номинального тока
+            и ток ротора при коротком замыкании.
+        :param rotor: Ротор машины.
+        :param bandaging: Бандаж ротора.
+        :param stator_length: Длина сердечника статора, мм.
+        :param xs: Индуктивные сопротивления машины.
+        :param magnetizing_current: Ток намагничивания на холостом ходу, А.
+        :param no_load_flow: Поток статора на холостом ходу, Вб.
+        :param no_load_current: Ток ротора на холостом ходу, А.
+        :param exc_efficiency: КПД возбудителя.
+        :param iterate: Уточнять ли поток рассеяния итерациями (см.
+            ``LoadedMagneticCircuit.compute_rotor_flow_iteratively``). Должно совпадать с тем, как рассчитан
+            номинальный режим, чтобы номинальная точка сетки совпала с ним.
+        :param rotor_temperature: Температура обмотки ротора, °C. Должна совпадать с той, при которой рассчитаны
+            потери на возбуждение в номинальном режиме (см. ``Losses.compute_excitation_losses``).
+        """
+
+        chart = mag_circuit.get_operating_chart(rotor, bandaging, stator_length, self.loads, self.cos_phi,
+                                                xs.x_stator, xs.x_P, magnetizing_current, no_load_flow,
+                                                no_load_current, iterate=iterate)
+
+        self.copper, self.steel_SC, self.end_part_SC, self.excitation = \
+            get_load_dependent_losses(losses, mag_circuit, rotor, chart, exc_efficiency, rotor_temperature)
+
+    def compute_efficiency(self,
+                           voltage: float,
+                           current: float
+                           ) -> None:
+        """
+        Метод, рассчитывающий активную мощность и КПД во всех узлах сетки.
+
+        :param voltage: Номинальное линейное напряжение, В.
+        :param current: Номинальный ток статора, А.
+        """
+
+        self.power = math.sqrt(3) * voltage * current / 1e3 * self.loads[:, None] * self.cos_phi
+        self.efficiency = self.power / (self.power + self.get_total_losses())
+
+    def get_total_losses(self) -> np.ndarray:
+        """
+        Метод, возвращающий полные потери в узлах сетки.
+
+        :return: Потери, кВт. Массив формы (число нагрузок, число коэффициентов мощности).
+        """
+
+        if self.load_independent is None or self.copper is None:
+            raise ValueError("Потери не рассчитаны")
+
+        return self.load_independent + self.copper + self.steel_SC + self.end_part_SC + self.excitation
+
+    def get_weighted_efficiency(self,
+                                weights: Optional[Mapping[float, float]] = None
+                                ) -> np.ndarray:
+        """
+        Метод, возвращающий средневзвешенный по нагрузкам КПД для каждого коэффициента мощности сетки. КПД при
+        нагрузках, не попавших в сетку, находятся линейной интерполяцией по нагрузке.
+
+        :param weights: Веса нагрузок: ключ --- нагрузка, о. е., значение --- вес. По умолчанию нагрузки 25, 50, 75 и
+            100 % с равными весами.
+        :return: Средневзвешенный КПД. Массив формы (число коэффициентов мощности,).
+        """
+
+        if self.efficiency is None:
+            raise ValueError("КПД не рассчитан")
+
+        if weights is None:
+            weights = {0.25: 1, 0.5: 1, 0.75: 1, 1: 1}
+
+        loads = np.array(list(weights.keys()), dtype=float)
+        if np.any(loads < self.loads[0]) or np.any(loads > self.loads[-1]):
+            raise ValueError("Нагрузка вне сетки")
+
+        values = np.array(list(weights.values()), dtype=float)
+        efficiency = np.stack([np.interp(loads, self.loads, column) for column in self.efficiency.T], axis=-1)
+
+        return values @ efficiency / values.sum()
+
+
+__all__ = ["get_load_dependent_losses", "EfficiencyMap"]
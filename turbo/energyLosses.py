@@ -0,0 +1,290 @@
+"""
+Модуль, содержащий расчёт потерь энергии турбогенератора по графику нагрузки.
+
+Классы:
+
+* ``EnergyLosses``
+
+  Класс, накапливающий потери энергии по составляющим при потоковом чтении длинного графика нагрузки.
+"""
+
+import itertools
+import math
+import os
+from typing import Iterable, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+from common.designContext import DesignSingleton
+from turbo.efficiencyMap import get_load_dependent_losses
+from turbo.losses import Losses
+from turbo.magneticCircuit import LoadedMagneticCircuit
+from turbo.reactances import Reactances
+from turbo.rotor import TurboMachineRotor, TurboMachineRotorBandaging
+
+
+# Составляющие потерь энергии - элементы массива EnergyLosses.energy
+COMPONENTS = ("load_independent",
+              "copper",
+              "steel_SC",
+              "end_part_SC",
+              "excitation")
+
+
+class EnergyLosses(DesignSingleton):
+    r"""
+    Класс, рассчитывающий потери энергии турбогенератора при номинальном напряжении по графику нагрузки --- ряду
+    значений активной `P`:math: и реактивной `Q`:math: мощности с постоянным шагом по времени (например, часовому или
+    минутному графику из SCADA). Положительная реактивная мощность соответствует перевозбуждению.
+
+    График читается порциями по ``chunk_size`` точек, и для каждой порции потери во всех точках считаются разом
+    (``LoadedMagneticCircuit.get_operating_points`` и ``get_load_dependent_losses``), после чего складываются в
+    накопленные суммы. Поэтому расход памяти не зависит от длины графика, а файлы ``.npy`` отображаются в память без
+    чтения целиком.
+
+    Потери делятся на составляющие так же, как в ``EfficiencyMap``: не зависящие от нагрузки (холостого хода и
+    механические) и зависящие от неё (в обмотке статора, в стали и в торцевой зоне при коротком замыкании и на
+    возбуждение). Точки, в которых мощность не задана (``NaN`` или пустая ячейка текстового файла) или потери не
+    удаётся рассчитать (при глубоком недовозбуждении корень в формулах МДС может стать мнимым), пропускаются и в
+    продолжительность не входят.
+
+    Атрибуты:
+
+    * ``time_step: float``
+
+      Шаг графика по времени, ч.
+
+    * ``chunk_size: int``
+
+      Число точек графика, обрабатываемых за раз.
+
+    * ``energy: np.ndarray``
+
+      Потери энергии по составляющим в порядке ``COMPONENTS``, кВт∙ч.
+
+    * ``point_count``, ``skipped_count: int``
+
+      Число учтённых и пропущенных точек графика.
+
+    Методы:
+
+    * ``reset() -> None``
+
+      Обнуляет накопленные суммы.
+
+    * ``compute_energy(profile, losses: Losses, mag_circuit: LoadedMagneticCircuit, rotor: TurboMachineRotor,
+      bandaging: TurboMachineRotorBandaging, stator_length: float, xs: Reactances, magnetizing_current: float,
+      no_load_flow: float, no_load_current: float, exc_efficiency: float, voltage: float, current: float,
+      iterate: bool = False, columns: Sequence[int] = (0, 1), delimiter: Optional[str] = ",",
+      skip_rows: int = 0, rotor_temperature: Union[float, np.ndarray] = 75) -> None``
+
+      Добавляет к накопленным суммам потери энергии по графику нагрузки.
+
+    * ``get_duration() -> float``
+
+      Возвращает продолжительность учтённой части графика.
+
+    * ``get_total_energy() -> float``
+
+      Возвращает полные потери энергии.
+
+    * ``get_annual_energy() -> np.ndarray``
+
+      Возвращает потери энергии по составляющим, приведённые к году.
+
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
+    """
+
+    __slots__ = ["time_step",
+                 "chunk_size",
+                 "energy",
+                 "point_count",
+                 "skipped_count"]
+
+    # Часов в году
+    HOURS_PER_YEAR = 8760
+
+    def __init__(self,
+                 time_step: float = 1,
+                 chunk_size: int = 65536
+                 ) -> None:
+        """
+        :param time_step: Шаг графика по времени, ч. Для минутного графика --- ``1 / 60``.
+        :param chunk_size: Число точек графика, обрабатываемых за раз.
+        """
+
+        self.time_step = time_step
+        self.chunk_size = chunk_size
+
+        self.energy = np.zeros(len(COMPONENTS))  # Потери энергии по составляющим, кВт∙ч
+        self.point_count: int = 0  # Число учтённых точек
+        self.skipped_count: int = 0  # Число пропущенных точек
+
+    def reset(self) -> None:
+        """
+        Метод, обнуляющий накопленные суммы.
+        """
+
+        self.energy = np.zeros(len(COMPONENTS))
+        self.point_count = 0
+        self.skipped_count = 0
+
+    def compute_energy(self,
+                       profile: Union[str, os.PathLike, np.ndarray, Iterable[np.ndarray]],
+                       losses: Losses,
+                       mag_circuit: LoadedMagneticCircuit,
+                       rotor: TurboMachineRotor,
+                       bandaging: TurboMachineRotorBandaging,
+                       stator_length: float,
+                       xs: Reactances,
+                       magnetizing_current: float,
+                       no_load_flow: float,
+                       no_load_current: float,
+                       exc_efficiency: float,
+                       voltage: float,
+                       current: float,
+                       iterate: bool = False,
+                       columns: Sequence[int] = (0, 1),
+                       delimiter: Optional[str] = ",",
+                       skip_rows: int = 0,
+                       rotor_temperature: Union[float, np.ndarray] = 75
+                       ) -> None:
+        """
+        Метод, добавляющий к накопленным суммам потери энергии по графику нагрузки. Чтобы считать график заново,
+        суммы нужно предварительно обнулить методом ``reset``; так длинный график можно передавать и по частям.
+
+        :param profile: График нагрузки: путь к файлу ``.npy`` или к текстовому файлу (CSV и т. п.), двумерный массив
+            или последовательность двумерных массивов (порций). Активная мощность, кВт, и реактивная, квар, берутся из
+            столбцов ``columns``.
+        :param losses: Потери машины, рассчитанные для номинального режима.
+        :param mag_circuit: Магнитная цепь под нагрузкой. Должны быть рассчитаны реакция якоря для номинального тока
+            и ток ротора при коротком замыкании.
+        :param rotor: Ротор машины.
+        :param bandaging: Бандаж ротора.
+        :param stator_length: Длина сердечника статора, мм.
+        :param xs: Индуктивные сопротивления машины.
+        :param magnetizing_current: Ток намагничивания на холостом ходу, А.
+        :param no_load_flow: Поток статора на холостом ходу, Вб.
+        :param no_load_current: Ток ротора на холостом ходу, А.
+        :param exc_efficiency: КПД возбудителя.
+        :param voltage: Номинальное линейное напряжение, В.
+        :param current: Номинальный ток статора, А.
+        :param iterate: Уточнять ли поток рассеяния итерациями (см.
+            ``LoadedMagneticCircuit.compute_rotor_flow_iteratively``).
+        :param columns: Номера столбцов активной и реактивной мощности.
+        :param delimiter: Разделитель столбцов текстового файла. ``None`` --- пробельные символы.
+        :param skip_rows: Число строк заголовка текстового файла.
+        :param rotor_temperature: Температура обмотки ротора, °C. Должна совпадать с той, при которой рассчитаны
+            потери на возбуждение в номинальном режиме (см. ``Losses.compute_excitation_losses``).
+        """
+
+        nominal_power = math.sqrt(3) * voltage * current / 1e3
+        load_independent = losses.get_total_OC_losses() + losses.mechanical
+
+        for chunk in self.__read_chunks(profile, columns, delimiter, skip_rows):
+            active, reactive = chunk[:, 0], chunk[:, 1]
+            apparent = np.hypot(active, reactive)
+
+            # Без нагрузки направление вектора мощности не определено - считаем его чисто активным
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cos_phi = np.where(apparent > 0, active / apparent, 1)
+                sin_phi = np.where(apparent > 0, reactive / apparent, 0)
+
+                chart = mag_circuit.get_operating_points(rotor, bandaging, stator_length, apparent / nominal_power,
+                                                         cos_phi, sin_phi, xs.x_stator, xs.x_P, magnetizing_current,
+                                                         no_load_flow, no_load_current, iterate)
+                components = np.stack(get_load_dependent_losses(losses, mag_circuit, rotor, chart, exc_efficiency,
+                                                                rotor_temperature))
+
+            valid = np.isfinite(components).all(axis=0)
+            count = int(np.count_nonzero(valid))
+
+            self.energy[0] += load_independent * count * self.time_step
+            self.energy[1:] += components[:, valid].sum(axis=1) * self.time_step
+            self.point_count += count
+            self.skipped_count += valid.size - count
+
+    def get_duration(self) -> float:
+        """
+        Метод, возвращающий продолжительность учтённой части графика.
+
+        :return: Продолжительность, ч.
+        """
+
+        return self.point_count * self.time_step
+
+    def get_total_energy(self) -> float:
+        """
+        Метод, возвращающий полные потери энергии.
+
+        :return: Потери энергии, кВт∙ч.
+        """
+
+        return float(self.energy.sum())
+
+    def get_annual_energy(self) -> np.ndarray:
+        """
+        Метод, возвращающий потери энергии по составляющим, приведённые к году: накопленные суммы, умноженные на
+        отношение продолжительности года к продолжительности учтённой части графика.
+
+        :return: Потери энергии в порядке ``COMPONENTS``, кВт∙ч/год.
+        """
+
+        if self.point_count == 0:
+            raise ValueError("График нагрузки не задан")
+
+        return self.energy * self.HOURS_PER_YEAR / self.get_duration()
+
+    def __read_chunks(self,
+                      profile: Union[str, os.PathLike, np.ndarray, Iterable[np.ndarray]],
+                      columns: Sequence[int],
+                      delimiter: Optional[str],
+                      skip_rows: int
+                      ) -> Iterator[np.ndarray]:
+        """
+        Вспомогательный метод, читающий график нагрузки порциями.
+
+        :param profile: График нагрузки, см. ``compute_energy``.
+        :param columns: Номера столбцов активной и реактивной мощности.
+        :param delimiter: Разделитель столбцов текстового файла.
+        :param skip_rows: Число строк заголовка текстового файла.
+        :return: Порции графика: массивы формы (число точек, 2).
+        """
+
+        columns = list(columns)
+
+        if isinstance(profile, (str, os.PathLike)):
+            if os.fspath(profile).endswith(".npy"):
+                # Файл отображается в память, и в неё попадает лишь текущая порция
+                data = np.load(profile, mmap_mode="r")
+                for start in range(0, data.shape[0], self.chunk_size):
+                    yield np.asarray(data[start:start + self.chunk_size, columns], dtype=float)
+                return
+
+            with open(profile) as file:
+                for _ in itertools.islice(file, skip_rows):
+                    pass
+
+                while True:
+                    lines = list(itertools.islice(file, self.chunk_size))
+                    if not lines:
+                        return
+
+                    # Порция из одних пустых строк (например, в конце файла) данных не содержит
+                    if not any(line.strip() for line in lines):
+                        continue
+
+                    # Пустые ячейки (пропуски в выгрузках SCADA) читаются как NaN, и такие точки пропускаются
+                    yield np.genfromtxt(lines, delimiter=delimiter, usecols=columns,
+                                        filling_values=np.nan).reshape(-1, 2)
+
+        elif isinstance(profile, np.ndarray):
+            for start in range(0, profile.shape[0], self.chunk_size):
+                yield np.asarray(profile[start:start + self.chunk_size, columns], dtype=float)
+
+        else:
+            for chunk in profile:
+                yield np.asarray(chunk, dtype=float)[:, columns]
+
+
+__all__ = ["COMPONENTS", "EnergyLosses"]
@@ -1,19 +1,47 @@
 import math
 from typing import Dict, Optional, Union
-from scipy import interpolate
 
+import numpy as np
+
+from common.designContext import DesignSingleton
 from common.stator import ACMachineStator
 from common.steelDatabase import Steel
-from turbo.magneticCircuit import LoadedMagneticCircuit, NoLoadMagneticCircuit
+from turbo.magneticCircuit import LoadedMagneticCircuit, NoLoadMagneticCircuit, Section
 from turbo.mass import Mass
 from turbo.rotor import *
 
 
-class Losses:
+# Эмпирические кривые для потерь при КЗ: коэффициент phi_gamma от отношения обмотанной поверхности ротора к полной и
+# коэффициент phi_beta от укорочения обмотки статора. Раньше на каждый объект Losses создавалось по интерполятору
+# scipy, а теперь таблицы общие на модуль и неизменяемые
+PHI_GAMMA_TABLE = (np.arange(60, 86) / 100,
+                   np.array([12.8, 11.6, 10.4, 9.2, 8.2, 7.2, 6.4, 5.8, 5.4, 5.2, 5.2, 5.4, 5.6, 6.2, 6.6, 7.4, 8, 8.8,
+                             9.6, 10.6, 11.4, 12.4, 13.2, 14, 15.2, 16.2]))
+PHI_BETA_TABLE = (np.arange(40, 101) / 100,
+                  np.array([2.8, 3.2, 3.8, 4.4, 5.2, 6.2, 7.2, 8.6, 9.8, 11.1, 12.2, 13.2, 15.1, 16.3, 17.2, 18.6,
+                            19.6, 20.1, 20.3, 20.4, 21.5, 21.6, 21.3, 21.2, 20.9, 20.5, 19.8, 17.7, 16.8, 14.9, 13.4,
+                            11.8, 10.2, 8.6, 7.2, 5.7, 4.4, 3.1, 2.1, 1.6, 1.4, 1.4, 1.6, 2.1, 2.8, 4.0, 5.2, 6.4, 7.8,
+                            9.4, 11.8, 14.1, 16.5, 18.2, 20.4, 22.2, 23.3, 24.0, 24.5, 24.8, 25.0]))
+
+for _table in (*PHI_GAMMA_TABLE, *PHI_BETA_TABLE):
+    _table.flags.writeable = False
+del _table
+
+
+def phi_gamma(surface_relation: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    # Линейная интерполяция по таблице, как у прежнего interp1d. Экстраполяции нет: вне таблицы получается NaN, чтобы
+    # пакетный расчёт мог отбросить такие варианты, а не падать целиком
+    return np.interp(surface_relation, *PHI_GAMMA_TABLE, left=np.nan, right=np.nan)
+
+
+def phi_beta(shortening: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    # Так же по таблице и с NaN вне её: коэффициент для потерь на поверхности ротора от высших гармоник поля статора
+    return np.interp(shortening, *PHI_BETA_TABLE, left=np.nan, right=np.nan)
+
+
+class Losses(DesignSingleton):
     __slots__ = ["__stator_steel",
                  "__freq_reduced",
-                 "__phi_gamma",
-                 "__phi_beta",
                  "stator_ohmic",
                  "stator_copper",
                  "stator_SC_surface_harmonics",
@@ -48,36 +76,12 @@ class Losses:
                  "Field_coefficient"
                  ]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self,
                  stator_steel: Union[Dict[str, Steel], Steel],
                  frequency: float) -> None:
         self.__stator_steel = stator_steel
         self.__freq_reduced: float = frequency / 50
 
-        # А вот так. Я сразу создам эту дурную функцию (или что оно там такое? Интерполятор?), дабы оно создавалось лишь
-        # раз и потом можно было сколько угодно вызывать метод, её (его) использующий. А то вот что-то мне подсказывает,
-        # что нужны будут графики потом...
-        gamma = [i / 100 for i in range(60, 86)]
-        phi_gamma = [12.8, 11.6, 10.4, 9.2, 8.2, 7.2, 6.4, 5.8, 5.4, 5.2, 5.2, 5.4, 5.6, 6.2, 6.6, 7.4, 8, 8.8, 9.6,
-                     10.6, 11.4, 12.4, 13.2, 14, 15.2, 16.2]
-        self.__phi_gamma = interpolate.interp1d(gamma, phi_gamma, kind="linear")
-
-        # И ещё разок!
-        beta = [i / 100 for i in range(40, 101)]
-        phi_beta = [2.8, 3.2, 3.8, 4.4, 5.2, 6.2, 7.2, 8.6, 9.8, 11.1, 12.2, 13.2, 15.1, 16.3, 17.2, 18.6, 19.6, 20.1,
-                    20.3, 20.4, 21.5, 21.6, 21.3, 21.2, 20.9, 20.5, 19.8, 17.7, 16.8, 14.9, 13.4, 11.8, 10.2, 8.6, 7.2,
-                    5.7, 4.4, 3.1, 2.1, 1.6, 1.4, 1.4, 1.6, 2.1, 2.8, 4.0, 5.2, 6.4, 7.8, 9.4, 11.8, 14.1, 16.5, 18.2,
-                    20.4, 22.2, 23.3, 24.0, 24.5, 24.8, 25.0]
-        self.__phi_beta = interpolate.interp1d(beta, phi_beta, kind="linear")
-
         # Все потери в киловаттах
         self.stator_ohmic: Optional[float] = None  # Омические потери в статоре
         self.stator_copper: Optional[float] = None  # Полные потери в обмотке статора
@@ -125,9 +129,10 @@ class Losses:
     def compute_stator_copper_losses(self,
                                      stator: ACMachineStator,
                                      current: float,
-                                     phase_count: int
+                                     phase_count: int,
+                                     temperature: Union[float, np.ndarray] = 75  # Температура обмотки, °C
                                      ) -> None:
-        self.stator_ohmic = phase_count * stator.armature.resistance[75] * current ** 2 / 1e3
+        self.stator_ohmic = phase_count * stator.armature.get_resistance(temperature) * current ** 2 / 1e3
         self.Field_coefficient = 1 + 0.107 * (stator.armature.rows * stator.armature.columns *
                                               stator.armature.wire.wire_width * stator.effective_wires
                                               / stator.slot_width * self.__freq_reduced) ** 2 *\
@@ -148,7 +153,11 @@ class Losses:
         # Очередной дурной коэффициент. А вообще, если сделать график вот этого, то можно понять, что оно очень похоже
         # на некоторую элементарную функцию. Что мешало просто дать формулу для неё - тайна сия велика есть.  А степень
         # 7.5 - это, конечно, красота, да-а-а... На кол посадить мало за такое
-        self.stator_SC_surface_harmonics = self.__phi_gamma(rotor.surface_relation) * MMF_freq_15 *\
+        phi = phi_gamma(rotor.surface_relation)
+        if math.isnan(phi):
+            raise ValueError("Отношение обмотанной поверхности ротора к полной вне таблицы phi_gamma")
+
+        self.stator_SC_surface_harmonics = phi * MMF_freq_15 *\
             stator.effective_length * stator.inner_diameter ** 3 / rotor.outer_diameter ** 3.5 / 10 ** 7.5
 
         aux = 2 * math.pi * rotor.air_gap / rotor.tooth_pitch
@@ -167,7 +176,11 @@ class Losses:
                                         pole_pairs: int) -> None:
         freq_15 = self.__freq_reduced ** 1.5
 
-        self.rotor_SC_surface_harmonics = self.__phi_beta(stator.armature.shortening) * freq_15 * \
+        phi = phi_beta(stator.armature.shortening)
+        if math.isnan(phi):
+            raise ValueError("Укорочение обмотки статора вне таблицы phi_beta")
+
+        self.rotor_SC_surface_harmonics = phi * freq_15 * \
                                           stator.inner_diameter ** 5 / pole_pairs ** 4 * rotor.length * \
                                           (stator.current_load / mag_circuit.air_gap_coef / rotor.air_gap) ** 2 / 1e20
 
@@ -201,11 +214,11 @@ class Losses:
         # Тут у нас начинаются удельные потери в стали. А поскольку сталь у нас может быть словарём или просто сталью,
         # то надо проверять, что происходит
         if type(self.__stator_steel) is dict:
-            W_a = self.__stator_steel["yoke"].losses_curve(mag_circuit.B_field["stator yoke"])
-            W_z = self.__stator_steel["teeth"].losses_curve(mag_circuit.B_field["stator teeth"])
+            W_a = self.__stator_steel["yoke"].losses_curve(mag_circuit.B_field[Section.STATOR_YOKE])
+            W_z = self.__stator_steel["teeth"].losses_curve(mag_circuit.B_field[Section.STATOR_TEETH])
         else:
-            W_a = self.__stator_steel.losses_curve(mag_circuit.B_field["stator yoke"])
-            W_z = self.__stator_steel.losses_curve(mag_circuit.B_field["stator yoke"])
+            W_a = self.__stator_steel.losses_curve(mag_circuit.B_field[Section.STATOR_YOKE])
+            W_z = self.__stator_steel.losses_curve(mag_circuit.B_field[Section.STATOR_YOKE])
 
         freq_15 = self.__freq_reduced ** 1.5
 
@@ -237,7 +250,7 @@ class Losses:
                                         ) -> None:
         self.rotor_add_surface = 5.1 / math.sqrt(stator.slot_count) * stator.effective_length *\
             self.__freq_reduced ** 1.5 * stator.inner_diameter ** 3 / pole_pairs ** 1.5 *\
-            (mag_circuit.B_field["air gap"] * (mag_circuit.stator_teeth_air_gap_coef - 1)) ** 2 / 1e8
+            (mag_circuit.B_field[Section.AIR_GAP] * (mag_circuit.stator_teeth_air_gap_coef - 1)) ** 2 / 1e8
 
     def compute_OC_steel_losses(self,
                                 stator: ACMachineStator,
@@ -279,9 +292,9 @@ class Losses:
             # Странный, непонятный коэффициент, названия коему я не видел
             beta = math.pi / 10 * math.sqrt(stator.pressure_plate_thickness / stator_yoke_height * self.__freq_reduced *
                                             (1 + copper_screen / stator.pressure_plate_thickness))
-            phi_beta = 155 * (10 / beta) ** 2 / stator_yoke_height
+            phi_beta_plate = 155 * (10 / beta) ** 2 / stator_yoke_height
 
-            self.screen_and_plate = phi_beta * (0.16 * stator.pressure_plate_thickness + 3.2 * copper_screen) /\
+            self.screen_and_plate = phi_beta_plate * (0.16 * stator.pressure_plate_thickness + 3.2 * copper_screen) /\
                 (stator.outer_diameter - 2 * stator_yoke_height) *\
                 (mag_circuit.stator_reaction_MMF * self.__freq_reduced / beta / pole_pairs) ** 2 / 1e11
             self.end_part_yoke = 0.015 * stator_yoke_height * mag_circuit.stator_reaction_MMF ** 2 / beta /\
@@ -296,9 +309,10 @@ class Losses:
     def compute_excitation_losses(self,
                                   rotor: TurboMachineRotor,
                                   mag_circuit: LoadedMagneticCircuit,
-                                  exc_efficiency: float  # КПД возбудителя
+                                  exc_efficiency: float,  # КПД возбудителя
+                                  temperature: Union[float, np.ndarray] = 75  # Температура обмотки, °C
                                   ) -> None:
-        self.excitation = (mag_circuit.nominal_field_current ** 2 * rotor.armature.resistance[75] +
+        self.excitation = (mag_circuit.nominal_field_current ** 2 * rotor.armature.get_resistance(temperature) +
                            2 * mag_circuit.nominal_field_current) / exc_efficiency / 1e3
 
     def __compute_bearing_losses(self,
@@ -346,7 +360,8 @@ class Losses:
         air_flow_rate = (sc_losses + oc_losses + self.excitation +
                          self.rotor_friction + self.bandaging_friction + channel) /\
                         1.1 / (overheat_gen - overheat_vent)
-        if air_flow_rate < 0:
+        # При расчёте для массива температур обмоток расход тоже получается массивом
+        if np.any(air_flow_rate < 0):
             raise ValueError("Отрицательное значение расхода воздуха на вентиляцию")
 
         self.ventilation = 1.1 * air_flow_rate * overheat_vent
@@ -391,4 +406,4 @@ class Losses:
         return power / (power + losses)
 
 
-__all__ = "Losses"
+__all__ = ["PHI_GAMMA_TABLE", "PHI_BETA_TABLE", "phi_gamma", "phi_beta", "Losses"]
@@ -4,24 +4,206 @@
 #       описывающим характеристики намагничивания стали соответственно вдоль и поперёк проката, либо объект типа
 #       ``Steel``, описывающий усреднённую характеристику намагничивания стали.
 
+from common.designContext import DesignSingleton
 from common.stator import ACMachineStator
 from common.steelDatabase import Steel
 from turbo.rotor import TurboMachineRotor, TurboMachineRotorBandaging
 
 from abc import ABC
-from typing import Optional, Union, Dict, Tuple
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Optional, Union, Dict, Tuple
 import numpy as np
 import math
 
 
-class MagneticCircuit(ABC):
+# Участки магнитной цепи. Значение - номер участка по последней оси массивов длин линий, сечений, индукций,
+# напряжённостей и МДС. Порядок общий для MagneticCircuit и BatchMagneticCircuit, так что пакетный расчёт - это тот же
+# расчёт с ещё одной (первой) осью по вариантам
+class Section(IntEnum):
+    AIR_GAP = 0
+    STATOR_YOKE = 1
+    STATOR_TEETH = 2
+    ROTOR_YOKE = 3
+    ROTOR_TEETH_02 = 4
+    ROTOR_TEETH_07 = 5
+    ROTOR_TEETH_SLOTS_02 = 6
+    ROTOR_TEETH_SLOTS_07 = 7
+
+
+# Старые названия участков (бывшие ключи словарей) в том же порядке - для вывода результатов и прочей совместимости
+SECTION_NAMES = ("air gap",
+                 "stator yoke",
+                 "stator teeth",
+                 "rotor yoke",
+                 "rotor teeth 0.2",
+                 "rotor teeth 0.7",
+                 "rotor teeth slots 0.2",
+                 "rotor teeth slots 0.7")
+
+STATOR_SECTIONS = slice(Section.AIR_GAP, Section.ROTOR_YOKE)  # Участки статора (вместе с зазором)
+ROTOR_SECTIONS = slice(Section.ROTOR_YOKE, len(Section))  # Участки ротора
+# Участки зубцов ротора - те, для которых есть коэффициенты ответвления потока
+ROTOR_TEETH_SECTIONS = slice(Section.ROTOR_TEETH_02, len(Section))
+
+
+def _frozen_array(values) -> np.ndarray:
+    # Вспомогательная функция: массив из чисел, где None (отсутствующий участок) становится NaN. Массив сразу делается
+    # доступным только для чтения, чтобы геометрию, общую для нескольких цепей, никто случайно не испортил
+    array = np.array([np.nan if value is None else value for value in values], dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+# Геометрия магнитной цепи: длины магнитных линий, сечения, коэффициенты ответвления потока, коэффициенты зазора и
+# проводимость поперечно-пазового рассеяния. Всё это зависит только от статора, ротора и числа пар полюсов, но не от
+# режима работы, так что считается один раз на вариант машины и потом раздаётся сколько угодно магнитным цепям - и
+# холостого хода, и под нагрузкой, и при любом числе рабочих точек. Объект неизменяемый (массивы тоже доступны только
+# для чтения), так что делить его между цепями безопасно
+@dataclass(frozen=True, eq=False)
+class MagneticGeometry:
+    lines: np.ndarray  # Длины магнитных линий по участкам Section, см. NaN - участка нет
+    sections: np.ndarray  # Сечения по участкам Section, м². NaN - участка нет
+    rotor_branching_factors: np.ndarray  # Коэффициенты ответвления потока в пазы по участкам ROTOR_TEETH_SECTIONS
+    stator_teeth_air_gap_coef: float  # Коэф-т зазора, обусловленный зубчатостью статора
+    stator_vent_air_gap_coef: float  # Коэф-т зазора, обусловленный вент. каналами статора
+    stator_step_air_gap_coef: float  # Коэф-т зазора, обусловленный ступ-тью крайних пакетов
+    rotor_teeth_air_gap_coef: float  # Коэф-т зазора, обусловленный зубчатостью ротора
+    air_gap_coef: float  # Общий коэффициент зазора
+    lambda_2: float  # Магнитная проводимость для поперечно-пазового рассеяния
+
+    @classmethod
+    def from_design(cls,
+                    stator: ACMachineStator,
+                    rotor: TurboMachineRotor,
+                    pole_pairs: int
+                    ) -> "MagneticGeometry":
+        # Длина магнитных линий в разных кусках машины (в порядке Section). Вот за этим и подаём на вход целые ротор со
+        # статором
+        rotor_tooth_magnetic_line = rotor.get_tooth_half_magnetic_line()
+        rotor_tooth_slot_magnetic_line = rotor.get_tooth_slot_half_magnetic_line()
+        lines = _frozen_array([rotor.air_gap * 0.1,
+                               stator.get_yoke_magnetic_line(pole_pairs, rotor.surface_relation),
+                               stator.get_tooth_magnetic_line(),
+                               rotor.get_yoke_magnetic_line(pole_pairs),
+                               rotor_tooth_magnetic_line,
+                               rotor_tooth_magnetic_line,
+                               rotor_tooth_slot_magnetic_line,
+                               rotor_tooth_slot_magnetic_line])
+
+        # Сечения в разных кусках машины. Нужны для индукций
+        sections = _frozen_array([rotor.get_air_gap_section(pole_pairs, stator.length),
+                                  2 * stator.get_yoke_section(stator.effective_length),
+                                  stator.get_teeth_section_third(stator.effective_length),
+                                  2 * rotor.get_yoke_section(),
+                                  rotor.get_teeth_section_02(pole_pairs),
+                                  rotor.get_teeth_section_07(pole_pairs),
+                                  rotor.get_teeth_section_slot_02(pole_pairs),
+                                  rotor.get_teeth_section_slot_07(pole_pairs)])
+
+        rotor_branching_factors = _frozen_array([rotor.get_flow_branching_factor_02(),
+                                                 rotor.get_flow_branching_factor_07(),
+                                                 rotor.get_flow_branching_factor_slot_02(),
+                                                 rotor.get_flow_branching_factor_slot_07()])
+
+        # Да-а-а, детка, ещё... Больше коэффициентов... Обожаю их... Ты так шикарно считаешь коэффициенты...
+        stator_teeth_air_gap_coef = 1 + stator.slot_width ** 2 /\
+            (stator.tooth_pitch * (stator.slot_width + 5 * rotor.air_gap) - stator.slot_width ** 2)
+
+        if stator.vent_channel_count is not None:
+            length = stator.length - stator.vent_channel_width * stator.vent_channel_count
+            if stator.bypass_thickness is not None:
+                length -= 2 * stator.bypass_thickness
+            package_width = length / (stator.vent_channel_count + 1)
+            stator_vent_air_gap_coef = 1 + stator.vent_channel_width ** 2 /\
+                ((stator.vent_channel_width + package_width) * (5 * rotor.air_gap + stator.vent_channel_width) -
+                 stator.vent_channel_width ** 2)
+        else:
+            stator_vent_air_gap_coef = 1
+
+        stator_step_air_gap_coef = 1 + 5 / math.sqrt(rotor.air_gap * (stator.length + rotor.length) / 2)
+        rotor_teeth_air_gap_coef = 1 + rotor.surface_relation / 2 * rotor.slot_width ** 2 /\
+            (rotor.tooth_pitch * (rotor.slot_width + 5 * rotor.air_gap) - rotor.slot_width ** 2)
+        air_gap_coef = stator_teeth_air_gap_coef + stator_vent_air_gap_coef + stator_step_air_gap_coef +\
+            rotor_teeth_air_gap_coef - 3
+
+        # Да, я знаю, обычно я стараюсь давать понятные имена переменных, но писать что-то в духе
+        # magnetic_conductivity_for_rotor_dispersion_flow или ещё что почище - это слишком. Нет. Я отказываюсь
+        lambda_2 = rotor.length * pole_pairs / rotor.slot_count * \
+            ((rotor.slot_height - rotor.wedge_height - rotor.armature.insulation.all_fillings() -
+              rotor.armature.insulation.body_insulation) / 2 / rotor.slot_width +
+             (rotor.armature.insulation.wedge_filling + rotor.wedge_height) / rotor.wedge_width +
+             rotor.air_gap / (2 * rotor.tooth_pitch + rotor.air_gap / 2))
+
+        return cls(lines, sections, rotor_branching_factors,
+                   stator_teeth_air_gap_coef, stator_vent_air_gap_coef, stator_step_air_gap_coef,
+                   rotor_teeth_air_gap_coef, air_gap_coef, lambda_2)
+
+
+def solve_increasing(function: Callable[[np.ndarray], np.ndarray],
+                     targets: np.ndarray,
+                     initial_guess: np.ndarray,
+                     tolerance: float = 1e-10,
+                     max_iterations: int = 50
+                     ) -> np.ndarray:
+    # Поэлементное решение уравнения function(x) = targets относительно x >= 0 для возрастающей функции (как ток ротора
+    # от уровня напряжения). Функция должна принимать массив формы targets.shape с любыми лишними осями в конце - так
+    # значение и приращение для производной считаются за один её вызов. function(0) не обязана быть нулём: у
+    # характеристик холостого хода ток ротора при нулевом напряжении - несколько ампер из-за МДС зазора и стали.
+    # Заданным значениям меньше function(0) неотрицательное решение не соответствует, для них возвращается NaN.
+    # Метод - Ньютон с вилкой: производная берётся конечной разностью, а если шаг Ньютона выводит за вилку, где
+    # гарантированно лежит корень (например, на скачке характеристики при 2.05 Тл в зубцах ротора), вместо него
+    # делается шаг деления вилки пополам. Так что сходимость есть всегда, а на гладких участках - квадратичная
+    if np.any(targets < 0):
+        raise ValueError("Заданные значения должны быть неотрицательными")
+
+    x = np.array(np.broadcast_to(initial_guess, targets.shape), dtype=float)
+    x[~np.isfinite(x)] = 0
+
+    # Вилка: снизу ноль, сверху - удвоение, пока значение функции не перекроет заданное. Недостижимые снизу значения
+    # временно заменяются на function(0), чтобы не мешать остальным
+    lower = np.zeros_like(x)
+    lower_values = function(lower)
+    below = targets < lower_values
+    targets = np.where(below, lower_values, targets)
+
+    upper = np.maximum(2 * x, 1)
+    for _ in range(64):
+        short = function(upper) < targets
+        if not short.any():
+            break
+        upper = np.where(short, 2 * upper, upper)
+    else:
+        raise ValueError("Не удалось найти решение: заданные значения недостижимы")
+
+    x = np.clip(x, lower, upper)
+    for _ in range(max_iterations):
+        step = 1.5e-8 * np.maximum(x, 1)
+        values, shifted_values = np.moveaxis(function(np.stack([x, x + step], axis=-1)), -1, 0)
+
+        residual = values - targets
+        lower = np.where(residual <= 0, x, lower)
+        upper = np.where(residual >= 0, x, upper)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = x - residual * step / (shifted_values - values)
+        new_x = np.where((newton > lower) & (newton < upper), newton, (lower + upper) / 2)
+
+        converged = np.abs(new_x - x) <= tolerance * np.maximum(x, 1)
+        x = new_x
+        if converged.all():
+            break
+
+    return np.where(below, np.nan, x)
+
+
+class MagneticCircuit(DesignSingleton, ABC):
     __slots__ = ["stator_steel",
                  "rotor_steel",
+                 "geometry",
                  "_lines",
                  "_sections",
                  "_rotor_branching_factors",
-                 "_stator_keys",
-                 "_rotor_keys",
                  "stator_teeth_air_gap_coef",
                  "stator_vent_air_gap_coef",
                  "stator_step_air_gap_coef",
@@ -39,144 +221,72 @@ class MagneticCircuit(ABC):
                  "total_MMF"
                  ]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self,
                  stator: ACMachineStator,
                  rotor: TurboMachineRotor,
                  stator_steel: Union[Dict[str, Steel], Steel],
                  rotor_steel: Steel,
                  pole_pairs: int,
-                 fill_factor: float
+                 fill_factor: float,
+                 geometry: Optional[MagneticGeometry] = None
                  ) -> None:
-        # Значит так. Тут я решил пользоваться словарями для хранения данных вместо отдельных атрибутов, как в статоре и
-        # роторе, потому что тут всё одинаково. Более или менее. А вот там полнейший разброд и шатание, так что там
-        # такие аккуратные структурки не сделаешь. Чёрт возьми
+        # Значит так. Тут я решил хранить данные по участкам цепи в массивах (номер участка - Section) вместо отдельных
+        # атрибутов, как в статоре и роторе, потому что тут всё одинаково. Более или менее. А вот там полнейший разброд
+        # и шатание, так что там такие аккуратные структурки не сделаешь. Чёрт возьми
 
         # Сталька статора. Или две. Смотря чего расчётчик захочет
         self.stator_steel = stator_steel
         self.rotor_steel = rotor_steel  # Сталька ротора. Всегда одна
 
-        # Длина магнитных линий в разных кусках машины. Вот за этим и подаём на вход целые ротор со статором
-        rotor_tooth_magnetic_line = rotor.get_tooth_half_magnetic_line()
-        rotor_tooth_slot_magnetic_line = rotor.get_tooth_slot_half_magnetic_line()
-        self._lines: Dict[str, Optional[float]] =\
-            {"air gap": rotor.air_gap * 0.1,
-             "stator yoke": stator.get_yoke_magnetic_line(pole_pairs, rotor.surface_relation),
-             "stator teeth": stator.get_tooth_magnetic_line(),
-             "rotor yoke": rotor.get_yoke_magnetic_line(pole_pairs),
-             "rotor teeth 0.2": rotor_tooth_magnetic_line,
-             "rotor teeth 0.7": rotor_tooth_magnetic_line,
-             "rotor teeth slots 0.2": rotor_tooth_slot_magnetic_line,
-             "rotor teeth slots 0.7": rotor_tooth_slot_magnetic_line}
+        # Геометрию можно передать готовой (общей для нескольких цепей одного варианта машины), а можно и не передавать
+        if geometry is None:
+            geometry = MagneticGeometry.from_design(stator, rotor, pole_pairs)
+        self.geometry = geometry
 
-        # Сечения в разных кусках машины. Нужны для индукций
-        self._sections: Dict[str, Optional[float]] =\
-            {"air gap": rotor.get_air_gap_section(pole_pairs, stator.length),
-             "stator yoke": 2 * stator.get_yoke_section(stator.effective_length),
-             "stator teeth": stator.get_teeth_section_third(stator.effective_length),
-             "rotor yoke": 2 * rotor.get_yoke_section(),
-             "rotor teeth 0.2": rotor.get_teeth_section_02(pole_pairs),
-             "rotor teeth 0.7": rotor.get_teeth_section_07(pole_pairs),
-             "rotor teeth slots 0.2": rotor.get_teeth_section_slot_02(pole_pairs),
-             "rotor teeth slots 0.7": rotor.get_teeth_section_slot_07(pole_pairs)}
-
-        self._rotor_branching_factors: Dict[str, Optional[float]] =\
-            {"rotor teeth 0.2": rotor.get_flow_branching_factor_02(),
-             "rotor teeth 0.7": rotor.get_flow_branching_factor_07(),
-             "rotor teeth slots 0.2": rotor.get_flow_branching_factor_slot_02(),
-             "rotor teeth slots 0.7": rotor.get_flow_branching_factor_slot_07()}
-
-        # Чисто для простоты рефакторинга: списки ключей
-        self._stator_keys = ["air gap", "stator yoke", "stator teeth"]
-        self._rotor_keys = ["rotor yoke", "rotor teeth 0.2", "rotor teeth 0.7", "rotor teeth slots 0.2",
-                            "rotor teeth slots 0.7"]
-
-        self.stator_teeth_air_gap_coef: Optional[float] = None  # Коэф-т зазора, обусловленный зубчатостью статора
-        self.stator_vent_air_gap_coef: Optional[float] = None  # Коэф-т зазора, обусловленный вент. каналами статора
-        self.stator_step_air_gap_coef: Optional[float] = None  # Коэф-т зазора, обусловленный ступ-тью крайних пакетов
-        self.rotor_teeth_air_gap_coef: Optional[float] = None  # Коэф-т зазора, обусловленный зубчатостью ротора
-        self.air_gap_coef: Optional[float] = None  # Общий коэффициент зазора
-        # Да-а-а, детка, ещё... Больше коэффициентов... Обожаю их... Ты так шикарно считаешь коэффициенты...
+        # Старые имена оставлены ради совместимости: это те же объекты, что и в геометрии, а не копии
+        self._lines = geometry.lines
+        self._sections = geometry.sections
+        self._rotor_branching_factors = geometry.rotor_branching_factors
 
-        self.__compute_air_gap_coefficients(stator, rotor)  # Сразу и посчитаем, почему бы и нет
+        self.stator_teeth_air_gap_coef = geometry.stator_teeth_air_gap_coef
+        self.stator_vent_air_gap_coef = geometry.stator_vent_air_gap_coef
+        self.stator_step_air_gap_coef = geometry.stator_step_air_gap_coef
+        self.rotor_teeth_air_gap_coef = geometry.rotor_teeth_air_gap_coef
+        self.air_gap_coef = geometry.air_gap_coef
 
         self.stator_flow: Optional[float] = None  # Поток статора, Вб
         self.rotor_flow: Optional[float] = None  # Поток ротора, D,
 
         # Я очень не хотел выносить это сюда, но увы, иначе пришлось бы пересчитывать при построении характеристики
         # холостого хода, а это нам не надо, ибо так мы теряем скорость
-
-        # Да, я знаю, обычно я стараюсь давать понятные имена переменных, но писать что-то в духе
-        # magnetic_conductivity_for_rotor_dispersion_flow или ещё что почище - это слишком. Нет. Я отказываюсь
-        self.lambda_2: Optional[float] = None  # Магнитная проводимость для поперечно-пазового рассеяния
+        self.lambda_2 = geometry.lambda_2  # Магнитная проводимость для поперечно-пазового рассеяния
         self.phi_s: Optional[float] = None  # Поперечно-пазовый поток рассеяния
         self.phi_b: Optional[float] = None  # Поток рассеяния через бандажи
 
-        self.__compute_lambda_2(rotor, pole_pairs)
-
-        self.B_field: Optional[Dict[str, Optional[float]]] = None  # Словарь значений индукции, Тл
-        self.H_field: Optional[Dict[str, Optional[float]]] = None  # Словарь значений напряжённости, А/см
-        self.MMF: Optional[Dict[str, Optional[float]]] = None  # Словарь значений МДС, А
+        # Значения по участкам Section. У отсутствующих участков (зубцы в области подпазовых каналов) - NaN
+        self.B_field: Optional[np.ndarray] = None  # Индукции, Тл
+        self.H_field: Optional[np.ndarray] = None  # Напряжённости, А/см
+        self.MMF: Optional[np.ndarray] = None  # МДС, А
 
         self.stator_MMF: Optional[float] = None  # МДС на статор, А
         self.total_MMF: Optional[float] = None  # Полная МДС, А
 
-    def __compute_air_gap_coefficients(self,
-                                       stator: ACMachineStator,
-                                       rotor: TurboMachineRotor
-                                       ) -> None:
-        self.stator_teeth_air_gap_coef = 1 + stator.slot_width ** 2 /\
-            (stator.tooth_pitch * (stator.slot_width + 5 * rotor.air_gap) - stator.slot_width ** 2)
-
-        if stator.vent_channel_count is not None:
-            length = stator.length - stator.vent_channel_width * stator.vent_channel_count
-            if stator.bypass_thickness is not None:
-                length -= 2 * stator.bypass_thickness
-            package_width = length / (stator.vent_channel_count + 1)
-            self.stator_vent_air_gap_coef = 1 + stator.vent_channel_width ** 2 /\
-                ((stator.vent_channel_width + package_width) * (5 * rotor.air_gap + stator.vent_channel_width) -
-                 stator.vent_channel_width ** 2)
-        else:
-            self.stator_vent_air_gap_coef = 1
-
-        self.stator_step_air_gap_coef = 1 + 5 / math.sqrt(rotor.air_gap * (stator.length + rotor.length) / 2)
-        self.rotor_teeth_air_gap_coef = 1 + rotor.surface_relation / 2 * rotor.slot_width ** 2 /\
-            (rotor.tooth_pitch * (rotor.slot_width + 5 * rotor.air_gap) - rotor.slot_width ** 2)
-        self.air_gap_coef = self.stator_teeth_air_gap_coef + self.stator_vent_air_gap_coef +\
-            self.stator_step_air_gap_coef + self.rotor_teeth_air_gap_coef - 3
-
-    def __compute_lambda_2(self,
-                           rotor: TurboMachineRotor,
-                           pole_pairs: int
-                           ) -> None:
-        self.lambda_2 = rotor.length * pole_pairs / rotor.slot_count * \
-                        ((rotor.slot_height - rotor.wedge_height - rotor.armature.insulation.all_fillings() -
-                          rotor.armature.insulation.body_insulation) / 2 / rotor.slot_width +
-                         (rotor.armature.insulation.wedge_filling + rotor.wedge_height) / rotor.wedge_width +
-                         rotor.air_gap / (2 * rotor.tooth_pitch + rotor.air_gap / 2))
-
-    def compute_stator_B_fields(self) -> None:
-        self.B_field = {key: self.stator_flow / self._sections[key] for key in self._stator_keys}
+    def _get_stator_H_fields(self,
+                             b_fields: np.ndarray,
+                             rotor_surface_relation: float
+                             ) -> np.ndarray:
+        # Напряжённости на участках статора по массиву индукций формы (..., len(Section)) - хоть для одной точки, хоть
+        # сразу для всей характеристики холостого хода. Участки ротора остаются NaN
 
-    def compute_stator_H_fields(self,
-                                rotor_surface_relation: float
-                                ) -> None:
         # А вот это уже чистый хак - такой величины как напряжённость поля в зазоре в расчёте нет и там сразу считается
-        # МДС. Однако мне тогда придётся оставлять пустое поле, что малость нарушает единство структуры, и писать
-        # отдельно вычисление для МДС зазора. А так я смогу просто написать dictionary comprehension. Но увы,
-        # унифицировать всё не получится, так что тут всё же пришлось использовать явные ключи словарей
+        # МДС. Однако мне тогда придётся оставлять пустое место, что малость нарушает единство структуры, и писать
+        # отдельно вычисление для МДС зазора. А так МДС всех участков считается одним умножением на длины линий
         # Да, кстати, 8000 - это комбинация приводного множителя и коэффициента в формуле
-        self.H_field = {"air gap": 8e3 * self.air_gap_coef * self.B_field["air gap"]}
+        h_fields = np.full_like(b_fields, np.nan)
+        h_fields[..., Section.AIR_GAP] = 8e3 * self.air_gap_coef * b_fields[..., Section.AIR_GAP]
 
-        stator_yoke_eff_B = self.B_field["stator yoke"] * \
-                            (18 - 10 * rotor_surface_relation) / (18 - 9 * rotor_surface_relation)
+        stator_yoke_eff_B = b_fields[..., Section.STATOR_YOKE] * \
+            (18 - 10 * rotor_surface_relation) / (18 - 9 * rotor_surface_relation)
 
         # TODO: А собственно, где этот весь коэффициент ответвления в пазы статора и прочие пафосные названия? Надо
         #  выпытать
@@ -185,57 +295,70 @@ class MagneticCircuit(ABC):
             # Колдуны. Колдуны и ведьмы. Режут ярмо вдоль проката. Говорят, что так в сумме потери меньше. Я помню, что
             # должно быть наоборот, но тут уже не моя забота расследовать, кто прав, а кто нет. Если написанное в двух
             # строках ниже не есть правильно - это на совести тех, кто придумал расчётную методику. Аминь
-            self.H_field["stator yoke"] = float(self.stator_steel["yoke"].BH_curve(stator_yoke_eff_B))
-            self.H_field["stator teeth"] = \
-                float(self.stator_steel["teeth"].BH_curve(self.B_field["stator teeth"]))
+            h_fields[..., Section.STATOR_YOKE] = self.stator_steel["yoke"].BH_curve(stator_yoke_eff_B)
+            h_fields[..., Section.STATOR_TEETH] = \
+                self.stator_steel["teeth"].BH_curve(b_fields[..., Section.STATOR_TEETH])
         else:
-            self.H_field["stator yoke"] = float(self.stator_steel.BH_curve(stator_yoke_eff_B))
-            self.H_field["stator teeth"] = \
-                float(self.stator_steel.BH_curve(self.B_field["stator teeth"]))
+            h_fields[..., Section.STATOR_YOKE] = self.stator_steel.BH_curve(stator_yoke_eff_B)
+            h_fields[..., Section.STATOR_TEETH] = self.stator_steel.BH_curve(b_fields[..., Section.STATOR_TEETH])
+
+        return h_fields
+
+    def _set_rotor_H_fields(self,
+                            b_fields: np.ndarray,
+                            h_fields: np.ndarray,
+                            rotor_yoke_saturation_factor: float
+                            ) -> None:
+        # Напряжённости на участках ротора, дописываются в уже имеющийся массив напряжённостей статора
+        # TODO: Найти нормальный способ считать напряжённости (а заодно и характеристику холостого хода): скачок на
+        #  характеристике - это не серьёзно
+        h_fields[..., Section.ROTOR_YOKE] = self.rotor_steel.BH_curve(b_fields[..., Section.ROTOR_YOKE]) * \
+            rotor_yoke_saturation_factor
+
+        # Кривая намагничивания считается один раз на все зубцы ротора, а участки выше 2.05 Тл подменяются через
+        # np.where. У отсутствующих участков индукция NaN, сравнение с ней ложно, а кривая от NaN даёт NaN - так что
+        # никаких проверок на None не нужно
+        b_teeth = b_fields[..., ROTOR_TEETH_SECTIONS]
+        saturated = (b_teeth - 1.956) * 5.2 / (8 + 6.5 * self._rotor_branching_factors) * 1e4
+        h_fields[..., ROTOR_TEETH_SECTIONS] = np.where(b_teeth > 2.05, saturated, self.rotor_steel.BH_curve(b_teeth))
+
+    @staticmethod
+    def _get_bandage_flow(rotor: TurboMachineRotor,
+                          bandaging: TurboMachineRotorBandaging,
+                          stator_length: float,
+                          stator_flow: Union[float, np.ndarray]
+                          ) -> Union[float, np.ndarray]:
+        # Поток рассеяния через бандажи. Если бандаж магнитный, то считаем, если нет - то нет его
+        if bandaging.ismagnetic:
+            return 1.2 * (bandaging.outer_diameter - bandaging.inner_diameter) / \
+                stator_length * rotor.air_gap * stator_flow / bandaging.offset
+        return 0
+
+    def compute_stator_B_fields(self) -> None:
+        self.B_field = np.full(len(Section), np.nan)
+        self.B_field[STATOR_SECTIONS] = self.stator_flow / self._sections[STATOR_SECTIONS]
+
+    def compute_stator_H_fields(self,
+                                rotor_surface_relation: float
+                                ) -> None:
+        self.H_field = self._get_stator_H_fields(self.B_field, rotor_surface_relation)
 
     def compute_stator_MMF(self) -> None:
-        mmf = {key: self.H_field[key] * self._lines[key] for key in self._stator_keys}
-        self.MMF = mmf
-        self.stator_MMF = sum(mmf.values())
+        self.MMF = self.H_field * self._lines
+        self.stator_MMF = float(self.MMF[STATOR_SECTIONS].sum())
 
     def compute_rotor_B_fields(self) -> None:
-        self.B_field.update({key: self.rotor_flow / self._sections[key] if self._sections[key] is
-                                                                           not None else None for key in self._rotor_keys})
+        # Отсутствующие участки имеют сечение NaN, так что и индукция там получится NaN
+        self.B_field[ROTOR_SECTIONS] = self.rotor_flow / self._sections[ROTOR_SECTIONS]
 
     def compute_rotor_H_fields(self,
                                rotor_yoke_saturation_factor: float
                                ) -> None:
-        # TODO: Найти нормальный способ считать напряжённости (а заодно и характеристику холостого хода): скачок на
-        #  характеристике - это не серьёзно
-        self.H_field["rotor yoke"] = float(self.rotor_steel.BH_curve(self.B_field["rotor yoke"]) *
-                                           rotor_yoke_saturation_factor)
-
-        # А теперь мы вспомним функциональное программирование и заставим змейку прикинуться Haskell'ем и эмулировать
-        # нам zipWith3. Let There Be Rock!
-        # А вообще: мне одному кажется нелогичным, что функция с названием "отобразить" используется не только для
-        # отображений, но и для слияний с помощью функций, тогда как функция с подходящим названием "слить" умеет только
-        # делать списки кортежей из наборов списков? Равно как и наличие функции sum при отсутствии функции product (без
-        # подключений модулей)? Наркоманы, короче
-        def helper(key: str, b_field: float, branching_factor: float) -> Tuple[str, Optional[float]]:
-            if b_field is None:
-                h_field = None
-            elif b_field > 2.05:
-                h_field = (b_field - 1.956) * 5.2 / (8 + 6.5 * branching_factor) * 1e4
-            else:
-                h_field = float(self.rotor_steel.BH_curve(b_field))
-            return key, h_field
-
-        keys = self._rotor_branching_factors.keys()
-        factors = self._rotor_branching_factors.values()
-        b_fields = [self.B_field[key] for key in keys]
-
-        self.H_field.update(map(helper, keys, b_fields, factors))
+        self._set_rotor_H_fields(self.B_field, self.H_field, rotor_yoke_saturation_factor)
 
     def compute_rotor_MMF(self) -> None:
-        mmf = {key: self.H_field[key] * self._lines[key] if self.H_field[key] is not None else None
-               for key in self._rotor_keys}
-        self.MMF.update(mmf)
-        self.total_MMF = sum(filter(None, self.MMF.values()))
+        self.MMF[ROTOR_SECTIONS] = self.H_field[ROTOR_SECTIONS] * self._lines[ROTOR_SECTIONS]
+        self.total_MMF = float(np.nansum(self.MMF))
 
 
 class NoLoadMagneticCircuit(MagneticCircuit):
@@ -247,9 +370,10 @@ class NoLoadMagneticCircuit(MagneticCircuit):
                  stator_steel: Union[Dict[str, Steel], Steel],
                  rotor_steel: Steel,
                  pole_pairs: int,
-                 fill_factor: float
+                 fill_factor: float,
+                 geometry: Optional[MagneticGeometry] = None
                  ) -> None:
-        super().__init__(stator, rotor, stator_steel, rotor_steel, pole_pairs, fill_factor)
+        super().__init__(stator, rotor, stator_steel, rotor_steel, pole_pairs, fill_factor, geometry)
 
         self.rotor_current: Optional[float] = None  # Ток ротора на холостом ходу, А
         self.magnetizing_current: Optional[float] = None  # Ток намагничивания, А
@@ -270,12 +394,7 @@ class NoLoadMagneticCircuit(MagneticCircuit):
                            ) -> None:
         self.phi_s = self.lambda_2 * self.stator_MMF * 1e-8  # Поперечно-пазовый поток рассеяния
 
-        # Поток рассеяния через бандажи. Если бандаж магнитный, то считаем, если нет - то нет его
-        if bandaging.ismagnetic:
-            self.phi_b = 1.2 * (bandaging.outer_diameter - bandaging.inner_diameter) / \
-                         stator_length * rotor.air_gap * self.stator_flow / bandaging.offset
-        else:
-            self.phi_b = 0
+        self.phi_b = self._get_bandage_flow(rotor, bandaging, stator_length, self.stator_flow)
 
         self.rotor_flow = self.stator_flow + self.phi_s + self.phi_b
 
@@ -283,59 +402,80 @@ class NoLoadMagneticCircuit(MagneticCircuit):
                                rotor_turn_count: Union[int, float]
                                ) -> None:
         self.rotor_current = self.total_MMF / rotor_turn_count
-        self.magnetizing_current = self.MMF["air gap"] / rotor_turn_count
+        self.magnetizing_current = float(self.MMF[Section.AIR_GAP]) / rotor_turn_count
 
     def get_no_load_characteristic(self,
-                                   rotor: TurboMachineRotor
-                                   ):
-        voltage_levels = np.linspace(0, 1.2, num=30)  # Думаю, 30-ти точек хватит за глаза - характеристика-то простая
-
-        b_fields = {key: self.B_field[key] * voltage_levels for key in self._stator_keys}
-        b_fields["stator yoke"] *= (18 - 10 * rotor.surface_relation) / (18 - 9 * rotor.surface_relation)
-        h_fields = {"air gap": 8e3 * self.air_gap_coef * b_fields["air gap"]}
-
-        if type(self.stator_steel) is dict:
-            h_fields["stator yoke"] = self.stator_steel["yoke"].BH_curve(b_fields["stator yoke"])
-            h_fields["stator teeth"] = self.stator_steel["teeth"].BH_curve(b_fields["stator teeth"])
-        else:
-            h_fields.update({k: self.stator_steel.BH_curve(b_fields[k]) for k in ["stator yoke", "stator teeth"]})
-
-        mmf = {key: h_fields[key] * self._lines[key] for key in self._stator_keys}
-        stator_mmf = sum(mmf.values())
+                                   rotor: TurboMachineRotor,
+                                   points: int = 30,
+                                   max_level: float = 1.2,
+                                   min_level: float = 0
+                                   ) -> Tuple[np.ndarray, np.ndarray]:
+        # По умолчанию 30 точек от нуля до 1.2 номинального напряжения - характеристика-то простая
+        voltage_levels = np.linspace(min_level, max_level, num=points)
+
+        return self.get_rotor_current(rotor, voltage_levels), voltage_levels
+
+    def get_rotor_current(self,
+                          rotor: TurboMachineRotor,
+                          voltage_levels: Union[float, np.ndarray]
+                          ) -> np.ndarray:
+        # Ток ротора на холостом ходу при произвольных уровнях напряжения (в долях номинального, массив любой формы).
+        # Никакой интерполяции по характеристике: для каждого уровня честно считается вся магнитная цепь. Цепь должна
+        # быть уже рассчитана на номинальное напряжение - отсюда берутся индукции статора и потоки
+        voltage_levels = np.asarray(voltage_levels, dtype=float)
+
+        # Тот же расчёт, что и для одной точки, только с лишними осями по уровням напряжения: массивы формы
+        # voltage_levels.shape + (len(Section),)
+        b_fields = np.full(voltage_levels.shape + (len(Section),), np.nan)
+        b_fields[..., STATOR_SECTIONS] = voltage_levels[..., None] * self.B_field[STATOR_SECTIONS]
+        h_fields = self._get_stator_H_fields(b_fields, rotor.surface_relation)
+
+        mmf = h_fields * self._lines
+        stator_mmf = mmf[..., STATOR_SECTIONS].sum(axis=-1)
         rotor_flow = (self.stator_flow + self.phi_b) * voltage_levels + \
                      self.lambda_2 * stator_mmf * 1e-8
 
-        b_fields.update({k: rotor_flow / self._sections[k] if self._sections[k] is not None
-                         else None for k in self._rotor_keys})
-        h_fields["rotor yoke"] = self.rotor_steel.BH_curve(b_fields["rotor yoke"]) * rotor.get_yoke_saturation_factor()
-
-        def helper(key: str, b_field: np.array, branching_factor: float) -> Tuple[str, Optional[np.array]]:
-            if b_field is None:
-                return key, None
-
-            h_field = []
-            for b in b_field:
-                if b > 2.05:
-                    h_field.append((b - 1.956) * 5.2 / (8 + 6.5 * branching_factor) * 1e4)
-                else:
-                    h_field.append(self.rotor_steel.BH_curve(b))
-            h_field = np.array(h_field)
-
-            return key, h_field
-
-        keys = self._rotor_branching_factors.keys()
-        factors = self._rotor_branching_factors.values()
-        b_fields_tmp = [b_fields[key] for key in keys]
-
-        h_fields.update(map(helper, keys, b_fields_tmp, factors))
-        mmf.update({key: h_fields[key] * self._lines[key] if h_fields[key] is not None else None
-                    for key in self._rotor_keys})
-        mmf_total = sum(filter(lambda x: x is not None, mmf.values()))
-
-        rotor_current = list(mmf_total / rotor.armature.turn_count)
-        voltage_levels = list(voltage_levels)
-
-        return rotor_current, voltage_levels
+        b_fields[..., ROTOR_SECTIONS] = rotor_flow[..., None] / self._sections[ROTOR_SECTIONS]
+        self._set_rotor_H_fields(b_fields, h_fields, rotor.get_yoke_saturation_factor())
+
+        mmf[..., ROTOR_SECTIONS] = h_fields[..., ROTOR_SECTIONS] * self._lines[ROTOR_SECTIONS]
+        mmf_total = np.nansum(mmf, axis=-1)
+
+        return mmf_total / rotor.armature.turn_count
+
+    def get_voltage_level(self,
+                          rotor: TurboMachineRotor,
+                          rotor_current: Union[float, np.ndarray],
+                          tolerance: float = 1e-10,
+                          max_iterations: int = 50
+                          ) -> np.ndarray:
+        # Обратная задача: уровень напряжения холостого хода (в долях номинального), при котором ток ротора равен
+        # заданному. Раньше для этого строили характеристику по 30 точкам и интерполировали вручную, теперь уравнение
+        # решается для всех заданных токов сразу, с точностью до tolerance. Начальное приближение - по прямой через
+        # номинальную точку (ток ротора self.rotor_current при единичном напряжении). Там, где характеристика из-за
+        # скачка при 2.05 Тл в зубцах ротора немонотонна, решений может быть несколько - возвращается одно из них
+        rotor_current = np.asarray(rotor_current, dtype=float)
+
+        return solve_increasing(lambda levels: self.get_rotor_current(rotor, levels), rotor_current,
+                                rotor_current / self.rotor_current, tolerance, max_iterations)
+
+
+# Рабочая диаграмма генератора: V-образные и регулировочные характеристики, посчитанные сразу по всей сетке уровней
+# тока статора и коэффициентов мощности. Все массивы одной формы: (уровни тока, коэффициенты мощности) либо, при
+# excitation="both", (2, уровни тока, коэффициенты мощности), где первая ось - перевозбуждение и недовозбуждение
+@dataclass(frozen=True, eq=False)
+class OperatingChart:
+    current_levels: np.ndarray  # Токи статора в долях тока, заданного в compute_stator_reaction
+    cos_phi: np.ndarray  # Коэффициенты мощности
+    sin_phi: np.ndarray  # Синусы угла: положительные при перевозбуждении, отрицательные при недовозбуждении
+    relative_EMF: np.ndarray  # ЭДС, о. е.
+    rotor_SC_current: np.ndarray  # Ток ротора, соответствующий току КЗ, А
+    field_current: np.ndarray  # Ток возбуждения без учёта реакции якоря, А
+    nominal_field_current: np.ndarray  # Ток возбуждения, А
+    static_overload: np.ndarray  # Статическая перегружаемость
+    SCR: np.ndarray  # Отношение короткого замыкания
+    # Число итераций по МДС возбуждения (см. compute_rotor_flow_iteratively), -1 - не сошлось. None - без итераций
+    iteration_count: Optional[np.ndarray] = None
 
 
 class LoadedMagneticCircuit(MagneticCircuit):
@@ -347,7 +487,8 @@ class LoadedMagneticCircuit(MagneticCircuit):
                  "field_current",
                  "nominal_field_current",
                  "nominal_field_MMF",
-                 "relative_EMF"
+                 "relative_EMF",
+                 "iteration_count"
                  ]
 
     def __init__(self,
@@ -356,9 +497,10 @@ class LoadedMagneticCircuit(MagneticCircuit):
                  stator_steel: Union[Dict[str, Steel], Steel],
                  rotor_steel: Steel,
                  pole_pairs: int,
-                 fill_factor: float
+                 fill_factor: float,
+                 geometry: Optional[MagneticGeometry] = None
                  ) -> None:
-        super().__init__(stator, rotor, stator_steel, rotor_steel, pole_pairs, fill_factor)
+        super().__init__(stator, rotor, stator_steel, rotor_steel, pole_pairs, fill_factor, geometry)
 
         self.stator_reaction_MMF: Optional[float] = None  # МДС реакции якоря, А
         self.stator_reaction_MMF_reduced: Optional[float] = None  # Она же, приведённая к обмотке ротора
@@ -372,6 +514,8 @@ class LoadedMagneticCircuit(MagneticCircuit):
 
         self.relative_EMF: Optional[float] = None
 
+        self.iteration_count: Optional[int] = None  # Число итераций по МДС возбуждения
+
     def compute_stator_reaction(self,
                                 current: float,
                                 pole_pairs: int,
@@ -428,15 +572,82 @@ class LoadedMagneticCircuit(MagneticCircuit):
                               (x_stator + sin_phi / self.relative_EMF))
         self.phi_s = self.lambda_2 * magic_MMF * 1e-8  # Поперечно-пазовый поток рассеяния
 
-        # Поток рассеяния через бандажи. Если бандаж магнитный, то считаем, если нет - то нет его
-        if bandaging.ismagnetic:
-            self.phi_b = 1.2 * (bandaging.outer_diameter - bandaging.inner_diameter) / \
-                         stator_length * rotor.air_gap * self.stator_flow / bandaging.offset
-        else:
-            self.phi_b = 0
+        self.phi_b = self._get_bandage_flow(rotor, bandaging, stator_length, self.stator_flow)
 
         self.rotor_flow = self.stator_flow + self.phi_s + self.phi_b
 
+    def compute_rotor_flow_iteratively(self,
+                                       rotor: TurboMachineRotor,
+                                       bandaging: TurboMachineRotorBandaging,
+                                       stator_length: float,
+                                       sin_phi: float,
+                                       x_stator: float,
+                                       tolerance: float = 1e-8,
+                                       max_iterations: int = 50,
+                                       initial_MMF: Optional[float] = None
+                                       ) -> None:
+        # Замена связки compute_rotor_flow -> compute_rotor_B_fields -> compute_rotor_H_fields -> compute_rotor_MMF.
+        # "Магическая" МДС в compute_rotor_flow - это та же формула, что и для МДС возбуждения в compute_field_current,
+        # только вместо полной МДС в ней стоит МДС статора, ведь насыщение ротора на тот момент ещё неизвестно. Здесь
+        # же поток рассеяния пересчитывается по МДС возбуждения с полной МДС предыдущей итерации, пока полная МДС не
+        # перестанет меняться (относительно, на tolerance). Первая итерация с начальной МДС, равной МДС статора, в
+        # точности повторяет расчёт в один проход. Для тёплого старта можно передать initial_MMF - например, полную МДС
+        # холостого хода. Число итераций сохраняется в iteration_count; -1 - за max_iterations не сошлось
+        self.phi_b = self._get_bandage_flow(rotor, bandaging, stator_length, self.stator_flow)
+        cross_factor = x_stator + sin_phi / self.relative_EMF
+        initial_MMF = self.stator_MMF if initial_MMF is None else initial_MMF
+
+        self.phi_s, total_MMF, iteration_count = \
+            self._iterate_rotor_MMF(rotor, self.B_field, self.H_field, self.MMF, self.stator_flow + self.phi_b,
+                                    self.stator_reaction_MMF_reduced, cross_factor, initial_MMF, tolerance,
+                                    max_iterations)
+
+        self.phi_s = float(self.phi_s)
+        self.rotor_flow = self.stator_flow + self.phi_s + self.phi_b
+        self.total_MMF = float(total_MMF)
+        self.iteration_count = int(iteration_count)
+
+    def _iterate_rotor_MMF(self,
+                           rotor: TurboMachineRotor,
+                           b_fields: np.ndarray,
+                           h_fields: np.ndarray,
+                           mmf: np.ndarray,
+                           base_rotor_flow: Union[float, np.ndarray],
+                           reaction_MMF: Union[float, np.ndarray],
+                           cross_factor: Union[float, np.ndarray],
+                           total_MMF: Union[float, np.ndarray],
+                           tolerance: float,
+                           max_iterations: int
+                           ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Ядро итераций по МДС возбуждения для массивов любой формы (одна точка, сетка рабочей диаграммы). Участки
+        # статора в b_fields, h_fields и mmf уже рассчитаны, участки ротора дописываются на месте. base_rotor_flow -
+        # поток ротора без поперечно-пазового рассеяния. Все точки считаются на каждой итерации (так проще и дешевле,
+        # чем выбирать несошедшиеся), а для каждой запоминается номер итерации, на которой она сошлась
+        if max_iterations < 1:
+            raise ValueError("Число итераций должно быть не меньше единицы")
+
+        total_MMF = np.asarray(total_MMF, dtype=float)
+        iteration_count = np.full(np.broadcast(total_MMF, base_rotor_flow).shape, -1)
+        rotor_yoke_saturation_factor = rotor.get_yoke_saturation_factor()
+
+        for iteration in range(1, max_iterations + 1):
+            field_MMF = np.sqrt(reaction_MMF ** 2 + total_MMF ** 2 + 2 * reaction_MMF * total_MMF * cross_factor)
+            phi_s = self.lambda_2 * field_MMF * 1e-8
+
+            b_fields[..., ROTOR_SECTIONS] = (base_rotor_flow + phi_s)[..., None] / self._sections[ROTOR_SECTIONS]
+            self._set_rotor_H_fields(b_fields, h_fields, rotor_yoke_saturation_factor)
+            mmf[..., ROTOR_SECTIONS] = h_fields[..., ROTOR_SECTIONS] * self._lines[ROTOR_SECTIONS]
+
+            new_total_MMF = np.nansum(mmf, axis=-1)
+            converged = np.abs(new_total_MMF - total_MMF) <= tolerance * np.abs(new_total_MMF)
+            iteration_count = np.where(converged & (iteration_count < 0), iteration, iteration_count)
+            total_MMF = new_total_MMF
+
+            if (iteration_count >= 0).all():
+                break
+
+        return phi_s, total_MMF, iteration_count
+
     def compute_field_current(self,
                               rotor_turn_count: Union[int, float],
                               sin_phi: float,
@@ -448,6 +659,104 @@ class LoadedMagneticCircuit(MagneticCircuit):
                                            (x_stator + sin_phi / self.relative_EMF))
         self.nominal_field_current = self.nominal_field_MMF / rotor_turn_count
 
+    def get_operating_chart(self,
+                            rotor: TurboMachineRotor,
+                            bandaging: TurboMachineRotorBandaging,
+                            stator_length: float,
+                            current_levels: np.ndarray,
+                            cos_phi: np.ndarray,
+                            x_stator: float,
+                            x_Potier: float,
+                            magnetizing_current: float,
+                            no_load_flow: float,
+                            no_load_current: float,
+                            excitation: str = "over",
+                            iterate: bool = False,
+                            tolerance: float = 1e-8,
+                            max_iterations: int = 50
+                            ) -> OperatingChart:
+        # Та же цепочка compute_SC_current -> compute_EMF -> compute_stator_flow -> ... -> compute_field_current, что и
+        # для одной рабочей точки, но сразу для всей сетки: уровни тока (в долях тока, заданного в
+        # compute_stator_reaction, - реакция якоря ему пропорциональна) по первой оси, коэффициенты мощности по второй.
+        # Должна быть уже вызвана compute_stator_reaction; атрибуты цепи при этом не меняются. При iterate=True поток
+        # рассеяния уточняется итерациями, как в compute_rotor_flow_iteratively, - для всей сетки разом
+        if excitation == "over":
+            signs = 1
+        elif excitation == "under":
+            signs = -1
+        elif excitation == "both":
+            signs = np.array([1, -1])[:, None, None]
+        else:
+            raise ValueError(f"Неизвестный режим возбуждения: {excitation}")
+
+        current_levels, cos_phi = np.meshgrid(np.asarray(current_levels, dtype=float),
+                                              np.asarray(cos_phi, dtype=float), indexing="ij")
+        shape = np.broadcast_shapes(np.shape(signs), current_levels.shape)
+        current_levels = np.broadcast_to(current_levels, shape)
+        cos_phi = np.broadcast_to(cos_phi, shape)
+        sin_phi = signs * np.sqrt(1 - cos_phi ** 2)
+
+        return self.get_operating_points(rotor, bandaging, stator_length, current_levels, cos_phi, sin_phi, x_stator,
+                                         x_Potier, magnetizing_current, no_load_flow, no_load_current, iterate,
+                                         tolerance, max_iterations)
+
+    def get_operating_points(self,
+                             rotor: TurboMachineRotor,
+                             bandaging: TurboMachineRotorBandaging,
+                             stator_length: float,
+                             current_levels: np.ndarray,
+                             cos_phi: np.ndarray,
+                             sin_phi: np.ndarray,
+                             x_stator: float,
+                             x_Potier: float,
+                             magnetizing_current: float,
+                             no_load_flow: float,
+                             no_load_current: float,
+                             iterate: bool = False,
+                             tolerance: float = 1e-8,
+                             max_iterations: int = 50
+                             ) -> OperatingChart:
+        # То же, что и get_operating_chart, но для произвольного набора рабочих точек, без построения сетки: уровни
+        # тока, косинусы и синусы угла (положительные при перевозбуждении) - массивы одной формы, поэлементно. Нужно,
+        # например, для расчёта по графику нагрузки, где точки не образуют сетку
+        current_levels, cos_phi, sin_phi = np.broadcast_arrays(np.asarray(current_levels, dtype=float),
+                                                               np.asarray(cos_phi, dtype=float),
+                                                               np.asarray(sin_phi, dtype=float))
+        shape = current_levels.shape
+
+        reaction_MMF = self.stator_reaction_MMF_reduced * current_levels
+        rotor_SC_current = self.stator_reaction_current_reduced * current_levels + x_stator * magnetizing_current
+
+        relative_EMF = np.hypot(cos_phi, sin_phi + x_Potier)
+        stator_flow = no_load_flow * relative_EMF
+        # Множитель при удвоенном произведении МДС в "магических" формулах compute_rotor_flow и compute_field_current
+        cross_factor = x_Potier + sin_phi / relative_EMF
+
+        b_fields = np.full(shape + (len(Section),), np.nan)
+        b_fields[..., STATOR_SECTIONS] = stator_flow[..., None] / self._sections[STATOR_SECTIONS]
+        h_fields = self._get_stator_H_fields(b_fields, rotor.surface_relation)
+
+        mmf = h_fields * self._lines
+        stator_MMF = mmf[..., STATOR_SECTIONS].sum(axis=-1)
+
+        # Расчёт в один проход - это первая итерация, начатая с МДС статора
+        _, total_MMF, iteration_count = \
+            self._iterate_rotor_MMF(rotor, b_fields, h_fields, mmf,
+                                    stator_flow + self._get_bandage_flow(rotor, bandaging, stator_length, stator_flow),
+                                    reaction_MMF, cross_factor, stator_MMF, tolerance,
+                                    max_iterations if iterate else 1)
+
+        rotor_turn_count = rotor.armature.turn_count
+        nominal_field_current = np.sqrt(total_MMF ** 2 + reaction_MMF ** 2 +
+                                        2 * total_MMF * reaction_MMF * cross_factor) / rotor_turn_count
+
+        with np.errstate(divide="ignore"):
+            static_overload = nominal_field_current / rotor_SC_current / cos_phi
+
+        return OperatingChart(current_levels, cos_phi, sin_phi, relative_EMF, rotor_SC_current,
+                              total_MMF / rotor_turn_count, nominal_field_current, static_overload,
+                              no_load_current / rotor_SC_current, iteration_count if iterate else None)
+
     def get_static_overload(self,
                             cos_phi: float
                             ) -> float:
@@ -459,4 +768,5 @@ class LoadedMagneticCircuit(MagneticCircuit):
         return no_load_current / self.rotor_SC_current
 
 
-__all__ = ["MagneticCircuit", "NoLoadMagneticCircuit", "LoadedMagneticCircuit"]
+__all__ = ["Section", "SECTION_NAMES", "STATOR_SECTIONS", "ROTOR_SECTIONS", "ROTOR_TEETH_SECTIONS", "MagneticGeometry",
+           "solve_increasing", "MagneticCircuit", "NoLoadMagneticCircuit", "OperatingChart", "LoadedMagneticCircuit"]
@@ -12,11 +12,12 @@ from typing import Optional
 import math
 
 from common.constants import COPPER_DENSITY, STEEL_DENSITY
+from common.designContext import DesignSingleton
 from common.stator import ACMachineStator
 from turbo.rotor import TurboMachineRotor
 
 
-class Mass:
+class Mass(DesignSingleton):
     """
     Класс, хранящий и рассчитывающий массы частей турбомашины.
 
@@ -60,7 +61,7 @@ class Mass:
 
       Возвращает общую массу стали статора.
 
-    Реализует паттерн «Одиночка».
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
 
     __slots__ = ["stator_teeth",
@@ -70,14 +71,6 @@ class Mass:
                  "rotor"
                  ]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self) -> None:
         self.stator_teeth: Optional[float] = None
         self.stator_yoke: Optional[float] = None
@@ -150,4 +143,4 @@ class Mass:
         return self.stator_yoke + self.stator_teeth
 
 
-__all__ = "Mass"
+__all__ = ["Mass"]
@@ -10,11 +10,12 @@
 
 from typing import Optional
 
+from common.designContext import DesignSingleton
 from common.stator import ACMachineStator
 from turbo.rotor import *
 
 
-class Reactances:
+class Reactances(DesignSingleton):
     """
     Класс, хранящий и рассчитывающий реактивные сопротивления турбомашин (т. н. «иксы»).
 
@@ -106,7 +107,7 @@ class Reactances:
 
       Рассчитывает реактивное сопротивление обратной последовательности `x_2`:math:.
 
-    Реализует паттерн «Одиночка».
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
     # Как ни прискорбно, но тут придётся всё хранить в виде атрибутов класса, потому что все эти иксы дурные нужны в
     # куче мест после этого
@@ -127,14 +128,6 @@ class Reactances:
                  "x_0",
                  "x_2"]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self,
                  stator: ACMachineStator,
                  current: float,
@@ -353,4 +346,4 @@ class Reactances:
             self.x_2 = 1.22 * self.x_d_2prime
 
 
-__all__ = "Reactances"
+__all__ = ["Reactances"]
@@ -1,5 +1,5 @@
 """
-Модуль, содержащий описание ротора турбомашины и его бандажа.
+Модуль, содержащий описание ротора турбомашины, его бандажа и вала.
 
 Классы:
 
@@ -10,16 +10,22 @@
 * ``TurboMachineRotorBandaging``
 
   Класс данных, хранящий параметры бандажа ротора.
+
+* ``Shaft``
+
+  Класс данных, хранящий параметры вала ротора.
 """
 
 import math
 from dataclasses import dataclass
-from typing import ClassVar, Optional, Union
+from typing import Optional, Union
 
+from common.designContext import DesignSingleton
+from common.geometryCache import GeometryCache, cached_geometry
 from turbo.rotorArmature import TurboMachineRotorArmature
 
 
-class TurboMachineRotor:
+class TurboMachineRotor(DesignSingleton, GeometryCache):
     """
     Класс, описывающий ротор турбомашины.
 
@@ -237,6 +243,11 @@ class TurboMachineRotor:
 
       Возвращает коэффициент насыщения ярма ротора.
 
+    Диаметры, зубцовые деления и ширины зубцов на разных уровнях, а также сечения зубцов и ярма и коэффициенты
+    ответвления потока кэшируются (см. ``GeometryCache``), так что при расчёте магнитной цепи каждая из этих величин
+    считается один раз. Кэш сбрасывается при присваивании любому из размеров, от которых они зависят (в том числе
+    ``slot_height`` в ``compute_slot_height`` и ``surface_relation`` в ``compute_surface_relation``).
+
     Возбуждает исключения:
 
     * ``ValueError``
@@ -276,13 +287,11 @@ class TurboMachineRotor:
                  "tooth_pitch",
                  "current_load"]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
+    # Размеры, от которых зависят кэшируемые методы
+    _geometry_attributes = frozenset(["outer_diameter", "inner_diameter", "length", "slot_pitch_count", "slot_width",
+                                      "slot_height", "subslot_channel_height", "subslot_channel_width",
+                                      "big_tooth_slot_count", "big_tooth_slot_width", "tooth_slot_width",
+                                      "tooth_slot_height", "surface_relation", "surface_relation_small"])
 
     def __init__(self,
                  air_gap: float,
@@ -468,6 +477,7 @@ class TurboMachineRotor:
 
         return width
 
+    @cached_geometry
     def __get_diameter_bottom(self) -> float:
         """
         Вспомогательный метод, возвращающий диаметр ротора на уровне дна паза.
@@ -477,6 +487,7 @@ class TurboMachineRotor:
 
         return self.outer_diameter - 2 * self.slot_height
 
+    @cached_geometry
     def __get_diameter_02(self) -> float:
         """
         Вспомогательный метод, возвращающий диаметр ротора на уровне 20% высоты паза.
@@ -486,6 +497,7 @@ class TurboMachineRotor:
 
         return self.outer_diameter - 1.6 * self.slot_height
 
+    @cached_geometry
     def __get_diameter_07(self) -> float:
         """
         Вспомогательный метод, возвращающий диаметр ротора на уровне 70% высоты паза.
@@ -495,6 +507,7 @@ class TurboMachineRotor:
 
         return self.outer_diameter - 0.6 * self.slot_height
 
+    @cached_geometry
     def __get_diameter_slot_bottom(self) -> float:
         """
         Вспомогательный метод, возвращающий диаметр ротора на уровне дна подпазового канала (при их наличии), либо
@@ -507,6 +520,7 @@ class TurboMachineRotor:
             return self.__get_diameter_bottom() - 2 * self.subslot_channel_height
         return self.__get_diameter_bottom()
 
+    @cached_geometry
     def __get_diameter_slot_02(self) -> float:
         """
         Вспомогательный метод, возвращающий диаметр ротора на уровне 20% высоты подпазового канала (при их наличии),
@@ -519,6 +533,7 @@ class TurboMachineRotor:
             return self.__get_diameter_bottom() - 1.6 * self.subslot_channel_height
         return self.__get_diameter_bottom()
 
+    @cached_geometry
     def __get_diameter_slot_07(self) -> float:
         """
         Вспомогательный метод, возвращающий диаметр ротора на уровне 70% высоты подпазового канала (при их наличии),
@@ -531,6 +546,7 @@ class TurboMachineRotor:
             return self.__get_diameter_bottom() - 0.6 * self.subslot_channel_height
         return self.__get_diameter_bottom()
 
+    @cached_geometry
     def __get_tooth_pitch_bottom(self) -> float:
         """
         Вспомогательный метод, возвращающий зубцовое деление ротора на уровне дна паза.
@@ -540,6 +556,7 @@ class TurboMachineRotor:
 
         return math.pi * self.__get_diameter_bottom() / self.slot_pitch_count
 
+    @cached_geometry
     def __get_tooth_pitch_02(self) -> float:
         """
         Вспомогательный метод, возвращающий зубцовое деление ротора на уровне 20% высоты паза.
@@ -549,6 +566,7 @@ class TurboMachineRotor:
 
         return math.pi * self.__get_diameter_02() / self.slot_pitch_count
 
+    @cached_geometry
     def __get_tooth_pitch_07(self) -> float:
         """
         Вспомогательный метод, возвращающий зубцовое деление ротора на уровне 70% высоты паза.
@@ -558,6 +576,7 @@ class TurboMachineRotor:
 
         return math.pi * self.__get_diameter_07() / self.slot_pitch_count
 
+    @cached_geometry
     def __get_tooth_pitch_slot_bottom(self) -> float:
         """
         Вспомогательный метод, возвращающий зубцовое деление ротора на уровне дна подпазового канала (при их наличии),
@@ -568,6 +587,7 @@ class TurboMachineRotor:
 
         return math.pi * self.__get_diameter_slot_bottom() / self.slot_pitch_count
 
+    @cached_geometry
     def __get_tooth_pitch_slot_02(self) -> float:
         """
         Вспомогательный метод, возвращающий зубцовое деление ротора на уровне 20% высоты подпазового канала (при их
@@ -578,6 +598,7 @@ class TurboMachineRotor:
 
         return math.pi * self.__get_diameter_slot_02() / self.slot_pitch_count
 
+    @cached_geometry
     def __get_tooth_pitch_slot_07(self) -> float:
         """
         Вспомогательный метод, возвращающий зубцовое деление ротора на уровне 70% высоты подпазового канала (при их
@@ -586,6 +607,7 @@ class TurboMachineRotor:
 
         return math.pi * self.__get_diameter_slot_07() / self.slot_pitch_count
 
+    @cached_geometry
     def __get_tooth_width_bottom(self) -> float:
         """
         Вспомогательный метод, возвращающий ширину зубца ротора на уровне 20% высоты паза.
@@ -597,6 +619,7 @@ class TurboMachineRotor:
         # расчёта глубины паза
         return self.__get_tooth_pitch_bottom() - self.slot_width
 
+    @cached_geometry
     def __get_tooth_width_02(self) -> float:
         """
         Вспомогательный метод, возвращающий ширину зубца ротора на уровне 20% высоты паза.
@@ -611,6 +634,7 @@ class TurboMachineRotor:
 
         return width
 
+    @cached_geometry
     def __get_tooth_width_07(self) -> float:
         """
         Вспомогательный метод, возвращающий ширину зубца ротора на уровне 70% высоты паза.
@@ -625,6 +649,7 @@ class TurboMachineRotor:
 
         return width
 
+    @cached_geometry
     def __get_tooth_width_slot_bottom(self) -> Optional[float]:
         """
         Вспомогательный метод, возвращающий ширину зубца ротора на уровне дна подпазового канала (при их наличии), либо
@@ -638,6 +663,7 @@ class TurboMachineRotor:
 
         return None
 
+    @cached_geometry
     def __get_tooth_width_slot_02(self) -> Optional[float]:
         """
         Вспомогательный метод, возвращающий ширину зубца ротора на уровне 20% высоты подпазового канала (при их
@@ -651,6 +677,7 @@ class TurboMachineRotor:
 
         return None
 
+    @cached_geometry
     def __get_tooth_width_slot_07(self) -> Optional[float]:
         """
         Вспомогательный метод, возвращающий ширину зубца ротора на уровне 70% высоты подпазового канала (при их
@@ -664,6 +691,7 @@ class TurboMachineRotor:
 
         return None
 
+    @cached_geometry
     def __get_sin_alpha(self,
                         pole_pairs: int
                         ) -> float:
@@ -680,6 +708,7 @@ class TurboMachineRotor:
 
         return sin_alpha
 
+    @cached_geometry
     def __get_sin_alpha_small(self,
                               pole_pairs: int
                               ) -> float:
@@ -696,6 +725,7 @@ class TurboMachineRotor:
 
         return sin_alpha_small
 
+    @cached_geometry
     def get_teeth_section_02(self,
                              pole_pairs: int
                              ) -> float:
@@ -726,6 +756,7 @@ class TurboMachineRotor:
 
         return section
 
+    @cached_geometry
     def get_teeth_section_07(self,
                              pole_pairs: int
                              ) -> float:
@@ -753,6 +784,7 @@ class TurboMachineRotor:
 
         return section
 
+    @cached_geometry
     def get_teeth_section_slot_02(self,
                                   pole_pairs: int
                                   ) -> Optional[float]:
@@ -775,6 +807,7 @@ class TurboMachineRotor:
 
         return None
 
+    @cached_geometry
     def get_teeth_section_slot_07(self,
                                   pole_pairs: int
                                   ) -> Optional[float]:
@@ -793,6 +826,7 @@ class TurboMachineRotor:
 
         return None
 
+    @cached_geometry
     def get_yoke_section(self) -> float:
         """
         Метод, возвращающий эффективное сечение ярма ротора.
@@ -855,6 +889,7 @@ class TurboMachineRotor:
 
         return self.__get_diameter_slot_bottom() / 2 / math.sin(math.pi / 2 / pole_pairs) * 0.1
 
+    @cached_geometry
     def get_flow_branching_factor_02(self) -> float:
         """
         Метод, возвращающий коэффициент ответвления потока в пазы ротора на уровне 20% высоты паза.
@@ -864,6 +899,7 @@ class TurboMachineRotor:
 
         return self.slot_width / self.__get_tooth_width_02()
 
+    @cached_geometry
     def get_flow_branching_factor_07(self) -> float:
         """
         Метод, возвращающий коэффициент ответвления потока в пазы ротора на уровне 70% высоты паза.
@@ -873,6 +909,7 @@ class TurboMachineRotor:
 
         return self.slot_width / self.__get_tooth_width_07()
 
+    @cached_geometry
     def get_flow_branching_factor_slot_02(self) -> Optional[float]:
         """
         Метод, возвращающий коэффициент ответвления потока в пазы ротора на уровне 20% высоты подпазового канала (при их
@@ -885,6 +922,7 @@ class TurboMachineRotor:
             return self.subslot_channel_width / tooth_width
         return None
 
+    @cached_geometry
     def get_flow_branching_factor_slot_07(self) -> Optional[float]:
         """
         Метод, возвращающий коэффициент ответвления потока в пазы ротора на уровне 70% высоты подпазового канала (при их
@@ -911,7 +949,7 @@ class TurboMachineRotor:
 
 
 @dataclass
-class TurboMachineRotorBandaging:
+class TurboMachineRotorBandaging(DesignSingleton):
     """
     Класс данных, хранящий параметры бандажа ротора.
 
@@ -937,7 +975,7 @@ class TurboMachineRotorBandaging:
 
       Логическое поле, указывающее, из магнитных материалов ли выполнен бандаж. По умолчанию равно ``False``.
 
-    Реализует паттерн «Одиночка».
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
 
     # Увы, тут пришлось отказаться от __slots__, потому что оно конфликтует с ismagnetic, а возводить строительные леса
@@ -948,13 +986,57 @@ class TurboMachineRotorBandaging:
     offset: float
     ismagnetic: bool = False
 
-    __instance: ClassVar = None
 
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
+@dataclass
+class Shaft(DesignSingleton):
+    """
+    Класс данных, хранящий параметры вала ротора, необходимые для расчёта механических потерь.
+
+    Атрибуты:
+
+    * ``journal_diameter: float``
+
+      Диаметр шейки вала под подшипник, мм.
+
+    * ``journal_length: float``
+
+      Длина шейки вала под подшипник, мм.
+
+    * ``ring_outer_diameter: float``
+
+      Внешний диаметр контактного кольца, мм.
+
+    * ``ring_inner_diameter: float``
+
+      Внутренний диаметр контактного кольца, мм.
+
+    * ``ring_brush_count: int``
+
+      Число щёток на контактном кольце.
+
+    * ``crossarm_brush_count: int``
+
+      Число щёток на траверсе.
+
+    * ``brush_width: float``
+
+      Ширина щётки, мм.
+
+    * ``brush_length: float``
+
+      Длина щётки, мм.
+
+    Реализует паттерн «Одиночка». Внутри контекста ``DesignContext`` каждый вызов конструктора создаёт новый объект.
+    """
 
-        return cls.__instance
+    journal_diameter: float
+    journal_length: float
+    ring_outer_diameter: float
+    ring_inner_diameter: float
+    ring_brush_count: int
+    crossarm_brush_count: int
+    brush_width: float
+    brush_length: float
 
 
-__all__ = ["TurboMachineRotor", "TurboMachineRotorBandaging"]
+__all__ = ["TurboMachineRotor", "TurboMachineRotorBandaging", "Shaft"]
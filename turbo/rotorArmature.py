@@ -11,11 +11,15 @@
 
 from typing import Optional, Dict, Union
 
+import numpy as np
+
+from common.constants import copper_temperature_factor
+from common.designContext import DesignSingleton
 from common.wireDatabase import BusDB
 from turbo.armatureInsulation import TurboMachineRotorInsulation
 
 
-class TurboMachineRotorArmature:
+class TurboMachineRotorArmature(DesignSingleton):
     """
     Класс, описывающий статорную обмотку катушечного типа машины переменного тока.
 
@@ -53,7 +57,7 @@ class TurboMachineRotorArmature:
     * ``resistance: Optional[Dict[int, float]]``
 
       Сопротивление обмотки постоянному току, Ом. Рассчитывается для температур 15, 75, 100, 115 и 120 градусов
-      Цельсия. В момент инициализации равно ``None``.
+      Цельсия (для прочих температур см. ``get_resistance``). В момент инициализации равно ``None``.
 
     * ``current_density: Optional[float]``
 
@@ -73,11 +77,16 @@ class TurboMachineRotorArmature:
 
       Рассчитывает сопротивление обмотки при разных температурах. Сохраняет в словарь.
 
+    * ``get_resistance(temperature: Union[float, np.ndarray]) -> Union[float, np.ndarray]``
+
+      Возвращает сопротивление обмотки при произвольной температуре (или массиве температур).
+
     * ``compute_current_density(current: float) -> None``
 
       Рассчитывает плотность тока в обмотке.
 
-    Реализует паттерн «Одиночка», поскольку ротор не может иметь более одной обмотки.
+    Реализует паттерн «Одиночка», поскольку ротор не может иметь более одной обмотки. Внутри контекста
+    ``DesignContext`` каждый вызов конструктора создаёт новый объект.
     """
 
     __slots__ = ["insulation",
@@ -91,14 +100,6 @@ class TurboMachineRotorArmature:
                  "resistance",
                  "current_density"]
 
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
     def __init__(self,
                  parallel_branches: int,
                  insulation: TurboMachineRotorInsulation,
@@ -200,9 +201,22 @@ class TurboMachineRotorArmature:
         base_value = 4 * pole_pairs * self.turn_count / conductivity / self.parallel_branches * \
             (rotor_length / self.equivalent_wire_section + end_part_length / self.wire_section)
 
-        # Словарь из значений сопротивления при 15, 75, 105 и 120 градусах
-        self.resistance = dict(zip([15, 75, 100, 115, 120],
-                                   map(lambda x: x * base_value, [1, 1.24, 1.34, 1.4, 1.42])))
+        # Словарь из значений сопротивления при 15, 75, 100, 115 и 120 градусах
+        self.resistance = {temperature: base_value * copper_temperature_factor(temperature)
+                           for temperature in (15, 75, 100, 115, 120)}
+
+    def get_resistance(self,
+                       temperature: Union[float, np.ndarray]
+                       ) -> Union[float, np.ndarray]:
+        """
+        Метод, возвращающий сопротивление обмотки постоянному току при произвольной температуре. Сопротивление
+        пересчитывается со значения при 15 °C по температурной постоянной меди.
+
+        :param temperature: Температура обмотки, °C (число или массив).
+        :return: Сопротивление обмотки, Ом (число или массив той же формы, что и ``temperature``).
+        """
+
+        return self.resistance[15] * copper_temperature_factor(temperature)
 
     def compute_current_density(self,
                                 current: float
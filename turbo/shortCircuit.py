@@ -1,21 +1,16 @@
 import math
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
+import numpy as np
+
+from common.designContext import DesignSingleton
 from common.stator import ACMachineStator
 from turbo.magneticCircuit import NoLoadMagneticCircuit
 from turbo.reactances import Reactances
 from turbo.rotor import TurboMachineRotor
 
 
-class TimeConstants:
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
+class TimeConstants(DesignSingleton):
     def __init__(self) -> None:
         self.T_d0: Optional[float] = None
         self.T_d0_prime: Optional[float] = None
@@ -34,13 +29,14 @@ class TimeConstants:
                                      rotor: TurboMachineRotor,
                                      mag_circuit: NoLoadMagneticCircuit,
                                      xs: Reactances,
-                                     pole_pairs: int
+                                     pole_pairs: int,
+                                     temperature: Union[float, np.ndarray] = 75  # Температура обмотки ротора, °C
                                      ) -> None:
         # Считаем какую-то странную постоянную времени роторной обмотки без статора. И да, тут опять специфические
         # названия, как с иксами
         self.T_d0 = 2 * pole_pairs * rotor.armature.turn_count * rotor.get_armature_coefficient(pole_pairs) * \
                     xs.rotor_dissipation_factor * mag_circuit.rotor_flow / \
-                    mag_circuit.magnetizing_current / rotor.armature.resistance[75]
+                    mag_circuit.magnetizing_current / rotor.armature.get_resistance(temperature)
 
         self.T_d0_prime = 4 * self.T_d0 / 3
         self.T_d0_2prime = self.T_d0 * xs.rotor_dissipation_factor / 4
@@ -72,25 +68,18 @@ class TimeConstants:
                           xs: Reactances,
                           frequency: float,
                           current: float,
-                          voltage: float
+                          voltage: float,
+                          temperature: Union[float, np.ndarray] = 75  # Температура обмотки статора, °C
                           ) -> None:
         # Сопротивление в о. е.
-        rel_res = current * stator.armature.resistance[75] / voltage
+        rel_res = current * stator.armature.get_resistance(temperature) / voltage
         aux = 2 * math.pi * rel_res * frequency
 
         self.T_a = {"1 phase": (2 * xs.x_2 + xs.x_0) / 3 / aux,
                     "2 phase": xs.x_2 / aux}
 
 
-class Currents:
-    __instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-
-        return cls.__instance
-
+class Currents(DesignSingleton):
     def __init__(self,
                  xs: Reactances,
                  rel_voltage: float,  # Кратность напряжения КЗ. Разницы, по сути, нет, ставить напряжение или кратность
@@ -152,4 +141,4 @@ class Currents:
                        "3 phase": rel_current / xs.x_d}
 
 
-__all__ = "TimeConstants"
+__all__ = ["TimeConstants"]
@@ -0,0 +1,685 @@
+"""
+Модуль, содержащий сквозной расчёт турбогенератора по графу зависимостей между этапами.
+
+Классы:
+
+* ``TurboGeneratorResult``
+
+  Класс данных, хранящий результаты расчёта турбогенератора.
+
+* ``TurboGenerator``
+
+  Класс, выполняющий расчёт турбогенератора по заданным параметрам.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+from common.constants import COPPER_CONDUCTIVITY
+from common.designContext import DesignContext
+from common.stator import ACMachineStator
+from common.statorArmature import CoilArmature
+from common.steelRegistry import SteelRegistry
+from turbo.armatureInsulation import TurboMachineRotorInsulation
+from turbo.losses import Losses
+from turbo.magneticCircuit import LoadedMagneticCircuit, MagneticGeometry, NoLoadMagneticCircuit
+from turbo.mass import Mass
+from turbo.reactances import Reactances
+from turbo.rotor import TurboMachineRotor
+from turbo.rotorArmature import TurboMachineRotorArmature
+from turbo.shortCircuit import Currents, TimeConstants
+
+
+@dataclass
+class TurboGeneratorResult:
+    """
+    Класс данных, хранящий результаты расчёта турбогенератора. Каждое поле --- результат одноимённого этапа расчёта;
+    поля этапов, которые не потребовались для запрошенных результатов, равны ``None``.
+
+    Атрибуты:
+
+    * ``stator_armature: Optional[CoilArmature]``
+
+      Обмотка статора с подобранным проводником.
+
+    * ``stator: Optional[ACMachineStator]``
+
+      Статор с рассчитанной геометрией; у его обмотки рассчитаны число витков, сопротивление и плотность тока.
+
+    * ``stator_steel``, ``rotor_steel: Optional[Steel]``
+
+      Стали статора и ротора.
+
+    * ``rotor_armature: Optional[TurboMachineRotorArmature]``
+
+      Обмотка ротора.
+
+    * ``rotor: Optional[TurboMachineRotor]``
+
+      Ротор с рассчитанной геометрией; у его обмотки рассчитаны число витков и сопротивление.
+
+    * ``magnetic_geometry: Optional[MagneticGeometry]``
+
+      Геометрия магнитной цепи, общая для цепей холостого хода и под нагрузкой.
+
+    * ``no_load: Optional[NoLoadMagneticCircuit]``
+
+      Магнитная цепь холостого хода с рассчитанными токами ротора и намагничивания.
+
+    * ``no_load_characteristic: Optional[Tuple[np.ndarray, np.ndarray]]``
+
+      Характеристика холостого хода: токи ротора (А) и соответствующие им напряжения в долях номинального.
+
+    * ``stator_reaction: Optional[LoadedMagneticCircuit]``
+
+      Магнитная цепь под нагрузкой с рассчитанной реакцией статора.
+
+    * ``reactances: Optional[Reactances]``
+
+      Реактивные сопротивления.
+
+    * ``loaded: Optional[LoadedMagneticCircuit]``
+
+      Та же магнитная цепь под нагрузкой, рассчитанная полностью, вплоть до номинального тока возбуждения.
+
+    * ``mass: Optional[Mass]``
+
+      Массы активных частей.
+
+    * ``losses: Optional[Losses]``
+
+      Потери.
+
+    * ``time_constants: Optional[TimeConstants]``
+
+      Постоянные времени.
+
+    * ``currents: Optional[Currents]``
+
+      Токи короткого замыкания.
+    """
+
+    stator_armature: Optional[CoilArmature] = None
+    stator: Optional[ACMachineStator] = None
+    stator_steel: Any = None
+    rotor_steel: Any = None
+    rotor_armature: Optional[TurboMachineRotorArmature] = None
+    rotor: Optional[TurboMachineRotor] = None
+    magnetic_geometry: Optional[MagneticGeometry] = None
+    no_load: Optional[NoLoadMagneticCircuit] = None
+    no_load_characteristic: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    stator_reaction: Optional[LoadedMagneticCircuit] = None
+    reactances: Optional[Reactances] = None
+    loaded: Optional[LoadedMagneticCircuit] = None
+    mass: Optional[Mass] = None
+    losses: Optional[Losses] = None
+    time_constants: Optional[TimeConstants] = None
+    currents: Optional[Currents] = None
+
+
+class _RecordingParameters(Mapping):
+    """
+    Вспомогательный класс: представление параметров расчёта только для чтения, запоминающее, какие из параметров
+    были прочитаны. Через него этапы расчёта получают параметры, так что после выполнения этапа известно, от каких
+    параметров он на самом деле зависит.
+    """
+
+    __slots__ = ["__parameters", "reads"]
+
+    def __init__(self,
+                 parameters: Dict[str, Any]
+                 ) -> None:
+        self.__parameters = parameters
+        self.reads: Set[str] = set()
+
+    def __getitem__(self,
+                    name: str
+                    ) -> Any:
+        self.reads.add(name)
+        return self.__parameters[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__parameters)
+
+    def __len__(self) -> int:
+        return len(self.__parameters)
+
+
+# Этапы расчёта. Каждый получает параметры и результаты уже выполненных этапов и возвращает свой результат. Этапы,
+# дорабатывающие объекты предыдущих (например, ``loaded`` дорабатывает цепь из ``stator_reaction``), делают это
+# идемпотентно: повторный запуск даёт тот же результат
+
+
+def _stator_armature(p: Mapping[str, Any],
+                     r: Dict[str, Any]
+                     ) -> CoilArmature:
+    wire = p["wire_type"]()
+    insulation = p["insulation_type"](wire, p["voltage"], p["stator_effective_wires"] // 2)
+    armature = CoilArmature(p["rows"], p["columns"], p["slot_step"], p["parallel_branches"], insulation, wire)
+
+    armature.compute_coil_dimensions(p["stator_slot_height"], p["stator_slot_width"], p["stator_slit_height"],
+                                     p["stator_wedge_height"], p["arrangement_allowance"])
+    armature.set_wire(p["pressing"], p["stator_effective_wires"], p["wire_mode"])
+
+    return armature
+
+
+def _stator(p: Mapping[str, Any],
+            r: Dict[str, Any]
+            ) -> ACMachineStator:
+    armature = r["stator_armature"]
+    stator = ACMachineStator(p["stator_outer_diameter"], p["stator_inner_diameter"], p["stator_length"],
+                             p["stator_slot_count"], p["stator_slot_height"], p["stator_slot_width"],
+                             p["stator_slit_height"], p["stator_wedge_height"], p["stator_effective_wires"], armature,
+                             vent_channel_count=p["vent_channel_count"], vent_channel_width=p["vent_channel_width"],
+                             stud_count=p["stud_count"], stud_diameter=p["stud_diameter"],
+                             bypass_thickness=p["bypass_thickness"],
+                             pressure_plate_thickness=p["pressure_plate_thickness"],
+                             copper_screen_thickness=p["copper_screen_thickness"])
+
+    stator.compute_slots_per_pole_phase(p["pole_pairs"], p["phase_count"])
+    stator.compute_pole_pitch(p["pole_pairs"])
+    stator.compute_tooth_pitch()
+    stator.compute_effective_length(p["fill_factor"])
+
+    armature.compute_shortening(stator.slots_per_pole_phase, p["phase_count"])
+    armature.compute_turn_count(p["pole_pairs"], stator.slots_per_pole_phase, stator.effective_wires)
+    armature.compute_turn_length(stator.length, stator.inner_diameter, p["pole_pairs"])
+    armature.compute_resistance(p["conductivity"])
+    armature.compute_current_density(p["current"])
+    stator.compute_current_load(p["current"])
+
+    return stator
+
+
+def _steel(name: str) -> Callable[[Mapping[str, Any], Dict[str, Any]], Any]:
+    def stage(p: Mapping[str, Any],
+              r: Dict[str, Any]
+              ) -> Any:
+        # Сталь можно задать как объектом (или словарём сталей для статора), так и именем из реестра
+        steel = p[name]
+        return SteelRegistry().get(steel) if isinstance(steel, str) else steel
+
+    return stage
+
+
+def _rotor_armature(p: Mapping[str, Any],
+                    r: Dict[str, Any]
+                    ) -> TurboMachineRotorArmature:
+    insulation = TurboMachineRotorInsulation(p["rotor_turn_insulation"], p["rotor_body_insulation"],
+                                             p["rotor_wedge_filling"], p["rotor_bottom_filling"])
+    return TurboMachineRotorArmature(p["rotor_parallel_branches"], insulation, p["rotor_wire_height"],
+                                     p["rotor_wire_width"])
+
+
+def _rotor(p: Mapping[str, Any],
+           r: Dict[str, Any]
+           ) -> TurboMachineRotor:
+    armature = r["rotor_armature"]
+    rotor = TurboMachineRotor(p["air_gap"], p["stator_inner_diameter"], p["rotor_inner_diameter"], p["rotor_length"],
+                              p["rotor_slot_count"], p["rotor_slot_pitch_count"], p["rotor_slot_width"], armature,
+                              p["rotor_wedge_height"], p["rotor_wedge_width"], p["rotor_effective_wires"],
+                              effective_wires_small=p["rotor_effective_wires_small"],
+                              vert_vent_channel_pitch=p["vert_vent_channel_pitch"],
+                              vert_vent_channel_length=p["vert_vent_channel_length"],
+                              vert_vent_channel_width=p["vert_vent_channel_width"],
+                              subslot_channel_height=p["subslot_channel_height"],
+                              subslot_channel_width=p["subslot_channel_width"],
+                              big_tooth_slot_count=p["big_tooth_slot_count"],
+                              big_tooth_slot_width=p["big_tooth_slot_width"],
+                              tooth_slot_width=p["tooth_slot_width"],
+                              tooth_slot_height=p["tooth_slot_height"])
+
+    rotor.compute_slot_height()
+    rotor.compute_surface_relation(p["pole_pairs"])
+    rotor.compute_coils_per_pole(p["pole_pairs"])
+    rotor.compute_pole_pitch(p["pole_pairs"])
+    rotor.compute_tooth_pitch()
+
+    armature.compute_turn_count(rotor.effective_wires, rotor.effective_wires_small, rotor.coils_per_pole)
+    armature.compute_turn_length(rotor.length, rotor.outer_diameter, p["pole_pairs"])
+    armature.compute_resistance(p["conductivity"], rotor.length, rotor.outer_diameter, p["pole_pairs"],
+                                rotor.vert_vent_channel_length, rotor.vert_vent_channel_width,
+                                rotor.vert_vent_channel_pitch)
+
+    return rotor
+
+
+def _magnetic_geometry(p: Mapping[str, Any],
+                       r: Dict[str, Any]
+                       ) -> MagneticGeometry:
+    return MagneticGeometry.from_design(r["stator"], r["rotor"], p["pole_pairs"])
+
+
+def _no_load(p: Mapping[str, Any],
+             r: Dict[str, Any]
+             ) -> NoLoadMagneticCircuit:
+    stator, rotor = r["stator"], r["rotor"]
+    circuit = NoLoadMagneticCircuit(stator, rotor, r["stator_steel"], r["rotor_steel"], p["pole_pairs"],
+                                    p["fill_factor"], r["magnetic_geometry"])
+
+    circuit.compute_stator_flow(stator, p["voltage"], p["frequency"])
+    circuit.compute_stator_B_fields()
+    circuit.compute_stator_H_fields(rotor.surface_relation)
+    circuit.compute_stator_MMF()
+    circuit.compute_rotor_flow(rotor, p["bandaging"], stator.length)
+    circuit.compute_rotor_B_fields()
+    circuit.compute_rotor_H_fields(rotor.get_yoke_saturation_factor())
+    circuit.compute_rotor_MMF()
+    circuit.compute_rotor_currents(rotor.armature.turn_count)
+
+    return circuit
+
+
+def _no_load_characteristic(p: Mapping[str, Any],
+                            r: Dict[str, Any]
+                            ) -> Tuple[np.ndarray, np.ndarray]:
+    return r["no_load"].get_no_load_characteristic(r["rotor"], p["characteristic_points"],
+                                                   p["characteristic_max_level"])
+
+
+def _stator_reaction(p: Mapping[str, Any],
+                     r: Dict[str, Any]
+                     ) -> LoadedMagneticCircuit:
+    stator, rotor = r["stator"], r["rotor"]
+    circuit = LoadedMagneticCircuit(stator, rotor, r["stator_steel"], r["rotor_steel"], p["pole_pairs"],
+                                    p["fill_factor"], r["magnetic_geometry"])
+
+    circuit.compute_stator_reaction(p["current"], p["pole_pairs"], p["phase_count"], stator.armature.turn_count,
+                                    stator.get_armature_coefficient(), rotor.armature.turn_count,
+                                    rotor.get_armature_coefficient(p["pole_pairs"]))
+
+    return circuit
+
+
+def _reactances(p: Mapping[str, Any],
+                r: Dict[str, Any]
+                ) -> Reactances:
+    stator, rotor, no_load = r["stator"], r["rotor"], r["no_load"]
+    xs = Reactances(stator, p["current"], p["voltage"], p["frequency"], p["pole_pairs"], p["phase_count"])
+
+    xs.compute_x_ad(r["stator_reaction"].stator_reaction_current_reduced, no_load.magnetizing_current)
+    xs.compute_stator_armature_reactance(stator, rotor.air_gap, p["pole_pairs"])
+    xs.compute_x_d()
+    xs.compute_rotor_dissipation_factor(rotor, p["pole_pairs"], no_load.magnetizing_current, no_load.rotor_flow)
+    xs.compute_x_prime()
+    xs.compute_x_Potier(p["bandaging"])
+    xs.compute_total_reactance()
+    xs.compute_zero_sequence_reactance(stator, rotor.get_armature_coefficient(p["pole_pairs"]), p["pole_pairs"])
+    xs.compute_reverse_sequence_reactance()
+
+    return xs
+
+
+def _loaded(p: Mapping[str, Any],
+            r: Dict[str, Any]
+            ) -> LoadedMagneticCircuit:
+    stator, rotor, xs = r["stator"], r["rotor"], r["reactances"]
+    circuit = r["stator_reaction"]
+    cos_phi = p["power_factor"]
+    sin_phi = math.sqrt(1 - cos_phi ** 2)
+
+    circuit.compute_SC_current(xs.x_stator, r["no_load"].magnetizing_current)
+    circuit.compute_rotor_SC_MMF(rotor.armature.turn_count)
+    circuit.compute_EMF(cos_phi, sin_phi, xs.x_P)
+    circuit.compute_stator_flow(r["no_load"].stator_flow)
+    circuit.compute_stator_B_fields()
+    circuit.compute_stator_H_fields(rotor.surface_relation)
+    circuit.compute_stator_MMF()
+    if p["iterate_field_MMF"]:
+        circuit.compute_rotor_flow_iteratively(rotor, p["bandaging"], stator.length, sin_phi, xs.x_P,
+                                               p["field_MMF_tolerance"], p["field_MMF_max_iterations"])
+    else:
+        circuit.compute_rotor_flow(rotor, p["bandaging"], stator.length, sin_phi, xs.x_P)
+        circuit.compute_rotor_B_fields()
+        circuit.compute_rotor_H_fields(rotor.get_yoke_saturation_factor())
+        circuit.compute_rotor_MMF()
+    circuit.compute_field_current(rotor.armature.turn_count, sin_phi, xs.x_P)
+
+    rotor.armature.compute_current_density(circuit.nominal_field_current)
+    rotor.compute_current_load(circuit.nominal_field_current)
+
+    return circuit
+
+
+def _mass(p: Mapping[str, Any],
+          r: Dict[str, Any]
+          ) -> Mass:
+    mass = Mass()
+    mass.compute_stator_masses(r["stator"], p["phase_count"])
+    mass.compute_rotor_masses(r["rotor"], p["pole_pairs"])
+
+    return mass
+
+
+def _losses(p: Mapping[str, Any],
+            r: Dict[str, Any]
+            ) -> Losses:
+    stator, rotor, loaded, mass = r["stator"], r["rotor"], r["loaded"], r["mass"]
+    losses = Losses(r["stator_steel"], p["frequency"])
+    scr = loaded.get_SCR(r["no_load"].rotor_current)
+
+    losses.compute_stator_copper_losses(stator, p["current"], p["phase_count"], p["stator_temperature"])
+    losses.compute_SC_steel_losses(stator, rotor, loaded, mass, p["pole_pairs"])
+    losses.compute_OC_steel_losses(stator, rotor, r["no_load"], mass, p["pole_pairs"], p["k_x"], scr)
+    losses.compute_end_part_SC_losses(stator, rotor, loaded, p["pole_pairs"], p["end_part_divisions"])
+    losses.compute_end_part_OC_losses(scr)
+    losses.compute_excitation_losses(rotor, loaded, p["exciter_efficiency"], p["rotor_temperature"])
+    losses.compute_mechanical_losses(rotor, p["bandaging"], mass, p["shaft"], p["pole_pairs"], p["slot_rate"],
+                                     p["end_part_rate"], p["slot_velocity"], p["end_part_velocity"],
+                                     p["overheat_gen"], p["overheat_vent"])
+
+    return losses
+
+
+def _time_constants(p: Mapping[str, Any],
+                    r: Dict[str, Any]
+                    ) -> TimeConstants:
+    xs = r["reactances"]
+    time_constants = TimeConstants()
+
+    time_constants.compute_rotor_time_constants(r["rotor"], r["no_load"], xs, p["pole_pairs"], p["rotor_temperature"])
+    time_constants.compute_transients(xs)
+    time_constants.compute_super_transients(xs)
+    time_constants.compute_aperiodic(r["stator"], xs, p["frequency"], p["current"], p["voltage"],
+                                     p["stator_temperature"])
+
+    return time_constants
+
+
+def _currents(p: Mapping[str, Any],
+              r: Dict[str, Any]
+              ) -> Currents:
+    return Currents(r["reactances"], p["SC_voltage"], p["current"] / r["no_load"].magnetizing_current)
+
+
+class TurboGenerator:
+    """
+    Класс, выполняющий расчёт турбогенератора целиком. Знает граф зависимостей между этапами расчёта (обмотка статора,
+    статор, ротор, магнитные цепи, реактивные сопротивления, массы, потери, постоянные времени и токи КЗ) и выполняет
+    их в нужном порядке. Выполняются только этапы, от которых зависят запрошенные результаты: например, для
+    характеристики холостого хода не считаются ни потери, ни короткое замыкание.
+
+    Все этапы выполняются внутри ``DesignContext``, так что объекты разных экземпляров этого класса независимы друг
+    от друга.
+
+    Результаты этапов кэшируются, а для каждого этапа запоминается, какие параметры он прочитал. При изменении
+    параметров методом ``update`` пересчитываются лишь этапы, прочитавшие изменённые параметры, и этапы, зависящие от
+    них; остальные результаты берутся из кэша. Так, изменение воздушного зазора не приводит к повторному подбору
+    проводника статора, а изменение ширины вентиляционных каналов статора --- к пересчёту обмоток. Поскольку
+    результаты переиспользуются, объекты, возвращённые предыдущими вызовами ``run``, могут быть общими с последующими.
+
+    Пример использования::
+
+        generator = TurboGenerator(pole_pairs=1, voltage=10500, current=412, ...)
+        result = generator.run()  # Полный расчёт
+        curve = generator.run("no_load_characteristic").no_load_characteristic  # Возьмётся из кэша
+        generator.update(air_gap=45)
+        result = generator.run()  # Пересчитаются только этапы, зависящие от зазора
+
+    Атрибуты:
+
+    * ``parameters: Dict[str, Any]``
+
+      Параметры расчёта. Перечень параметров и значения по умолчанию для необязательных из них --- в ``DEFAULTS``;
+      параметры со значением по умолчанию ``REQUIRED`` обязательны. Изменять параметры следует только методом
+      ``update``, иначе кэш результатов об изменении не узнает.
+
+    Методы:
+
+    * ``get_order(*targets: str) -> List[str]``
+
+      Возвращает этапы, необходимые для получения запрошенных результатов, в порядке выполнения.
+
+    * ``run(*targets: str) -> TurboGeneratorResult``
+
+      Выполняет расчёт запрошенных результатов (по умолчанию --- всех).
+
+    * ``update(**changes: Any) -> None``
+
+      Изменяет параметры и сбрасывает результаты этапов, которые от них зависят.
+
+    * ``get_cached_stages() -> List[str]``
+
+      Возвращает этапы, результаты которых сейчас хранятся в кэше.
+
+    Этапы расчёта (они же поля ``TurboGeneratorResult``) и их зависимости перечислены в ``STAGES``.
+    """
+
+    __slots__ = ["parameters",
+                 "__results",
+                 "__reads"]
+
+    REQUIRED = object()
+
+    DEFAULTS: Dict[str, Any] = {
+        # Общие параметры
+        "pole_pairs": REQUIRED,
+        "phase_count": 3,
+        "frequency": 50,
+        "voltage": REQUIRED,
+        "current": REQUIRED,
+        "power_factor": REQUIRED,
+        "fill_factor": 0.95,
+        "conductivity": COPPER_CONDUCTIVITY,
+        # Расчётные температуры обмоток, °C (числа или массивы - тогда потери и постоянные времени тоже массивы)
+        "stator_temperature": 75,
+        "rotor_temperature": 75,
+        "stator_steel": REQUIRED,
+        "rotor_steel": REQUIRED,
+        # Статор
+        "stator_outer_diameter": REQUIRED,
+        "stator_inner_diameter": REQUIRED,
+        "stator_length": REQUIRED,
+        "stator_slot_count": REQUIRED,
+        "stator_slot_height": REQUIRED,
+        "stator_slot_width": REQUIRED,
+        "stator_slit_height": REQUIRED,
+        "stator_wedge_height": REQUIRED,
+        "stator_effective_wires": REQUIRED,
+        "vent_channel_count": None,
+        "vent_channel_width": None,
+        "stud_count": None,
+        "stud_diameter": None,
+        "bypass_thickness": None,
+        "pressure_plate_thickness": None,
+        "copper_screen_thickness": None,
+        # Обмотка статора
+        "rows": REQUIRED,
+        "columns": REQUIRED,
+        "slot_step": REQUIRED,
+        "parallel_branches": REQUIRED,
+        "wire_type": REQUIRED,
+        "insulation_type": REQUIRED,
+        "arrangement_allowance": REQUIRED,
+        "pressing": REQUIRED,
+        "wire_mode": "height",
+        # Ротор
+        "air_gap": REQUIRED,
+        "rotor_inner_diameter": REQUIRED,
+        "rotor_length": REQUIRED,
+        "rotor_slot_count": REQUIRED,
+        "rotor_slot_pitch_count": REQUIRED,
+        "rotor_slot_width": REQUIRED,
+        "rotor_wedge_height": REQUIRED,
+        "rotor_wedge_width": REQUIRED,
+        "rotor_effective_wires": REQUIRED,
+        "rotor_effective_wires_small": None,
+        "vert_vent_channel_pitch": None,
+        "vert_vent_channel_length": None,
+        "vert_vent_channel_width": None,
+        "subslot_channel_height": None,
+        "subslot_channel_width": None,
+        "big_tooth_slot_count": None,
+        "big_tooth_slot_width": None,
+        "tooth_slot_width": None,
+        "tooth_slot_height": None,
+        "bandaging": REQUIRED,
+        # Обмотка ротора
+        "rotor_parallel_branches": 1,
+        "rotor_turn_insulation": REQUIRED,
+        "rotor_body_insulation": REQUIRED,
+        "rotor_wedge_filling": REQUIRED,
+        "rotor_bottom_filling": REQUIRED,
+        "rotor_wire_height": REQUIRED,
+        "rotor_wire_width": REQUIRED,
+        # Характеристика холостого хода
+        "characteristic_points": 30,
+        "characteristic_max_level": 1.2,
+        # Расчёт под нагрузкой: итерации по МДС возбуждения (см. LoadedMagneticCircuit.compute_rotor_flow_iteratively)
+        "iterate_field_MMF": False,
+        "field_MMF_tolerance": 1e-8,
+        "field_MMF_max_iterations": 50,
+        # Потери
+        "k_x": 1.0,
+        "end_part_divisions": 4,
+        "exciter_efficiency": 0.9,
+        "shaft": REQUIRED,
+        "slot_rate": REQUIRED,
+        "end_part_rate": REQUIRED,
+        "slot_velocity": REQUIRED,
+        "end_part_velocity": REQUIRED,
+        "overheat_gen": REQUIRED,
+        "overheat_vent": REQUIRED,
+        # Короткое замыкание
+        "SC_voltage": 1.0,
+    }
+
+    # Этап: (функция, этапы, результаты которых ей нужны). Порядок перечисления значения не имеет
+    STAGES: Dict[str, Tuple[Callable[[Mapping[str, Any], Dict[str, Any]], Any], Tuple[str, ...]]] = {
+        "stator_armature": (_stator_armature, ()),
+        "stator": (_stator, ("stator_armature",)),
+        "stator_steel": (_steel("stator_steel"), ()),
+        "rotor_steel": (_steel("rotor_steel"), ()),
+        "rotor_armature": (_rotor_armature, ()),
+        "rotor": (_rotor, ("rotor_armature",)),
+        "magnetic_geometry": (_magnetic_geometry, ("stator", "rotor")),
+        "no_load": (_no_load, ("stator", "rotor", "stator_steel", "rotor_steel", "magnetic_geometry")),
+        "no_load_characteristic": (_no_load_characteristic, ("no_load", "rotor")),
+        "stator_reaction": (_stator_reaction, ("stator", "rotor", "stator_steel", "rotor_steel", "magnetic_geometry")),
+        "reactances": (_reactances, ("stator", "rotor", "no_load", "stator_reaction")),
+        "loaded": (_loaded, ("stator", "rotor", "no_load", "stator_reaction", "reactances")),
+        "mass": (_mass, ("stator", "rotor")),
+        "losses": (_losses, ("stator", "rotor", "stator_steel", "no_load", "loaded", "mass")),
+        "time_constants": (_time_constants, ("stator", "rotor", "no_load", "reactances")),
+        "currents": (_currents, ("no_load", "reactances")),
+    }
+
+    def __init__(self,
+                 **parameters: Any
+                 ) -> None:
+        """
+        :param parameters: Параметры расчёта, см. ``DEFAULTS``.
+        """
+
+        self.__check_names(parameters)
+
+        missing = [name for name, value in self.DEFAULTS.items()
+                   if value is self.REQUIRED and name not in parameters]
+        if missing:
+            raise ValueError(f"Не заданы параметры: {', '.join(missing)}")
+
+        self.parameters: Dict[str, Any] = {**self.DEFAULTS, **parameters}
+
+        self.__results: Dict[str, Any] = {}  # Кэш результатов этапов
+        self.__reads: Dict[str, Set[str]] = {}  # Параметры, прочитанные каждым из этапов в кэше
+
+    def __check_names(self,
+                      parameters: Mapping[str, Any]
+                      ) -> None:
+        unknown = [name for name in parameters if name not in self.DEFAULTS]
+        if unknown:
+            raise ValueError(f"Неизвестные параметры: {', '.join(unknown)}")
+
+    def get_order(self,
+                  *targets: str
+                  ) -> List[str]:
+        """
+        Метод, возвращающий этапы, необходимые для получения запрошенных результатов, в порядке выполнения (каждый
+        этап --- после всех, от которых он зависит).
+
+        :param targets: Имена запрошенных результатов (этапов). Если не заданы --- все.
+        :return: Список имён этапов.
+        """
+
+        order: List[str] = []
+
+        def visit(stage: str) -> None:
+            if stage not in self.STAGES:
+                raise ValueError(f"Неизвестный результат расчёта: {stage}")
+
+            if stage in order:
+                return
+
+            for dependency in self.STAGES[stage][1]:
+                visit(dependency)
+            order.append(stage)
+
+        for target in targets or self.STAGES:
+            visit(target)
+
+        return order
+
+    def run(self,
+            *targets: str
+            ) -> TurboGeneratorResult:
+        """
+        Метод, выполняющий расчёт запрошенных результатов и всех этапов, от которых они зависят. Этапы, результаты
+        которых есть в кэше, повторно не выполняются.
+
+        :param targets: Имена запрошенных результатов (полей ``TurboGeneratorResult``). Если не заданы --- выполняется
+            полный расчёт.
+        :return: Результаты расчёта. Поля невыполненных этапов равны ``None``.
+        """
+
+        order = self.get_order(*targets)
+
+        with DesignContext():
+            for stage in order:
+                if stage in self.__results:
+                    continue
+
+                parameters = _RecordingParameters(self.parameters)
+                self.__results[stage] = self.STAGES[stage][0](parameters, self.__results)
+                self.__reads[stage] = parameters.reads
+
+        return TurboGeneratorResult(**{stage: self.__results[stage] for stage in order})
+
+    def update(self,
+               **changes: Any
+               ) -> None:
+        """
+        Метод, изменяющий параметры расчёта. Из кэша удаляются результаты этапов, прочитавших хотя бы один из
+        изменённых параметров, и всех этапов, которые от них зависят (прямо или через другие этапы).
+
+        :param changes: Новые значения параметров, см. ``DEFAULTS``.
+        """
+
+        self.__check_names(changes)
+        self.parameters.update(changes)
+
+        stale = {stage for stage, reads in self.__reads.items() if not reads.isdisjoint(changes)}
+
+        # Порядок выполнения всех этапов топологический, так что одного прохода хватает и для косвенных зависимостей
+        for stage in self.get_order():
+            if any(dependency in stale for dependency in self.STAGES[stage][1]):
+                stale.add(stage)
+
+        for stage in stale:
+            self.__results.pop(stage, None)
+            self.__reads.pop(stage, None)
+
+    def get_cached_stages(self) -> List[str]:
+        """
+        Метод, возвращающий этапы, результаты которых сейчас хранятся в кэше.
+
+        :return: Список имён этапов в порядке их выполнения.
+        """
+
+        return [stage for stage in self.get_order() if stage in self.__results]
+
+
+__all__ = ["TurboGeneratorResult", "TurboGenerator"]